@@ -1,5 +1,20 @@
 """
 Python Module scrolltext
 """
-from .cursestext import work as cursesscroller  # noqa: F401
-from .linescroller import linescroller          # noqa: F401
+from importlib import import_module
+
+
+# the backends are imported on first use, thus e.g. 'scrolltext --version' imports neither
+# curses nor asyncio
+_LAZY_ATTRIBUTES = {"cursesscroller": (".cursestext", "work"),
+                    "linescroller": (".linescroller", "linescroller"),
+                    "async_linescroller": (".linescroller", "async_linescroller")}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = getattr(import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
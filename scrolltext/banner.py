@@ -0,0 +1,152 @@
+"""
+Banner mode: the scroll text is drawn in block letters of a built-in 5x7 bitmap font, several
+rows tall, and scrolled column by column.
+"""
+
+
+FONT_HEIGHT = 7
+GLYPH_SPACING = 1
+PIXEL = "█"
+UNKNOWN_GLYPH = "?"
+
+# column-major 5x7 font: 5 columns per glyph, bit 0 of a column is the top row
+FONT = {
+    " ": (0x00, 0x00, 0x00, 0x00, 0x00), "!": (0x00, 0x00, 0x5F, 0x00, 0x00),
+    '"': (0x00, 0x07, 0x00, 0x07, 0x00), "#": (0x14, 0x7F, 0x14, 0x7F, 0x14),
+    "$": (0x24, 0x2A, 0x7F, 0x2A, 0x12), "%": (0x23, 0x13, 0x08, 0x64, 0x62),
+    "&": (0x36, 0x49, 0x55, 0x22, 0x50), "'": (0x00, 0x05, 0x03, 0x00, 0x00),
+    "(": (0x00, 0x1C, 0x22, 0x41, 0x00), ")": (0x00, 0x41, 0x22, 0x1C, 0x00),
+    "*": (0x08, 0x2A, 0x1C, 0x2A, 0x08), "+": (0x08, 0x08, 0x3E, 0x08, 0x08),
+    ",": (0x00, 0x50, 0x30, 0x00, 0x00), "-": (0x08, 0x08, 0x08, 0x08, 0x08),
+    ".": (0x00, 0x60, 0x60, 0x00, 0x00), "/": (0x20, 0x10, 0x08, 0x04, 0x02),
+    "0": (0x3E, 0x51, 0x49, 0x45, 0x3E), "1": (0x00, 0x42, 0x7F, 0x40, 0x00),
+    "2": (0x42, 0x61, 0x51, 0x49, 0x46), "3": (0x21, 0x41, 0x45, 0x4B, 0x31),
+    "4": (0x18, 0x14, 0x12, 0x7F, 0x10), "5": (0x27, 0x45, 0x45, 0x45, 0x39),
+    "6": (0x3C, 0x4A, 0x49, 0x49, 0x30), "7": (0x01, 0x71, 0x09, 0x05, 0x03),
+    "8": (0x36, 0x49, 0x49, 0x49, 0x36), "9": (0x06, 0x49, 0x49, 0x29, 0x1E),
+    ":": (0x00, 0x36, 0x36, 0x00, 0x00), ";": (0x00, 0x56, 0x36, 0x00, 0x00),
+    "<": (0x08, 0x14, 0x22, 0x41, 0x00), "=": (0x14, 0x14, 0x14, 0x14, 0x14),
+    ">": (0x00, 0x41, 0x22, 0x14, 0x08), "?": (0x02, 0x01, 0x51, 0x09, 0x06),
+    "@": (0x32, 0x49, 0x79, 0x41, 0x3E), "A": (0x7E, 0x11, 0x11, 0x11, 0x7E),
+    "B": (0x7F, 0x49, 0x49, 0x49, 0x36), "C": (0x3E, 0x41, 0x41, 0x41, 0x22),
+    "D": (0x7F, 0x41, 0x41, 0x22, 0x1C), "E": (0x7F, 0x49, 0x49, 0x49, 0x41),
+    "F": (0x7F, 0x09, 0x09, 0x01, 0x01), "G": (0x3E, 0x41, 0x41, 0x51, 0x32),
+    "H": (0x7F, 0x08, 0x08, 0x08, 0x7F), "I": (0x00, 0x41, 0x7F, 0x41, 0x00),
+    "J": (0x20, 0x40, 0x41, 0x3F, 0x01), "K": (0x7F, 0x08, 0x14, 0x22, 0x41),
+    "L": (0x7F, 0x40, 0x40, 0x40, 0x40), "M": (0x7F, 0x02, 0x04, 0x02, 0x7F),
+    "N": (0x7F, 0x04, 0x08, 0x10, 0x7F), "O": (0x3E, 0x41, 0x41, 0x41, 0x3E),
+    "P": (0x7F, 0x09, 0x09, 0x09, 0x06), "Q": (0x3E, 0x41, 0x51, 0x21, 0x5E),
+    "R": (0x7F, 0x09, 0x19, 0x29, 0x46), "S": (0x46, 0x49, 0x49, 0x49, 0x31),
+    "T": (0x01, 0x01, 0x7F, 0x01, 0x01), "U": (0x3F, 0x40, 0x40, 0x40, 0x3F),
+    "V": (0x1F, 0x20, 0x40, 0x20, 0x1F), "W": (0x7F, 0x20, 0x18, 0x20, 0x7F),
+    "X": (0x63, 0x14, 0x08, 0x14, 0x63), "Y": (0x03, 0x04, 0x78, 0x04, 0x03),
+    "Z": (0x61, 0x51, 0x49, 0x45, 0x43), "[": (0x00, 0x7F, 0x41, 0x41, 0x00),
+    "\\": (0x02, 0x04, 0x08, 0x10, 0x20), "]": (0x00, 0x41, 0x41, 0x7F, 0x00),
+    "^": (0x04, 0x02, 0x01, 0x02, 0x04), "_": (0x40, 0x40, 0x40, 0x40, 0x40),
+    "`": (0x00, 0x01, 0x02, 0x04, 0x00), "a": (0x20, 0x54, 0x54, 0x54, 0x78),
+    "b": (0x7F, 0x48, 0x44, 0x44, 0x38), "c": (0x38, 0x44, 0x44, 0x44, 0x20),
+    "d": (0x38, 0x44, 0x44, 0x48, 0x7F), "e": (0x38, 0x54, 0x54, 0x54, 0x18),
+    "f": (0x08, 0x7E, 0x09, 0x01, 0x02), "g": (0x0C, 0x52, 0x52, 0x52, 0x3E),
+    "h": (0x7F, 0x08, 0x04, 0x04, 0x78), "i": (0x00, 0x44, 0x7D, 0x40, 0x00),
+    "j": (0x20, 0x40, 0x44, 0x3D, 0x00), "k": (0x7F, 0x10, 0x28, 0x44, 0x00),
+    "l": (0x00, 0x41, 0x7F, 0x40, 0x00), "m": (0x7C, 0x04, 0x18, 0x04, 0x78),
+    "n": (0x7C, 0x08, 0x04, 0x04, 0x78), "o": (0x38, 0x44, 0x44, 0x44, 0x38),
+    "p": (0x7C, 0x14, 0x14, 0x14, 0x08), "q": (0x08, 0x14, 0x14, 0x18, 0x7C),
+    "r": (0x7C, 0x08, 0x04, 0x04, 0x08), "s": (0x48, 0x54, 0x54, 0x54, 0x20),
+    "t": (0x04, 0x3F, 0x44, 0x40, 0x20), "u": (0x3C, 0x40, 0x40, 0x20, 0x7C),
+    "v": (0x1C, 0x20, 0x40, 0x20, 0x1C), "w": (0x3C, 0x40, 0x30, 0x40, 0x3C),
+    "x": (0x44, 0x28, 0x10, 0x28, 0x44), "y": (0x0C, 0x50, 0x50, 0x50, 0x3C),
+    "z": (0x44, 0x64, 0x54, 0x4C, 0x44), "{": (0x00, 0x08, 0x36, 0x41, 0x00),
+    "|": (0x00, 0x00, 0x7F, 0x00, 0x00), "}": (0x00, 0x41, 0x36, 0x08, 0x00),
+    "~": (0x08, 0x04, 0x08, 0x10, 0x08),
+}
+
+
+class BannerFont:  # pylint: disable=R0903  # disable (too-few-public-methods)
+    """
+    Rasterises the glyphs of the bitmap font. Every distinct character is rasterised once,
+    on first use: Its columns, followed by the blank spacing columns, are cut into one strip
+    per font row, thus a row of a frame is joined from cached strips.
+    """
+
+    def __init__(self, pixel=PIXEL, spacing=GLYPH_SPACING):
+        """
+        :param pixel: Character of a set pixel
+        :type pixel: str
+        :param spacing: Blank columns between two glyphs
+        :type spacing: int
+        """
+        self.pixel = pixel
+        self.spacing = spacing
+        self.height = FONT_HEIGHT
+        self.width = len(FONT[UNKNOWN_GLYPH]) + spacing  # columns per character
+        self._glyphs = {}  # character -> strip of every row
+
+    def glyph(self, character):
+        """
+        :returns: The rows of the character's glyph, each one width columns wide. Characters
+                  missing in the font are drawn as UNKNOWN_GLYPH.
+        :rtype: tuple
+        """
+        rows = self._glyphs.get(character)
+        if rows is None:
+            columns = FONT.get(character, FONT[UNKNOWN_GLYPH])
+            rows = tuple("".join(self.pixel if column >> row & 1 else " " for column in columns)
+                         + " " * self.spacing for row in range(self.height))
+            self._glyphs[character] = rows
+        return rows
+
+
+class BannerRow:
+    """
+    One row of a text drawn in block letters. It supports len() and slicing by columns, like
+    a str, thus CharacterScroller scrolls it like any other text. A slice only joins the
+    glyph strips of the characters it overlaps.
+    """
+
+    def __init__(self, text, row, font):
+        """
+        :param text: The scroll text
+        :type text: str
+        :param row: Font row, 0 is the top row
+        :type row: int
+        :type font: BannerFont
+        """
+        self.text = text
+        self.row = row
+        self.font = font
+
+    def __len__(self):
+        """
+        :returns: Number of columns
+        :rtype: int
+        """
+        return len(self.text) * self.font.width
+
+    def __str__(self):
+        return self[:]
+
+    def __getitem__(self, key):
+        """
+        Slices the row by columns.
+
+        :rtype: str
+        """
+        if not isinstance(key, slice):
+            raise TypeError("BannerRow only supports slicing")
+        start, stop, _ = key.indices(len(self))
+        if stop <= start:
+            return ""
+        width = self.font.width
+        first = start // width
+        strips = "".join(self.font.glyph(character)[self.row]
+                         for character in self.text[first:(stop - 1) // width + 1])
+        return strips[start - first * width:stop - first * width]
+
+
+def banner_rows(text, font):
+    """
+    :returns: A BannerRow for every font row
+    :rtype: list
+    """
+    return [BannerRow(text, row, font) for row in range(font.height)]
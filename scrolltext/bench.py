@@ -0,0 +1,203 @@
+"""
+Headless benchmark for CharacterScroller and the drawing paths of linescroller and cursestext.
+"""
+import configparser
+from functools import lru_cache
+from itertools import count
+import os
+import subprocess
+import sys
+import tracemalloc
+from time import perf_counter
+from scrolltext.config import DEF_SCROLL_TEXT
+from scrolltext.cursestext import DEFAULT_NUM_COLORS, GradientEngine, draw_frame
+from scrolltext.framecache import FrameCache
+from scrolltext.headless import HeadlessWindow, ScreenBuffer
+from scrolltext.linescroller import LineCompositor, _fit_to_line
+from scrolltext.output import FrameWriter
+from scrolltext.utils import CharacterScroller, TermSize
+
+
+DEFAULT_FRAMES = 2000
+DEFAULT_WIDTH = 80
+DEFAULT_TEXT_LENGTH = 1000
+FRAME_CACHE_BYTES = 64 * 1024 * 1024
+REPEAT = 3
+# modules imported by the actions, "cli" is the import of the help and version paths
+STARTUP_MODULES = [("cli", "scrolltext.cli"), ("linescroller", "scrolltext.linescroller"),
+                   ("cursestext", "scrolltext.cursestext"), ("server", "scrolltext.server"),
+                   ("bench", "scrolltext.bench")]
+IMPORT_TIMER = ("from time import perf_counter\nstart = perf_counter()\nimport {}\n"
+                "print(perf_counter() - start)")
+ROWS = 5
+# shared by the runs of the linescroller-cache benchmark: the first run fills the cache, the
+# following runs replay it, thus its peak memory does not include the cache
+_BENCH_FRAME_CACHE = FrameCache(FRAME_CACHE_BYTES)
+
+
+def bench(cfg):
+    """
+    Main entry point for the bench action. Runs every benchmark and prints the results. The
+    optional section "bench" configures the benchmark: frames, width, text_length and color.
+    :param cfg: Config object
+    :type: configparser.ConfigParser
+    """
+    options = cfg["bench"] if cfg.has_section("bench") else cfg["main"]
+    frames = options.getint("frames", DEFAULT_FRAMES)
+    width = options.getint("width", DEFAULT_WIDTH)
+    text_length = options.getint("text_length", DEFAULT_TEXT_LENGTH)
+    bench_cfg = create_bench_config(cfg, text_length, options.getboolean("color", False))
+
+    print(f"scrolltext bench: {frames} frames, {width} columns, text length {text_length}, "
+          f"color {bench_cfg['main']['color']}")
+    print(f"{'path':<20}{'frames/s':>12}{'bytes/frame':>14}{'peak memory':>16}")
+    for name, result in run_benchmarks(bench_cfg, frames, width):
+        print(f"{name:<20}{result['fps']:>12.1f}{result['bytes_per_frame']:>14.1f}"
+              f"{result['peak_memory'] / 1024:>12.1f} KiB")
+    print(f"\n{'startup':<20}{'import':>12}")
+    for name, elapsed in run_startup_benchmarks():
+        print(f"{name:<20}{elapsed * 1000:>9.1f} ms")
+
+
+def create_bench_config(cfg, text_length, color):
+    """
+    Creates a deterministic config: an endless text of the given length, which is scrolled
+    by one character per frame.
+    :rtype: configparser.ConfigParser
+    """
+    text = (DEF_SCROLL_TEXT * (text_length // len(DEF_SCROLL_TEXT) + 1))[:text_length]
+    bench_cfg = configparser.ConfigParser(default_section="main")
+    bench_cfg.read_dict({
+        "main": {"color": "1" if color else "0", "bold": cfg["main"].get("bold", "0"),
+                 "colortable": cfg["main"].get("colortable", "0"), "endless": "1"},
+        "cursestext": {"box": "1"},
+        "scrolltext.text 1": {"direction": "0", "text": text, "line": "1", "speed": "0"}
+    })
+    return bench_cfg
+
+
+def run_benchmarks(bench_cfg, frames, width):
+    """
+    :returns: Pairs of benchmark name and result dict with the keys fps, bytes_per_frame and
+              peak_memory
+    :rtype: list
+    """
+    benchmarks = [("scroller", _scroller_bench), ("linescroller", _linescroller_bench),
+                  ("linescroller-diff", _linescroller_diff_bench),
+                  ("linescroller-cache", _linescroller_cache_bench),
+                  ("linescroller-fd", _linescroller_fd_bench),
+                  ("cursestext", _cursestext_bench)]
+    results = []
+    for name, create in benchmarks:
+        elapsed = min(_measure(create(bench_cfg, width), frames)[0] for _ in range(REPEAT))
+        tracemalloc.start()
+        bytes_written = _measure(create(bench_cfg, width), frames)[1]
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results.append((name, {"fps": frames / elapsed if elapsed else 0.,
+                               "bytes_per_frame": bytes_written / frames,
+                               "peak_memory": peak_memory}))
+    return results
+
+
+def run_startup_benchmarks(repeat=REPEAT):
+    """
+    Imports the module of each action in a fresh interpreter, thus the time includes the
+    import of scrolltext and every dependency. The minimum of repeat runs is taken.
+    :returns: Pairs of action name and import time in seconds
+    :rtype: list
+    """
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [package_root, os.environ.get("PYTHONPATH")])))
+    results = []
+    for name, module in STARTUP_MODULES:
+        elapsed = min(float(subprocess.run([sys.executable, "-c", IMPORT_TIMER.format(module)],
+                                           capture_output=True, check=True, env=env,
+                                           text=True).stdout)
+                      for _ in range(repeat))
+        results.append((name, elapsed))
+    return results
+
+
+def _measure(bench_pair, frames):
+    """
+    Only the rendering is timed, the emulation of the screen is not.
+    :returns: Elapsed seconds and number of bytes written
+    """
+    render, screen = bench_pair
+    elapsed = 0.
+    for _ in range(frames):
+        start = perf_counter()
+        render()
+        elapsed += perf_counter() - start
+        _emulate(screen)
+    return elapsed, screen.bytes_written if screen else 0
+
+
+def _emulate(screen):
+    if isinstance(screen, ScreenBuffer):
+        screen.process()
+    elif isinstance(screen, HeadlessWindow):
+        screen.refresh()
+
+
+def _create_scroller(bench_cfg, term_size, min_scroll_line=0):
+    # "test" scrolls by one character per frame, independent of the time
+    return CharacterScroller(bench_cfg, term_size, test=True, min_scroll_line=min_scroll_line)
+
+
+def _scroller_bench(bench_cfg, width):
+    scroller = _create_scroller(bench_cfg, TermSize(width, ROWS))
+    return scroller.next, None
+
+
+def _linescroller_bench(bench_cfg, width, diff=False, cache=None, screen=None):
+    bench_cfg["main"]["diff"] = "1" if diff else "0"
+    term_size = TermSize(width, ROWS)
+    scroller = _create_scroller(bench_cfg, term_size)
+    screen = screen if screen is not None else ScreenBuffer(width, ROWS)
+    compositor = LineCompositor(bench_cfg, screen, cache=cache)
+    phases = count(0, 2)
+
+    def render():
+        text = _fit_to_line(scroller.next(), scroller.line, term_size)
+        compositor.render([(scroller.line + 1, text)], next(phases),
+                          [compositor.frames(scroller)])
+    return render, screen
+
+
+def _linescroller_diff_bench(bench_cfg, width):
+    return _linescroller_bench(bench_cfg, width, diff=True)
+
+
+def _linescroller_cache_bench(bench_cfg, width):
+    return _linescroller_bench(bench_cfg, width, cache=_BENCH_FRAME_CACHE)
+
+
+def _linescroller_fd_bench(bench_cfg, width):
+    """
+    Writes the frames to os.devnull with a FrameWriter, i.e. including the system calls.
+    """
+    return _linescroller_bench(bench_cfg, width, screen=FrameWriter(_devnull_fd()))
+
+
+@lru_cache(maxsize=None)
+def _devnull_fd():
+    return os.open(os.devnull, os.O_WRONLY)
+
+
+def _cursestext_bench(bench_cfg, width):
+    term_size = TermSize(width, ROWS)
+    scroller = _create_scroller(bench_cfg, term_size, min_scroll_line=1)
+    window = HeadlessWindow(width + 2, ROWS + 2)
+    gradients = {}
+    if bench_cfg["main"].getboolean("color"):
+        # curses.color_pair needs an initialized screen, the pair number is used instead
+        gradients = {scroller: GradientEngine(DEFAULT_NUM_COLORS, color_pair=int)}
+    phases = count()
+
+    def render():
+        draw_frame(window, [(scroller, scroller.next())], term_size, box=True,
+                   gradients=gradients, min_scroll_line=1, phase=next(phases))
+    return render, window
@@ -1,20 +1,49 @@
 """
 Main entry point for scrolltext
 """
+from importlib import import_module
 import sys
-from scrolltext import cursesscroller
-from scrolltext import linescroller
-from scrolltext.utils import init_utils
+from time import perf_counter
 
 
 HELP = """\
-scrolltext [-w|--write] action
+scrolltext [-w|--write] [-t|--timing] [-s|--source FILE] [-f|--fanout DEVICES] action
+scrolltext bench [--frames N] [--width N] [--length N] [--color 0|1]
+scrolltext server [--host HOST] [--port N] [--unix PATH] [--cols N] [--rows N]
 
     -w|--write  write initial config
 
+    -t|--timing print the startup time to stderr, i.e. the time spent loading
+                the config, and whether it was loaded from the config cache
+
+    -s|--source FILE
+                scroll the text read from FILE, a named pipe or '-' for stdin,
+                instead of the configured text, regular files are memory mapped
+
+    -f|--fanout DEVICES
+                linescroller renders each frame once and writes it to every
+                device of the comma separated list, e.g. /dev/pts/3,/dev/pts/4
+
     action      cursestext or linescroller
 
+    bench       measure frames/sec, bytes per frame and peak memory of the
+                scroller and the drawing paths, without a terminal
+
+    server      broadcast the frames of linescroller to viewers connecting via
+                TCP (default 127.0.0.1:8023, e.g. 'telnet localhost 8023') or
+                the Unix socket PATH, for terminals of --cols x --rows
+
 """
+BENCH_OPTIONS = {"--frames": "frames", "--width": "width", "--length": "text_length",
+                 "--color": "color"}
+SERVER_OPTIONS = {"--host": "host", "--port": "port", "--unix": "unix", "--cols": "cols",
+                  "--rows": "rows"}
+INTEGER_OPTIONS = ["--frames", "--width", "--length", "--color", "--port", "--cols", "--rows"]
+# the module of an action is only imported, when the action is run
+ACTIONS = {"cursestext": ("scrolltext.cursestext", "work"),
+           "linescroller": ("scrolltext.linescroller", "linescroller"),
+           "bench": ("scrolltext.bench", "bench"),
+           "server": ("scrolltext.server", "server")}
 VERSION = "scrolltext v0.0.11"  # possible improvement: use importlib metadata?
 
 
@@ -22,31 +51,75 @@ def main():
     """
     Main method.
     """
-    write_config, action = _parse_args()
+    write_config, timing, action, source, fanout, options = _parse_args()
     try:
-        cfg = init_utils(write_config)
-        action = action or _str_to_action_type(cfg["main"]["action"])
-        action(cfg)
+        start = perf_counter()
+        cfg = import_module("scrolltext.utils").init_utils(write_config)
+        if timing:
+            print(f"startup: config {(perf_counter() - start) * 1000:.3f} ms "
+                  f"({import_module('scrolltext.config').config_source})", file=sys.stderr)
+        if source:
+            cfg["scrolltext.text 1"]["source"] = source
+        if fanout:
+            cfg["main"]["fanout"] = fanout
+        cfg.read_dict(options)
+        _str_to_action_type(action or cfg["main"]["action"])(cfg)
     except KeyError as e:
         print("KeyError occurred: " + str(e) + "\nYou probably want to update 'scrolltextrc'.")
     except NameError as e:
         print("NameError occurred: " + str(e) + "\nYou probably want to update 'scrolltextrc'.")
+    except OSError as e:
+        print("OSError occurred: " + str(e) + "\nCheck the source of the text.", file=sys.stderr)
+        sys.exit(1)
 
 
 def _parse_args():  # pylint: disable=inconsistent-return-statements  (R1710)
     write_config = False
+    timing = False
     action = None
-    for arg in sys.argv[1:]:
+    source = None
+    fanout = None
+    options = {"bench": {}, "server": {}}
+    args = iter(sys.argv[1:])
+    for arg in args:
         if _check_help_or_version(arg):
             sys.exit(0)
 
         if arg in ["-w", "--write"]:
             write_config = True
-        elif "cursestext" == arg:
-            action = cursesscroller
-        elif "linescroller" == arg:
-            action = linescroller
-    return write_config, action
+        elif arg in ["-t", "--timing"]:
+            timing = True
+        elif arg in ["-s", "--source"]:
+            source = _option_value(arg, next(args, None))
+        elif arg in ["-f", "--fanout"]:
+            fanout = _option_value(arg, next(args, None))
+        elif arg in BENCH_OPTIONS:
+            options["bench"][BENCH_OPTIONS[arg]] = _option_value(arg, next(args, None))
+        elif arg in SERVER_OPTIONS:
+            options["server"][SERVER_OPTIONS[arg]] = _option_value(arg, next(args, None))
+        elif arg in ACTIONS:
+            action = arg
+    return write_config, timing, action, source, fanout, {name: values for name, values
+                                                          in options.items() if values}
+
+
+def _option_value(arg, value):
+    """
+    Exits with the usage message, when the value of an option is missing or not an integer.
+    :returns: The value
+    :rtype: str
+    """
+    valid = bool(value)
+    if valid and arg in INTEGER_OPTIONS:
+        try:
+            int(value)
+        except ValueError:
+            valid = False
+    if not valid:
+        kind = "an integer" if arg in INTEGER_OPTIONS else "a value"
+        print(f"{arg} needs {kind}\n\n{HELP}", file=sys.stderr)
+        sys.exit(2)
+    return value
 
 
 def _check_help_or_version(arg):
@@ -60,13 +133,10 @@ def _check_help_or_version(arg):
 
 
 def _str_to_action_type(action):
-    if "cursestext" == action:
-        action = cursesscroller
-    elif "linescroller" == action:
-        action = linescroller
-    else:
+    if action not in ACTIONS:
         raise RuntimeError("Unknown 'action' type")
-    return action
+    module_name, function_name = ACTIONS[action]
+    return getattr(import_module(module_name), function_name)
 
 
 if __name__ == "__main__":
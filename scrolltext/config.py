@@ -1,16 +1,24 @@
 """
 Config module for scrolltext
 """
+from os import getenv
 from pathlib import Path
 import configparser
+import json
+import os
 import sys
+from time import monotonic
 
 
 IS_WINDOWS = sys.platform in ["msys", "win32", "nt"]
 DEF_SCROLL_TEXT = """\
 Hello, this is a  classic side scrolling text. It can be configured via the 'scolltextrc' \
 config file. Find it in ~/.config/scrolltextrc or in the current working directory."""
+MAX_SCROLLTEXT_SECTIONS = 16
 SCROLL_SPEEDS = [.25, .20, .18, .15, .125, .1, .09, .08, .075, .07, .0675]
+CACHE_FORMAT = 2  # increase, when _validate changes the resulting config
+RELOAD_INTERVAL = 1.  # seconds between two checks of the config file for changes
+config_source = ""  # pylint: disable=C0103 (invalid-name)
 
 
 initial_config = {
@@ -44,31 +52,147 @@ def init_config(write_config):
     :param write_config: Write initial config
     :type: bool
     """
-    if not IS_WINDOWS:
-        config_path = Path("~/.config/scrolltextrc").expanduser()
-    else:
-        config_path = Path("scrolltextrc")
-
-    cfg, really_write = _read_config(config_path)
+    config_path = get_config_path()
+    cfg, really_write = _read_config(config_path, get_cache_path())
     if write_config and really_write:
         _write_config(cfg, config_path)
     return cfg
 
 
-def _read_config(config_path):
+def get_config_path():
+    """
+    :returns: Path of the config file, "~/.config/scrolltextrc", "scrolltextrc" in the current
+              directory on windows
+    :rtype: pathlib.Path
+    """
+    if IS_WINDOWS:
+        return Path("scrolltextrc")
+    return Path("~/.config/scrolltextrc").expanduser()
+
+
+def get_cache_path():
+    """
+    :returns: Path of the config cache, "scrolltext/config.json" in $XDG_CACHE_HOME or
+              ~/.cache, "scrolltextrc.cache" in the current directory on windows
+    :rtype: pathlib.Path
+    """
+    if IS_WINDOWS:
+        return Path("scrolltextrc.cache")
+    return Path(getenv("XDG_CACHE_HOME") or "~/.cache").expanduser() / "scrolltext" / "config.json"
+
+
+def _read_config(config_path, cache_path=None):
     """
-    Reads the config file and returns an object.
+    Reads the config file and returns an object. A validated config is taken from the cache,
+    when the config file did not change, i.e. has the same mtime and size.
     """
+    global config_source  # pylint: disable=W0603 (global-statement)
+    key = _cache_key(config_path)
+    cfg = _load_cached_config(cache_path, key)
+    if cfg is not None:
+        config_source = "cache"
+        return cfg, False
     really_write = False
     cfg = configparser.ConfigParser(default_section="main")
     successfully_read_files = cfg.read(config_path)
+    config_source = "file"
     if not successfully_read_files:
         really_write = True  # We only write a config file, when it does not already exist.
+        config_source = "default"
         cfg.update(initial_config)
     _validate(cfg)
+    if successfully_read_files:
+        _store_cached_config(cache_path, key, cfg)
     return cfg, really_write
 
 
+class ConfigWatcher:  # pylint: disable=R0903  # disable (too-few-public-methods)
+    """
+    Detects changes of the config file while a scroller runs. The mtime and size of the file
+    are polled at most once per interval, and the file is only read again, when they changed.
+    """
+
+    def __init__(self, config_path, interval=RELOAD_INTERVAL, cache_path=None):
+        """
+        :param config_path: The watched config file
+        :type config_path: pathlib.Path
+        :param interval: Minimum seconds between two checks
+        :type interval: float
+        :param cache_path: Config cache, which is updated with the reloaded config
+        :type cache_path: pathlib.Path
+        """
+        self.config_path = config_path
+        self.interval = interval
+        self.cache_path = cache_path
+        self._key = _cache_key(config_path)
+        self._next_check = monotonic() + interval
+
+    def poll(self):
+        """
+        :returns: The reloaded and validated config, None if the file did not change or is
+                  invalid, e.g. while it is being edited
+        :rtype: configparser.ConfigParser
+        """
+        now = monotonic()
+        if now < self._next_check:
+            return None
+        self._next_check = now + self.interval
+        key = _cache_key(self.config_path)
+        if key is None or key == self._key:
+            return None
+        self._key = key
+        try:
+            return _read_config(self.config_path, self.cache_path)[0]
+        except (configparser.Error, NameError):
+            return None
+
+
+def _cache_key(config_path):
+    try:
+        stat = os.stat(config_path)
+    except OSError:
+        return None
+    return [CACHE_FORMAT, os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size]
+
+
+def _load_cached_config(cache_path, key):
+    if cache_path is None or key is None:
+        return None
+    try:
+        with open(cache_path, encoding="utf-8") as cache_file:
+            cached = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    cfg = configparser.ConfigParser(default_section="main")
+    cfg.read_dict(cached["config"])
+    return cfg
+
+
+def _store_cached_config(cache_path, key, cfg):
+    """
+    Writes the validated config, atomically. The values are stored raw, i.e. without
+    interpolation, and options inherited from section main are left out.
+    """
+    if cache_path is None or key is None:
+        return
+    defaults = cfg.defaults()
+    sections = {"main": dict(defaults)}
+    for section in cfg.sections():
+        sections[section] = {option: value for option, value
+                             in cfg.items(section, raw=True)
+                             if option not in defaults or value != defaults[option]}
+    temp_path = Path(str(cache_path) + ".tmp")
+    try:
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as cache_file:
+            json.dump({"key": key, "config": sections}, cache_file)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass  # the cache is optional
+
+
 def _write_config(cfg, config_path):
     with open(config_path, "w", encoding="utf-8") as newfile:
         cfg.write(newfile)
@@ -85,17 +209,29 @@ def _validate(cfg):
             raise NameError("Section '" + section + "' is missing in config")
         _validate_section_entries(cfg, section, entries)
 
-    # NOTE: allow for several "scrolltext.text %d" sections
-    # for index in range(2, 9):
-    #     scrolltext_section = "scrolltext.text " + str(index)
-    #     if not scrolltext_section in cfg:
-    #         cfg["main"]["max_index"] = str(index - 1)
-    #         break
+    # allow for several "scrolltext.text %d" sections, all of them need the same entries
+    for index in get_section_indices(cfg)[1:]:
+        scrolltext_section = "scrolltext.text " + str(index)
+        _validate_section_entries(cfg, scrolltext_section, initial_config["scrolltext.text 1"])
+        _fix_scrolltext_section(cfg, scrolltext_section)
     _fix_scrolltext_section(cfg, "scrolltext.text 1")
     if "cursestext" not in cfg:
         cfg["cursestext"] = {"box": "1"}
 
 
+def get_section_indices(cfg):
+    """
+    :returns: The indices of all configured "scrolltext.text %d" sections, which are numbered
+              consecutively from 1
+    :rtype: range
+    """
+    max_index = 1
+    while (max_index < MAX_SCROLLTEXT_SECTIONS
+           and "scrolltext.text " + str(max_index + 1) in cfg):
+        max_index += 1
+    return range(1, max_index + 1)
+
+
 def _validate_section_entries(cfg, section, entries):
     for entry in entries:
         if entry not in cfg[section]:
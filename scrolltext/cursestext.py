@@ -2,17 +2,24 @@
 A simple curses-based side scrolling text application.
 """
 from curses import wrapper, error
+from math import ceil
 import curses
-from .utils import CharacterScroller, IS_WINDOWS, TermSize
+from .config import get_section_indices
+from .display import column_cells, cut_last_column, text_width
+from .scheduler import create_frame_scheduler, get_fps
+from .stats import create_frame_stats
+from .utils import IS_WINDOWS, TermSize, create_config_watcher, create_scroller, next_texts
+from .utils import reload_config, text_rows
 
 
 NUM_COLORS = 0
+DEFAULT_NUM_COLORS = 18
+# the gradient moves with time, at the speed of the former 100 ms frames
+COLOR_STEPS_PER_SECOND = 10
 QUIT_CHARACTERS = ["\x1B", "Q", "q"]
-START_INDEX = 2
-COLOR_UP = True
 
 
-def curses_scroller(win, cfg):
+def curses_scroller(win, cfg, stats):
     """
     Curses-main: render a text in a side-scrolling manner, using curses.
 
@@ -20,13 +27,14 @@ def curses_scroller(win, cfg):
     :type win: curses._window
     :param cfg: Config object
     :type: configparser.ConfigParser
+    :param stats: Frame timing instrumentation, see scrolltext.stats
     """
     global NUM_COLORS  # pylint: disable=W0603 (global-statement)
     if not IS_WINDOWS:
         curses.curs_set(0)  # Hide the cursor
     use_color = cfg["main"].getboolean("color", 0)
     if use_color and curses.has_colors():
-        NUM_COLORS = cfg["cursestext"].getint("num_colors", 18)
+        NUM_COLORS = cfg["cursestext"].getint("num_colors", DEFAULT_NUM_COLORS)
         NUM_COLORS = min(NUM_COLORS, curses.COLORS - 2)
         if curses.can_change_color():
             _init_colors()
@@ -35,31 +43,100 @@ def curses_scroller(win, cfg):
     update_term_size(win, cfg["cursestext"].getboolean("box"), term_size)
     argv = {}
     argv["min_scroll_line"] = 3
-    scroller = CharacterScroller(cfg, term_size, **argv)
+    scrollers = [create_scroller(cfg, term_size, section_index=index, **argv)
+                 for index in get_section_indices(cfg)]
     draw_items(win, cfg["cursestext"].getboolean("box"),
-               argv["min_scroll_line"], scroller, term_size)
+               argv["min_scroll_line"], scrollers[0], term_size)
 
-    win.timeout(100)
     try:
-        do_textloop(win, cfg, term_size, scroller, argv["min_scroll_line"])
+        do_textloop(win, cfg, term_size, scrollers, min_scroll_line=argv["min_scroll_line"],
+                    stats=stats)
     except KeyboardInterrupt:
         pass
 
 
-def do_textloop(win, cfg, term_size, scroller, min_scroll_line):
+# pylint: disable=too-many-arguments (R0913)
+def do_textloop(win, cfg, term_size, scrollers, *, min_scroll_line, stats):
     """
-    This method loops over the scrolled text
+    This method loops over the scrolled texts. All scrollers are advanced and drawn, before
+    the window is refreshed once per tick. The loop ends, when every scroller has finished.
+    Changes of the config file are applied to the running scrollers.
     """
     box = cfg["cursestext"].getboolean("box")
-    for text in scroller:
-        win_text = text
-        # hack: When writing to the last line we prevent adding an immediate newline and thus
-        #       moving the text upwards, by removing the last character of the visibile text.
-        if not box and scroller.line == term_size.get_rows():
-            win_text = text[:-1]
-        _draw_text(win, cfg, scroller, box, win_text, min_scroll_line)
-        if _check_quit(win, box, term_size, min_scroll_line, scroller):
+    gradients = {}
+    if _use_colors(cfg):
+        gradients = {scroller: GradientEngine(NUM_COLORS) for scroller in scrollers}
+    scheduler = create_frame_scheduler(cfg)
+    watcher = create_config_watcher(cfg)
+    active = list(scrollers)
+    stats.next_frame()
+    while active:
+        texts = next_texts(active)
+        stats.mark("next")
+        draw_frame(win, texts, term_size, box=box, gradients=gradients,
+                   min_scroll_line=min_scroll_line, phase=_color_phase(scheduler))
+        curses.doupdate()
+        stats.mark("draw")
+        if _wait_for_next_frame(win, scheduler, box, term_size, min_scroll_line, scrollers[0]):
             return
+        stats.mark("wait")
+        reload_config(watcher, active)
+        for scroller, _ in texts:
+            stats.position(id(scroller), scroller.pos - scroller.shifted)
+        stats.next_frame()
+
+
+# pylint: disable=too-many-arguments (R0913)
+def draw_frame(win, texts, term_size, *, box, gradients, min_scroll_line, phase=0):
+    """
+    Draws the visible texts of all scrollers into the virtual screen. The caller updates the
+    physical screen with curses.doupdate, which only outputs the changed cells.
+    :param texts: Pairs of scroller and its visible text
+    :type texts: list
+    :param gradients: GradientEngine per scroller, scrollers without one are not colored
+    :type gradients: dict
+    :param phase: Color phase of the frame, see GradientEngine.attrs
+    :type phase: int
+    """
+    for scroller, text in texts:
+        gradient = gradients.get(scroller)
+        for line, win_text in text_rows(scroller, text):
+            # hack: When writing to the last line we prevent adding an immediate newline and
+            #       thus moving the text upwards, by removing the last character of the
+            #       visibile text.
+            if not box and line == term_size.get_rows():
+                win_text = cut_last_column(win_text)
+            attrs = None
+            if gradient:
+                win_text = column_cells(win_text)
+                # all rows of a scroller use the same colors
+                attrs = gradient.attrs(len(win_text), phase)
+            _draw_text(win, attrs, line, box, win_text, min_scroll_line)
+    win.noutrefresh()
+
+
+def _color_phase(scheduler):
+    """
+    The color animation advances with time, not with frames, thus its speed does not depend
+    on the frame rate.
+    """
+    return int(scheduler.frames * scheduler.period * COLOR_STEPS_PER_SECOND)
+
+
+def _wait_for_next_frame(win, scheduler, *args):
+    """
+    Handles keypresses until the next frame is due.
+    :returns: True, if a quit character was entered
+    :rtype: bool
+    """
+    while True:
+        win.timeout(ceil(scheduler.remaining() * 1000))
+        if _check_quit(win, *args):
+            return True
+        if scheduler.remaining() <= 0:
+            break
+    scheduler.advance()
+    return False
 
 
 def add_quit_text(win, box, line, term_size):
@@ -120,37 +197,72 @@ def _addstr_wrapper(win, row, column, text):
         pass
 
 
-def _addstr_with_colors_wrapper(win, row, column, text, /, *args):
-    global START_INDEX, COLOR_UP  # pylint: disable=W0603 (global-statement)
-    color_index = START_INDEX
-
+def _addstr_with_colors_wrapper(win, row, column, cells, attrs):
     try:
         pos = column
-        count_up = True
-        for character in text:
-            win.addstr(row, pos, character, curses.color_pair(color_index), *args)
-            pos += 1
-            if count_up:
-                color_index += 1
-                if color_index >= NUM_COLORS - 1:
-                    count_up = False
-            else:
-                color_index -= 1
-                if color_index <= 2:
-                    count_up = True
+        for run, attr in color_runs(cells, attrs):
+            win.addstr(row, pos, run, attr)
+            pos += text_width(run)
     except curses.error:
         pass
 
-    if COLOR_UP:
-        START_INDEX += 1
-        if START_INDEX == NUM_COLORS + 1:
-            COLOR_UP = False
-            START_INDEX = NUM_COLORS
-    else:
-        START_INDEX -= 1
-        if START_INDEX == 1:
-            COLOR_UP = True
-            START_INDEX = 2
+
+class GradientEngine:  # pylint: disable=R0903  # disable (too-few-public-methods)
+    """
+    The color animation of one scroller. The triangle wave of the gradient's color pairs,
+    2, 3, ..., n + 1, n, ..., 3, is built once. Each frame draws a rotation of it, which
+    moves by one color pair per color phase.
+    """
+    def __init__(self, num_colors, color_pair=None):
+        """
+        :param num_colors: Number of color pairs of the gradient, starting with pair 2
+        :type num_colors: int
+        :param color_pair: Maps a color pair number to its attribute, defaults to
+                           curses.color_pair
+        :type color_pair: callable
+        """
+        color_pair = color_pair if color_pair is not None else curses.color_pair
+        pairs = list(range(2, max(num_colors, 1) + 2))
+        self.table = [color_pair(pair) for pair in pairs + pairs[-2:0:-1]]
+        self._wave = list(self.table)
+
+    def attrs(self, length, phase):
+        """
+        :param length: Number of characters
+        :type length: int
+        :param phase: Color phase, the gradient is rotated by one color pair per phase
+        :type phase: int
+        :returns: Attributes of length characters
+        :rtype: list
+        """
+        start = phase % len(self.table)
+        while len(self._wave) < start + length:
+            self._wave += self.table
+        return self._wave[start:start + length]
+
+
+def color_runs(text, attrs):
+    """
+    Groups consecutive characters of the same attribute into runs, thus each run needs a
+    single addstr call. Blanks look the same in every color pair, the background is always
+    black, thus they join any run.
+    :param text: The characters, or the columns, see scrolltext.display.column_cells. The
+                 empty second column of a wide character joins the run of the character.
+    :param attrs: Attribute of each character
+    :type attrs: list
+    :returns: Pairs of text run and attribute
+    :rtype: list
+    """
+    runs = []
+    for character, attr in zip(text, attrs):
+        joins = character in (" ", "")
+        if runs and (joins or runs[-1][1] in (None, attr)):
+            runs[-1][0].append(character)
+            if runs[-1][1] is None and not joins:
+                runs[-1][1] = attr
+        else:
+            runs.append([[character], None if joins else attr])
+    return [("".join(run), attrs[0] if attr is None else attr) for run, attr in runs]
 
 
 def _check_quit(win, box, term_size, min_scroll_line, scroller):
@@ -164,14 +276,17 @@ def _check_quit(win, box, term_size, min_scroll_line, scroller):
 
 
 # pylint: disable=too-many-arguments (R0913)
-def _draw_text(win, cfg, scroller, box, win_text, min_scroll_line):
-    if scroller.line >= min_scroll_line:
-        if (cfg["main"].getboolean("color", 0) and
-           curses.has_colors() and curses.can_change_color()):
-            _addstr_with_colors_wrapper(win, scroller.line, (1 if box else 0), win_text)
+def _draw_text(win, attrs, line, box, win_text, min_scroll_line):
+    if line >= min_scroll_line:
+        if attrs is not None:
+            _addstr_with_colors_wrapper(win, line, (1 if box else 0), win_text, attrs)
         else:
-            _addstr_wrapper(win, scroller.line, (1 if box else 0), win_text)
-        win.redrawwin()
+            _addstr_wrapper(win, line, (1 if box else 0), win_text)
+
+
+def _use_colors(cfg):
+    return (cfg["main"].getboolean("color", 0) and
+            curses.has_colors() and curses.can_change_color())
 
 
 def _init_colors():
@@ -187,7 +302,9 @@ def _init_colors():
 def work(cfg):
     """Main uses curses.wrapper. See curses doc for details.
     """
+    stats = create_frame_stats(cfg, 1. / get_fps(cfg))
     try:  # noqa: C901 ignoring 'TryExcept 42' is too complex - fix later
-        wrapper(curses_scroller, cfg)
+        wrapper(curses_scroller, cfg, stats)
     except error:
         pass
+    stats.print_summary()
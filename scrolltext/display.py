@@ -0,0 +1,141 @@
+"""
+Display widths of scroll texts: wide characters (e.g. CJK) take two terminal columns,
+combining marks none.
+"""
+from bisect import bisect_left
+from itertools import accumulate
+import unicodedata
+
+
+def char_width(character):
+    """
+    :returns: Number of terminal columns of character, 0, 1 or 2
+    :rtype: int
+    """
+    if unicodedata.combining(character) or unicodedata.category(character) in ("Me", "Cf"):
+        return 0
+    if unicodedata.east_asian_width(character) in ("W", "F"):
+        return 2
+    return 1
+
+
+def display_text(text):
+    """
+    :param text: The scroll text
+    :type text: str
+    :returns: text itself, when every character takes exactly one column, a DisplayText
+              otherwise
+    """
+    if text.isascii():
+        return text
+    widths = [char_width(character) for character in text]
+    if all(width == 1 for width in widths):
+        return text
+    return DisplayText(text, widths)
+
+
+class DisplayText:
+    """
+    A scroll text, which is indexed by terminal columns instead of characters. It supports
+    len() and slicing, like a str, thus CharacterScroller uses it instead of the text. The
+    columns of all characters are computed once, as prefix sums of their widths, then slice
+    boundaries are found with a binary search.
+
+    Slices always span exactly the requested number of columns: A wide character, which is
+    cut by a slice boundary, is replaced with blanks. Combining marks stay with their base
+    character.
+    """
+
+    def __init__(self, text, widths=None):
+        """
+        :param text: The scroll text
+        :type text: str
+        :param widths: Width of every character, computed when not given
+        :type widths: list
+        """
+        self.text = text
+        self.widths = widths if widths is not None else [char_width(char) for char in text]
+        self.offsets = list(accumulate(self.widths, initial=0))  # column of every character
+
+    def __len__(self):
+        """
+        :returns: Number of columns
+        :rtype: int
+        """
+        return self.offsets[-1]
+
+    def __str__(self):
+        return self.text
+
+    def __getitem__(self, key):
+        """
+        Slices the text by columns.
+
+        :rtype: str
+        """
+        if not isinstance(key, slice):
+            raise TypeError("DisplayText only supports slicing")
+        start, stop, _ = key.indices(len(self))
+        if stop <= start:
+            return ""
+        offsets = self.offsets
+        first = bisect_left(offsets, start, hi=len(self.text))
+        while first < len(self.text) and self.widths[first] == 0:
+            first += 1  # combining marks of a character left of the slice
+        end = bisect_left(offsets, stop, lo=first, hi=len(self.text))
+        while end < len(self.text) and self.widths[end] == 0:
+            end += 1
+        while end > first and offsets[end] > stop:
+            end -= 1  # a wide character cut by the end of the slice
+        leading = min(offsets[first], stop) - start
+        body_columns = offsets[end] - offsets[first] if end > first else 0
+        return (" " * leading + self.text[first:end]
+                + " " * (stop - start - leading - body_columns))
+
+
+def column_cells(text):
+    """
+    Splits a text into terminal columns: A character takes one column together with its
+    combining marks, a wide character takes two, the second one is an empty str.
+    :returns: One str per column
+    :rtype: list
+    """
+    if text.isascii():
+        return list(text)
+    cells = []
+    for character in text:
+        width = char_width(character)
+        if width == 0 and cells:
+            base = len(cells) - 1 if cells[-1] else len(cells) - 2
+            cells[base] += character
+        else:
+            cells.append(character)
+            if width == 2:
+                cells.append("")
+    return cells
+
+
+def text_width(text):
+    """
+    :returns: Number of terminal columns of text
+    :rtype: int
+    """
+    if text.isascii():
+        return len(text)
+    return sum(char_width(character) for character in text)
+
+
+def cut_last_column(text):
+    """
+    :returns: The text without its last terminal column. Combining marks are removed with
+              their base character, a wide character is replaced with a blank.
+    :rtype: str
+    """
+    if text.isascii():
+        return text[:-1]
+    cells = column_cells(text)
+    if cells and cells[-1] == "":
+        cells[-2:] = [" "]
+    else:
+        cells = cells[:-1]
+    return "".join(cells)
@@ -0,0 +1,122 @@
+"""
+Fan-out of the rendered frames to several terminal devices, e.g. a wall of terminals showing
+the same ticker, driven by a single process.
+"""
+from collections import deque
+import os
+
+
+MAX_PENDING = 64 * 1024
+
+
+def create_fanout_writer(cfg):
+    """
+    :param cfg: Config object, uses the option "fanout" in section main: a comma separated
+                list of terminal devices, e.g. "/dev/pts/3, /dev/pts/4"
+    :type: configparser.ConfigParser
+    :returns: A FanoutWriter, or None when no devices are configured
+    """
+    paths = [path.strip() for path in cfg["main"].get("fanout", "").split(",") if path.strip()]
+    if not paths:
+        return None
+    return FanoutWriter([open_device(path) for path in paths])
+
+
+def open_device(path):
+    """
+    Opens a terminal device for non-blocking writes, without making it the controlling
+    terminal.
+    :returns: File descriptor
+    :rtype: int
+    """
+    return os.open(path, os.O_WRONLY | os.O_NOCTTY | os.O_NONBLOCK)
+
+
+class FanoutWriter:
+    """
+    A text stream, which encodes every frame once and writes the same bytes to several file
+    descriptors. The descriptors are non-blocking: Bytes a slow device does not accept are
+    kept and written with the next flush, thus one device never stalls the others. When the
+    pending bytes of a device exceed max_pending, its oldest pending frames are dropped, a
+    frame written partially is always completed. Devices failing with an error are closed
+    and removed.
+    """
+
+    def __init__(self, fds, max_pending=MAX_PENDING):
+        """
+        :param fds: File descriptors opened for non-blocking writes, see open_device
+        :type fds: list
+        :param max_pending: Maximum number of pending bytes per device
+        :type max_pending: int
+        """
+        self.max_pending = max_pending
+        self._pending = {fd: deque() for fd in fds}  # fd -> frames not written completely
+        self._frame = []
+        self.dropped_frames = 0
+
+    @property
+    def fds(self):
+        """
+        :returns: File descriptors of the devices still written to
+        :rtype: list
+        """
+        return list(self._pending)
+
+    def write(self, text):
+        """
+        Text stream interface, the text is written with the next flush.
+        :returns: Number of characters written
+        :rtype: int
+        """
+        self._frame.append(text)
+        return len(text)
+
+    def flush(self):
+        """
+        Encodes the text written since the previous flush as one frame and writes it, and all
+        pending frames, to every device, as far as the devices accept them.
+        """
+        if self._frame:
+            data = "".join(self._frame).encode("utf-8")
+            self._frame = []
+            for frames in self._pending.values():
+                frames.append(data)
+        for fd in list(self._pending):
+            self._write_pending(fd)
+
+    def close(self):
+        """
+        Closes all devices, pending frames are discarded.
+        """
+        for fd in list(self._pending):
+            self._remove(fd)
+
+    def _write_pending(self, fd):
+        frames = self._pending[fd]
+        try:
+            while frames:
+                written = os.write(fd, frames[0])
+                if written < len(frames[0]):
+                    frames[0] = frames[0][written:]
+                    break
+                frames.popleft()
+        except BlockingIOError:
+            pass
+        except OSError:  # e.g. the terminal was closed
+            self._remove(fd)
+            return
+        self._drop_frames(frames)
+
+    def _drop_frames(self, frames):
+        pending = sum(len(frame) for frame in frames)
+        while len(frames) > 2 and pending > self.max_pending:
+            pending -= len(frames[1])
+            del frames[1]
+            self.dropped_frames += 1
+
+    def _remove(self, fd):
+        del self._pending[fd]
+        try:
+            os.close(fd)
+        except OSError:
+            pass
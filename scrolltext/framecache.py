@@ -0,0 +1,198 @@
+"""
+Cache of rendered frames: For a fixed text, width, direction and color table the frames of a
+scroller repeat in a cycle, thus the cycle is rendered once and its frames are replayed
+afterwards.
+"""
+from collections import OrderedDict
+
+
+def create_frame_cache(cfg):
+    """
+    :param cfg: Config object, uses the option "frame_cache" in section main, the memory cap
+                in MiB, 0 disables the cache
+    :type: configparser.ConfigParser
+    :returns: A FrameCache, or None when disabled
+    """
+    max_mib = cfg["main"].getfloat("frame_cache", 0.)
+    if max_mib <= 0:
+        return None
+    return FrameCache(int(max_mib * 1024 * 1024))
+
+
+class FrameCache:
+    """
+    Rendered frames of several messages, a message being a scroll text scrolled with a given
+    width and direction and rendered with given colors. The frames of a message are kept in
+    a CycleFrames.
+
+    The memory use is capped by reserving the size of the whole cycle per message. Least
+    recently used messages are evicted to make room for a new one. A message, whose cycle
+    alone exceeds the cap, is not cached, i.e. its frames are rendered live.
+    """
+
+    def __init__(self, max_bytes):
+        """
+        :param max_bytes: Memory cap
+        :type max_bytes: int
+        """
+        self.max_bytes = max_bytes
+        self.reserved = 0
+        self.hits = 0
+        self.misses = 0
+        self._messages = OrderedDict()  # message key -> (reserved bytes, frames)
+
+    def __len__(self):
+        """
+        :returns: Number of cached messages
+        :rtype: int
+        """
+        return len(self._messages)
+
+    def frames(self, key, size, build):
+        """
+        :param key: Identifies the message
+        :param size: Called for a new message, returns the bytes of its cycle
+        :type size: callable
+        :param build: Called for a new message, which fits into the cache, returns its
+                      frames
+        :type build: callable
+        :returns: The frames of the message, None when its cycle is too large
+        :rtype: CycleFrames
+        """
+        entry = self._messages.get(key)
+        if entry is not None:
+            self._messages.move_to_end(key)
+            return entry[1]
+        cycle_bytes = size()
+        if cycle_bytes > self.max_bytes:
+            return None
+        while self.reserved + cycle_bytes > self.max_bytes:
+            evicted_bytes, _ = self._messages.popitem(last=False)[1]
+            self.reserved -= evicted_bytes
+        self._messages[key] = (cycle_bytes, build())
+        self.reserved += cycle_bytes
+        return self._messages[key][1]
+
+    # pylint: disable=too-many-arguments (R0913)
+    def get(self, frames, start, length, phase, render):
+        """
+        :param frames: Frames of a message, see frames, or None for live rendering
+        :type frames: CycleFrames
+        :param start: Virtual column of the visible text
+        :type start: int
+        :param length: Columns of the visible text
+        :type length: int
+        :param phase: The color phase
+        :type phase: int
+        :param render: Renders the frame, when it is not part of the cycle
+        :type render: callable
+        :returns: The rendered frame
+        :rtype: str
+        """
+        if frames is None:
+            return render()
+        frame = frames.frame(start, length, phase)
+        if frame is None:
+            self.misses += 1
+            return render()
+        self.hits += 1
+        return frame
+
+
+class CycleFrames:
+    """
+    The colored frames of one cycle of a message. A frame colors the columns of the visible
+    text with the color table, starting at the color phase. Thus all frames are slices of
+    the virtual text of the cycle, colored with the color table rotated by the phase minus
+    the start column. The virtual text is colored once per rotation, on first use, and the
+    frames are sliced from these strs.
+    """
+
+    def __init__(self, text, start, prefixes):
+        """
+        :param text: The virtual text of the cycle, one character per column
+        :type text: str
+        :param start: Virtual column of the first character
+        :type start: int
+        :param prefixes: The color escapes of the color table
+        :type prefixes: list
+        """
+        self.text = text
+        self.start = start
+        self.prefixes = prefixes
+        self.size = len(prefixes)
+        self._colored = [None] * self.size  # the colored text per rotation
+        self.pending = set()  # rotations, which are built elsewhere, see install
+        # characters of the colored text before each column of the first color cycle
+        self._offsets = []
+        for rotation in range(self.size):
+            offsets = [0]
+            for index in range(self.size):
+                offsets.append(offsets[-1] + len(prefixes[(rotation + index) % self.size]) + 1)
+            self._offsets.append(offsets)
+
+    @staticmethod
+    def size_of(length, prefixes, ascii_text=True):
+        """
+        :param length: Columns of the cycle
+        :type length: int
+        :param prefixes: The color escapes of the color table
+        :type prefixes: list
+        :param ascii_text: False, if the text has non-ASCII characters, which take up to four
+                           bytes each
+        :type ascii_text: bool
+        :returns: Bytes of the colored texts of all rotations
+        :rtype: int
+        """
+        cycle_chars = sum(len(prefix) for prefix in prefixes) + len(prefixes)
+        return length * cycle_chars * (1 if ascii_text else 4)
+
+    def install(self, rotation, colored):
+        """
+        Sets a rotation, which was built elsewhere, e.g. by scrolltext.prerender.
+        :type rotation: int
+        :param colored: See color_cycle
+        :type colored: str
+        """
+        self._colored[rotation] = colored
+        self.pending.discard(rotation)
+
+    def frame(self, start, length, phase):
+        """
+        :param start: Virtual column of the visible text
+        :type start: int
+        :param length: Columns of the visible text
+        :type length: int
+        :param phase: The color phase
+        :type phase: int
+        :returns: The colored visible text, None if it is not part of the cycle or its
+                  rotation is still pending
+        :rtype: str
+        """
+        column = start - self.start
+        if column < 0 or column + length > len(self.text):
+            return None
+        rotation = (phase - column) % self.size
+        colored = self._colored[rotation]
+        if colored is None:
+            if rotation in self.pending:
+                return None
+            colored = self._colored[rotation] = color_cycle(self.text, self.prefixes, rotation)
+        offsets = self._offsets[rotation]
+        cycle_chars = offsets[-1]
+        end = column + length
+        return colored[column // self.size * cycle_chars + offsets[column % self.size]:
+                       end // self.size * cycle_chars + offsets[end % self.size]]
+
+
+def color_cycle(text, prefixes, rotation):
+    """
+    :returns: The text with the color escape prefixes[(rotation + index) % len(prefixes)] in
+              front of the character at every index
+    :rtype: str
+    """
+    pattern = prefixes * (len(text) // len(prefixes) + 2)
+    template = [""] * (2 * len(text))
+    template[0::2] = pattern[rotation:rotation + len(text)]
+    template[1::2] = text
+    return "".join(template)
@@ -3,6 +3,8 @@
 Utility for terminal based getch, applying a timeout, when there is no input available.
 """
 
+import codecs
+import os
 import select
 import sys
 import termios
@@ -41,3 +43,54 @@ class GetchWithTimeout:
         """
         termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old)
         print()
+
+
+class AsyncGetch:
+    """
+    This class provides an asyncio based getch with a timeout. Keypresses are read with
+    loop.add_reader, thus waiting for input never blocks the event loop.
+    """
+
+    def __init__(self, fd=None):
+        """
+        Set terminal in rawmode, store original settings for later restore. Must be called
+        while the event loop is running.
+        :param fd: File descriptor of the terminal, defaults to stdin
+        :type fd: int
+        """
+        # pylint: disable=invalid-name ## C104
+        self.fd = fd if fd is not None else sys.stdin.fileno()
+        self.old = termios.tcgetattr(self.fd)
+        import asyncio  # pylint: disable=import-outside-toplevel (C0415)
+        tty.setraw(self.fd)
+        # a character may be split across two reads
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._queue = asyncio.Queue()
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(self.fd, self._read)
+
+    def _read(self):
+        data = os.read(self.fd, 32)
+        for character in self._decoder.decode(data):
+            self._queue.put_nowait(character)
+
+    async def getch(self, timeout: float = .15):
+        """
+        A getch() with timeout.
+        :param timeout: Give a timeout in seconds.
+        :type timeout: float
+        :returns: The next character, or None when the timeout elapsed
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel (C0415)
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def cleanup(self):
+        """
+        Remove the reader and reset terminal. Call this at program end.
+        """
+        self._loop.remove_reader(self.fd)
+        termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old)
+        print()
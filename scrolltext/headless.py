@@ -0,0 +1,187 @@
+"""
+Headless render backends, which render into in-memory screen buffers instead of a terminal.
+"""
+import re
+
+
+CSI_PATTERN = re.compile(r"\[([0-9;]*)([A-Za-z])")
+
+
+class ScreenBuffer:  # pylint: disable=R0902  # disable (too-many-instance-attributes)
+    """
+    An in-memory terminal screen. It can be used as output text stream for linescroller and
+    interprets the escape sequences linescroller writes: cursor movements, clearing the
+    screen and SGR attributes, which are ignored. Written text is counted on write, but only
+    interpreted when the screen contents are requested, or process is called.
+    """
+
+    def __init__(self, cols, rows):
+        """
+        :param cols: Number of columns
+        :type cols: int
+        :param rows: Number of rows
+        :type rows: int
+        """
+        self.cols = cols
+        self.rows = rows
+        self.cells = [[" "] * cols for _ in range(rows)]
+        self.row = 0
+        self.col = 0
+        self.bytes_written = 0
+        self.writes = 0
+        self._pending = []
+
+    def write(self, text):
+        """
+        Text stream interface.
+        :returns: Number of characters written
+        :rtype: int
+        """
+        self.writes += 1
+        self.bytes_written += len(text.encode("utf-8"))
+        self._pending.append(text)
+        return len(text)
+
+    def flush(self):
+        """
+        Text stream interface, nothing to do.
+        """
+
+    def process(self):
+        """
+        Interprets all pending text.
+        """
+        pending = "".join(self._pending)
+        self._pending = []
+        pieces = pending.split("\033")
+        self._put_text(pieces[0])
+        for piece in pieces[1:]:
+            match = CSI_PATTERN.match(piece)
+            if match:
+                self._control(match.group(1), match.group(2))
+                piece = piece[match.end():]
+            self._put_text(piece)
+
+    def line(self, row):
+        """
+        :param row: Row (0-based)
+        :type row: int
+        :returns: The contents of one row
+        :rtype: str
+        """
+        self.process()
+        return "".join(self.cells[row])
+
+    def _control(self, params, command):
+        values = [int(value) if value else 0 for value in params.split(";")]
+        count = max(values[0], 1)
+        if command in "Hf":
+            self.row = min(max(values[0], 1), self.rows) - 1
+            self.col = min(max(values[1] if len(values) > 1 else 1, 1), self.cols) - 1
+        elif command == "A":
+            self.row = max(self.row - count, 0)
+        elif command == "B":
+            self.row = min(self.row + count, self.rows - 1)
+        elif command == "J" and values[0] == 2:
+            self.cells = [[" "] * self.cols for _ in range(self.rows)]
+
+    def _put_text(self, text):
+        for index, line in enumerate(text.split("\n")):
+            if index > 0:
+                self.row = min(self.row + 1, self.rows - 1)
+            parts = line.split("\r")
+            for part_index, part in enumerate(parts):
+                if part_index > 0:
+                    self.col = 0
+                part = part[:max(self.cols - self.col, 0)]
+                self.cells[self.row][self.col:self.col + len(part)] = part
+                self.col += len(part)
+
+
+class HeadlessWindow:
+    """
+    An in-memory replacement for the curses window methods used by cursestext. Like curses,
+    it keeps the window contents and the contents of the physical screen. A refresh only
+    "emits" the cells, which differ from the physical screen, unless the window was marked for
+    a complete redraw. Emitted bytes are counted.
+    """
+
+    def __init__(self, cols, rows):
+        """
+        :param cols: Number of columns
+        :type cols: int
+        :param rows: Number of rows
+        :type rows: int
+        """
+        self.cols = cols
+        self.rows = rows
+        self.cells = [[(" ", 0)] * cols for _ in range(rows)]
+        self._screen = [[None] * cols for _ in range(rows)]
+        self._redraw = True
+        self.bytes_written = 0
+        self.refreshes = 0
+
+    def getmaxyx(self):
+        """ curses interface """
+        return self.rows, self.cols
+
+    def addstr(self, row, col, text, attr=0):
+        """ curses interface, text exceeding the window is cut """
+        cells = self.cells[row]
+        for character in text[:max(self.cols - col, 0)]:
+            cells[col] = (character, attr)
+            col += 1
+
+    def clear(self):
+        """ curses interface """
+        self.cells = [[(" ", 0)] * self.cols for _ in range(self.rows)]
+        self._redraw = True
+
+    def box(self):
+        """ curses interface """
+        self.addstr(0, 0, "+" + "-" * (self.cols - 2) + "+")
+        self.addstr(self.rows - 1, 0, "+" + "-" * (self.cols - 2) + "+")
+        for row in range(1, self.rows - 1):
+            self.addstr(row, 0, "|")
+            self.addstr(row, self.cols - 1, "|")
+
+    def redrawwin(self):
+        """ curses interface """
+        self._redraw = True
+
+    def noutrefresh(self):
+        """ curses interface, the update is done in refresh """
+
+    def refresh(self):
+        """
+        curses interface, compares the window with the physical screen and counts the bytes
+        of the changed cells, or of all cells when a redraw was requested.
+        """
+        self.refreshes += 1
+        for row in range(self.rows):
+            window_row = self.cells[row]
+            screen_row = self._screen[row]
+            for col in range(self.cols):
+                if self._redraw or window_row[col] != screen_row[col]:
+                    self.bytes_written += len(window_row[col][0].encode("utf-8"))
+                    screen_row[col] = window_row[col]
+        self._redraw = False
+
+    def doupdate(self):
+        """ same as curses.doupdate, for this window """
+        self.refresh()
+
+    def timeout(self, delay):
+        """ curses interface, there is no input """
+
+    def getch(self, *_):
+        """ curses interface, refreshes like curses does and returns no input """
+        self.refresh()
+        return -1
+
+    def line(self, row):
+        """
+        :returns: The characters of one row of the window
+        :rtype: str
+        """
+        return "".join(character for character, _ in self.cells[row])
@@ -1,18 +1,29 @@
 """
 A simple side scrolling text application.
 """
-import shutil
+from operator import add
+import sys
 from time import sleep
-from .utils import CLEAR, HOME, BOLD, NORMAL, IS_WINDOWS, UP_ONE_ROW, CharacterScroller, TermSize
+from .config import get_section_indices
+from .display import column_cells, cut_last_column
+from .fanout import create_fanout_writer
+from .framecache import CycleFrames, create_frame_cache
+from .output import FrameWriter, create_frame_writer
+from .prerender import create_prerenderer
+from .scheduler import create_frame_scheduler, get_fps
+from .stats import NullStats, create_frame_stats
+from .utils import CLEAR, HOME, BOLD, NORMAL, IS_WINDOWS, UP_ONE_ROW, WatchedTermSize
+from .utils import create_config_watcher, create_scroller, next_texts, reload_config, text_rows
 
 if not IS_WINDOWS:
-    from scrolltext.getchtimeout import GetchWithTimeout
+    from scrolltext.getchtimeout import AsyncGetch, GetchWithTimeout
 
 
 DEFAULT_COLOR_TABLE_GREYSCALE_256 = ["38;5;" + str(x) + "m" for x in range(236, 256)]
 DEFAULT_COLOR_TABLE_CONSOLE = [str(x) + "m" for x in [30, 34, 35, 36, 31, 32, 33]]
 COLOR_TABLES = [DEFAULT_COLOR_TABLE_GREYSCALE_256, DEFAULT_COLOR_TABLE_CONSOLE]
-last_term_rows = -1  # pylint: disable=C0103 (invalid-name)
+COLOR_STEPS_PER_SECOND = 20
+QUIT_CHARACTERS = ["\033", "\x1b", "", "\r", "", " ", "Q", "q"]
 
 
 def linescroller(cfg):
@@ -25,47 +36,410 @@ def linescroller(cfg):
     if not IS_WINDOWS:
         getch = GetchWithTimeout()
 
-    term_size = TermSize(0, 0)
-    _update_term_size(term_size)
+    term_size = WatchedTermSize()
+    term_size.start()
+    stats = create_frame_stats(cfg, 1. / get_fps(cfg))
     try:
-        _linescroller(getch, cfg, term_size)
+        _compositor_loop(getch, cfg, term_size, stats)
     except RuntimeError:
-        pass
+        print(f"{NORMAL}")  # the frame writer is closed, stdout is blocking again
     finally:
+        term_size.stop()
         if not IS_WINDOWS:
             getch.cleanup()
         else:
             print(f"{UP_ONE_ROW}", end="")
+        stats.print_summary()
 
 
-def _linescroller(getch, cfg, term_size):
+def _compositor_loop(getch, cfg, term_size, stats):
     """
-    Prints a text in a side-scrolling manner.
+    Prints the texts in a side-scrolling manner: Advances the scrollers of all
+    "scrolltext.text %d" sections, each on its own line, and writes all lines at once per
+    tick. The loop ends, when every scroller has finished. With the option "fanout" the
+    frames are written to the configured devices instead of stdout. The stages of every
+    frame are timed with stats.
     """
-    argv = {}
-    argv["min_scroll_line"] = 0
-    scroller = CharacterScroller(cfg, term_size, **argv)
-    use_colors = cfg["main"].getboolean("color")
-    use_bold = cfg["main"].getboolean("bold")
-    colortable = _build_smooth_colortable(cfg)
-    colortable_size = len(colortable)
+    active = _create_scrollers(cfg, term_size)
+    fanout = create_fanout_writer(cfg)
+    out = fanout if fanout is not None else create_frame_writer(cfg)
+    compositor = LineCompositor(cfg, out, stats=stats, complete_frames=fanout is not None,
+                                cache=create_frame_cache(cfg))
+    scheduler = create_frame_scheduler(cfg)
+    watcher = create_config_watcher(cfg)
+    _start_prerender(cfg, compositor)
+    compositor.clear()
+    stats.next_frame()
+    try:
+        while active:
+            _composite_frame(active, compositor, scheduler, term_size)
+            _check_input(getch, scheduler)
+            stats.mark("wait")
+            reload_config(watcher, active)
+            _check_compositor_resize(compositor, term_size)
+            stats.next_frame()
+    finally:
+        _stop_prerender(compositor)
+        _close_output(compositor)
+        if fanout:
+            fanout.close()
+        if cfg["main"].getboolean("verbose", False):
+            _print_output_summary(compositor)
+
+
+async def async_linescroller(cfg):
+    """
+    asyncio based entry point for linescroller. Frame deadlines are awaited and keypresses are
+    read via the event loop, thus other coroutines keep running on the same loop. All
+    "scrolltext.text %d" sections are rendered, like in linescroller.
+    :param cfg: Config object
+    :type: configparser.ConfigParser
+    """
+    getch = None
+    if not IS_WINDOWS:
+        getch = AsyncGetch()
 
-    print(f"{CLEAR}{HOME}", end="")
-    if scroller.line > 0:
-        _move_to_line(scroller.line)
-    cnt = 0
-    offset = 2
-    for text in scroller:
-        if scroller.line < term_size.get_rows() - 1:
-            win_text = text
+    term_size = WatchedTermSize()
+    term_size.start()
+    try:
+        await _async_compositor_loop(getch, cfg, term_size)
+    except RuntimeError:
+        print(f"{NORMAL}")
+    finally:
+        term_size.stop()
+        if not IS_WINDOWS:
+            getch.cleanup()
         else:
-            win_text = text[:-1]
-        win_text = _add_ansi_escapes(win_text, cnt, use_bold, use_colors, colortable,
-                                     colortable_size)
-        print(win_text, end="\r")
-        _check_input(getch)
-        cnt += offset
-        _check_term_resize(scroller, term_size)
+            print(f"{UP_ONE_ROW}", end="")
+
+
+async def _async_compositor_loop(getch, cfg, term_size):
+    import asyncio  # pylint: disable=import-outside-toplevel (C0415)
+    active = _create_scrollers(cfg, term_size)
+    compositor = LineCompositor(cfg, create_frame_writer(cfg))
+    scheduler = create_frame_scheduler(cfg)
+    watcher = create_config_watcher(cfg)
+    compositor.clear()
+    try:
+        while active:
+            _composite_frame(active, compositor, scheduler, term_size)
+            if getch is None:
+                await asyncio.sleep(scheduler.remaining())
+                scheduler.advance()
+            else:
+                _check_quit_characters(await scheduler.async_wait(getch.getch))
+            reload_config(watcher, active)
+            _check_compositor_resize(compositor, term_size)
+    finally:
+        _close_output(compositor)
+
+
+def _create_scrollers(cfg, term_size):
+    return [create_scroller(cfg, term_size, section_index=index, min_scroll_line=0)
+            for index in get_section_indices(cfg)]
+
+
+def _composite_frame(active, compositor, scheduler, term_size):
+    texts = next_texts(active)
+    compositor.stats.mark("next")
+    if not compositor.ready():
+        return
+    lines, frames = _frame_lines(compositor, texts, term_size)
+    compositor.render(lines, _color_phase(scheduler), frames)
+    for scroller, _ in texts:
+        compositor.stats.position(id(scroller), scroller.pos - scroller.shifted)
+
+
+def _frame_lines(compositor, texts, term_size):
+    """
+    :param texts: Pairs of scroller and its visible text
+    :type texts: list
+    :returns: The lines of the frame, pairs of terminal row (1-based) and text, and the
+              cached frames of each line, see LineCompositor.render
+    :rtype: tuple
+    """
+    lines = []
+    frames = []
+    for scroller, text in texts:
+        scroller_frames = compositor.frames(scroller)
+        for line, row_text in text_rows(scroller, text):
+            lines.append((line + 1, _fit_to_line(row_text, line, term_size)))
+            frames.append(scroller_frames)
+    return lines, frames
+
+
+def _start_prerender(cfg, compositor):
+    """
+    Builds the cycles of the frame cache on a process pool, when enabled. Without frame cache
+    or with the diff renderer, the frames are rendered live.
+    """
+    if compositor.cache is not None and compositor.colors is not None and not compositor.renderer:
+        compositor.prerender = create_prerenderer(cfg)
+
+
+def _stop_prerender(compositor):
+    if compositor.prerender:
+        compositor.prerender.close()
+
+
+def _close_output(compositor):
+    if isinstance(compositor.out, FrameWriter):
+        compositor.out.close()
+
+
+def _print_output_summary(compositor):
+    if compositor.renderer:
+        compositor.renderer.print_summary()
+    if compositor.prerender:
+        compositor.prerender.print_summary()
+    if isinstance(compositor.out, FrameWriter):
+        compositor.out.print_summary()
+
+
+def _check_compositor_resize(compositor, term_size):
+    if term_size.update():
+        compositor.clear()
+
+
+def _color_phase(scheduler):
+    """
+    The color animation advances with time, not with frames, thus its speed does not depend
+    on the frame rate.
+    """
+    return int(scheduler.frames * scheduler.period * COLOR_STEPS_PER_SECOND)
+
+
+def _fit_to_line(text, line, term_size):
+    """
+    Writing into the last column of the last row would scroll the terminal, so the last
+    column is removed, then.
+    """
+    if line < term_size.get_rows() - 1:
+        return text
+    return cut_last_column(text)
+
+
+class LineCompositor:  # pylint: disable=R0902  # disable (too-many-instance-attributes)
+    """
+    Renders the lines of several scrollers and flushes all of them with a single write.
+    Lines are addressed with cursor-positioning escapes. Colored lines are taken from the
+    frame cache, when one is given.
+    """
+    # pylint: disable=too-many-arguments (R0913)
+    def __init__(self, cfg, out=None, stats=None, complete_frames=False, cache=None):
+        """
+        :param cfg: Config object
+        :type: configparser.ConfigParser
+        :param out: Text stream to write to, defaults to sys.stdout
+        :param stats: Times the colors and write stages, see scrolltext.stats
+        :param complete_frames: Every frame contains all lines, i.e. the option diff is
+                                ignored, e.g. because frames may be dropped on the way
+        :type complete_frames: bool
+        :param cache: Cache of colored lines
+        :type cache: scrolltext.framecache.FrameCache
+        """
+        self.cache = cache
+        self.prerender = None  # see scrolltext.prerender
+        self.stats = stats if stats is not None else NullStats()
+        use_colors = cfg["main"].getboolean("color")
+        use_bold = cfg["main"].getboolean("bold")
+        self.out = out if out is not None else sys.stdout
+        self.prefix = BOLD if use_bold else ""
+        self.colors = ColorEngine(_build_smooth_colortable(cfg)) if use_colors else None
+        self.renderer = None
+        if cfg["main"].getboolean("diff", False) and not complete_frames:
+            self.renderer = DiffRenderer(self.prefix, self.out)
+        self._style = (self.renderer is not None, self.prefix
+                       + "".join(self.colors.prefixes if self.colors else []))
+
+    def ready(self):
+        """
+        :returns: False, if the frame should be skipped, because the terminal did not keep up
+                  with the previous frames, see FrameWriter
+        :rtype: bool
+        """
+        if not isinstance(self.out, FrameWriter) or self.out.ready():
+            return True
+        self.out.drop_frame()
+        return False
+
+    def clear(self):
+        """
+        Clears the screen and forgets the previously emitted frame.
+        """
+        self.out.write(f"{CLEAR}{HOME}")
+        self.out.flush()
+        self.reset()
+
+    def reset(self):
+        """
+        Forget the previously emitted frame, e.g. after the screen was cleared.
+        """
+        if self.renderer:
+            self.renderer.reset()
+
+    def render(self, lines, cnt, frames=None):
+        """
+        :param lines: Pairs of terminal row (1-based) and visible text
+        :type lines: list
+        :param cnt: Color phase
+        :type cnt: int
+        :param frames: Cached frames of each line's scroller, see frames
+        :type frames: list
+        """
+        frames = frames or [None] * len(lines)
+        if self.prerender:
+            self.prerender.update()
+        if self.renderer:
+            cells = [(row, self.cells(text, cnt)) for row, text in lines]
+            self.stats.mark("colors")
+            self.renderer.render_lines(cells)
+            self.stats.mark("write")
+            return
+        data = "".join(f"\033[{row};1H{self.prefix}" + self.apply(text, cnt, line_frames)
+                       for (row, text), line_frames in zip(lines, frames))
+        self.stats.mark("colors")
+        self.out.write(data)
+        self.out.flush()
+        self.stats.mark("write")
+
+    def frames(self, scroller):
+        """
+        :returns: The cycle frames of the scroller's message and the virtual column of its
+                  visible text, None if not cached, e.g. without colors, with the diff
+                  renderer, for stream sources or when the cycle is too large
+        :rtype: tuple
+        """
+        if (self.cache is None or self.colors is None or self.renderer is not None
+                or scroller.message is None):
+            return None
+        key = (scroller.message, scroller.visible_text_length, scroller.right_to_left,
+               scroller.endless, self._style)
+        start, end = scroller.cycle_range()
+        cycle = self.cache.frames(
+            key, lambda: CycleFrames.size_of(end - start, self.colors.prefixes,
+                                             scroller.message.isascii()),
+            lambda: self._new_cycle(scroller.text_range(start, end), start))
+        return None if cycle is None else (cycle, scroller.text_start)
+
+    def _new_cycle(self, text, start):
+        cycle = CycleFrames(text, start, self.colors.prefixes)
+        if self.prerender:
+            self.prerender.add(cycle)
+        return cycle
+
+    def cells(self, text, cnt):
+        """
+        :returns: One str per terminal column, see ColorEngine.cells
+        :rtype: list
+        """
+        if not self.colors:
+            return column_cells(text)
+        return self.colors.cells(text, cnt)
+
+    def apply(self, text, cnt, frames=None):
+        """
+        :returns: The text with a color escape in front of every character
+        :rtype: str
+        """
+        if not self.colors:
+            return text
+        if frames is None:
+            return self.colors.apply(text, cnt)
+        cycle, start = frames
+        return self.cache.get(cycle, start, len(text), cnt, lambda: self.colors.apply(text, cnt))
+
+
+class DiffRenderer:
+    """
+    Renders lines of cells, but only writes the cells, which differ from the previously
+    emitted frame. Changed cells are addressed with cursor-positioning escapes, when nothing
+    changed, nothing is written at all.
+    """
+    def __init__(self, prefix="", out=None):
+        """
+        :param prefix: Escape sequence emitted in front of every non-empty write, e.g. BOLD
+        :type prefix: str
+        :param out: Text stream to write to, defaults to sys.stdout
+        """
+        self.prefix = prefix
+        self.out = out if out is not None else sys.stdout
+        self._lines = {}  # row -> cells
+        self.last_bytes = 0
+        self.total_bytes = 0
+        self.frames = 0
+
+    def reset(self):
+        """
+        Forget the previously emitted frame, e.g. after the screen was cleared.
+        """
+        self._lines = {}
+
+    def render(self, row, cells):
+        """
+        Writes the changed cells of one line.
+        :param row: Terminal row (1-based)
+        :type row: int
+        :param cells: One str per column, i.e. a character including its escape sequences
+        :type cells: list
+        :returns: Number of bytes written for this frame
+        :rtype: int
+        """
+        return self.render_lines([(row, cells)])
+
+    def render_lines(self, lines):
+        """
+        Writes the changed cells of several lines with a single write.
+        :param lines: Pairs of terminal row (1-based) and cells
+        :type lines: list
+        :returns: Number of bytes written for this frame
+        :rtype: int
+        """
+        data = ""
+        for row, cells in lines:
+            data += self.diff(row, cells)
+            self._lines[row] = cells
+        self.frames += 1
+        self.last_bytes = 0
+        if data:
+            data = self.prefix + data
+            self.out.write(data)
+            self.out.flush()
+            self.last_bytes = len(data.encode("utf-8"))
+            self.total_bytes += self.last_bytes
+        return self.last_bytes
+
+    def diff(self, row, cells):
+        """
+        Builds the escape sequences for the cells, which differ from the previous frame.
+        Consecutive changed cells are joined into one run behind a single cursor movement.
+        Cells, which are no longer covered by the new frame, are overwritten with blanks.
+        :returns: The text to write, an empty str if nothing changed
+        :rtype: str
+        """
+        prev = self._lines.get(row, [])
+        if len(cells) < len(prev):
+            cells = cells + [NORMAL + " "] + [" "] * (len(prev) - len(cells) - 1)
+        runs = []
+        start = -1
+        for col, cell in enumerate(cells):
+            if col < len(prev) and prev[col] == cell:
+                if start >= 0:
+                    runs.append(f"\033[{row};{start + 1}H" + "".join(cells[start:col]))
+                    start = -1
+            elif start < 0:
+                start = col
+        if start >= 0:
+            runs.append(f"\033[{row};{start + 1}H" + "".join(cells[start:]))
+        return "".join(runs)
+
+    def print_summary(self):
+        """
+        Prints the number of written bytes to stderr.
+        """
+        average = self.total_bytes / self.frames if self.frames else 0
+        print(f"{NORMAL}diff renderer: {self.frames} frames, {self.total_bytes} bytes, "
+              f"{average:.1f} bytes/frame", file=sys.stderr)
 
 
 def _build_smooth_colortable(cfg):
@@ -73,76 +447,96 @@ def _build_smooth_colortable(cfg):
     if color_table_id < 0 or color_table_id >= len(COLOR_TABLES):
         color_table_id = 0
     color_table = COLOR_TABLES[color_table_id]
-    colors = color_table
-    for pos in range(len(colors) - 1, 0, -1):
+    colors = list(color_table)
+    for pos in range(len(color_table) - 1, 0, -1):
         colors.append(color_table[pos])
     return colors
 
 
-# pylint: disable=too-many-arguments (R0913)
-def _add_ansi_escapes(win_text, cnt, use_bold, use_colors, colortable, colortable_size):
-    if use_colors:
-        win_text = _apply_colors(win_text, cnt, colortable, colortable_size)
-    if use_bold:
-        win_text = BOLD + win_text
-    return win_text
+class ColorEngine:
+    """
+    Applies a color table to the visible text. The SGR prefixes of the color table are
+    precompiled once and laid out in a periodic pattern, thus a frame is a slice of that
+    pattern interleaved with the text and joined once.
+
+    The colors are laid out by terminal columns: Combining marks get no escape of their own,
+    they stay with their base character, and a wide character takes the color of its first
+    column.
+    """
+    def __init__(self, colortable):
+        """
+        :param colortable: Color table entries, e.g. "38;5;236m"
+        :type colortable: list
+        """
+        self.prefixes = ["\033[" + color for color in colortable]
+        self.size = len(self.prefixes)
+        self._pattern = []
+        self._width = -1
+        self._templates = {}
 
+    def _grow_pattern(self, width):
+        if len(self._pattern) < width + self.size:
+            self._pattern = self.prefixes * (width // self.size + 2)
 
-def _apply_colors(win_text, cnt, colortable, colortable_size):
-    color_index = cnt % colortable_size
-    new_text = ""
-    for ch in win_text:
-        new_text += f"\033[{colortable[color_index]}" + ch
-        color_index += 1
-        color_index = color_index % colortable_size
-    return new_text
+    def cells(self, win_text, cnt):
+        """
+        :returns: One str per terminal column, prefixed with its color escape. The second
+                  column of a wide character is an empty str.
+        :rtype: list
+        """
+        columns = column_cells(win_text)
+        width = len(columns)
+        self._grow_pattern(width)
+        phase = cnt % self.size
+        cells = list(map(add, self._pattern[phase:phase + width], columns))
+        if not win_text.isascii():
+            cells = [cell if column else "" for cell, column in zip(cells, columns)]
+        return cells
 
+    def apply(self, win_text, cnt):
+        """
+        :param win_text: The visible text
+        :type win_text: str
+        :param cnt: Color phase, i.e. the color table index of the first character
+        :type cnt: int
+        :returns: The visible text with a color escape in front of every character
+        :rtype: str
+        """
+        if not win_text.isascii():
+            return "".join(self.cells(win_text, cnt))
+        width = len(win_text)
+        if width != self._width:
+            self._width = width
+            self._templates = {}
+            self._grow_pattern(width)
+        phase = cnt % self.size
+        template = self._templates.get(phase)
+        if template is None:
+            template = [""] * (2 * width)
+            template[0::2] = self._pattern[phase:phase + width]
+            self._templates[phase] = template
+        template[1::2] = win_text
+        return "".join(template)
 
-def _check_input(getch):
+
+def _check_input(getch, scheduler):
     if IS_WINDOWS:
-        sleep(.15)
+        sleep(scheduler.remaining())
+        scheduler.advance()
     else:
-        _check_user_keypress(getch)
+        _check_user_keypress(getch, scheduler)
 
 
-def _check_user_keypress(getch):
+def _check_user_keypress(getch, scheduler):
     """
-    Use getchtimeout to get a character. If "Q" or "q" is given, then it raises SystemExit
+    Use getchtimeout to get characters, until the next frame is due. If "Q" or "q" is given,
+    then it raises RuntimeError. The colors are reset by the caller, after the output was
+    closed, see _close_output.
     """
-    character = getch.getch(timeout=.1)
-    if character is not None and character in ["\033", "\x1b", "", "\r", "", " ", "Q", "q"]:
-        print(f"{NORMAL}")
-        raise RuntimeError()
+    _check_quit_characters(scheduler.wait(getch.getch))
 
 
-def _move_to_line(line):
-    """
-    Move the cursor to the specified line. This is done using ANSI Escape sequences.
-    :param line: The line number to scroll to.
-    :type line: int
-    """
-    if not IS_WINDOWS:
-        print(f"\033[{line}B", end="")
-    else:
-        for _ in range(line):
-            print("\033[1B", end="")
-
-
-def _check_term_resize(scroller, term_size):
-    if _update_term_size(term_size):
-        print(f"{CLEAR}{HOME}", end="")
-        if scroller.line > 0:
-            _move_to_line(scroller.line)
-
-
-def _update_term_size(term_size):
-    global last_term_rows  # pylint: disable=W0603 (global-statement)
-    available_rows = shutil.get_terminal_size()[1]
-    available_columns = shutil.get_terminal_size()[0] - (1 if IS_WINDOWS else 0)
-    term_size.set_size(available_columns, available_rows)
-    if last_term_rows == -1:
-        last_term_rows = term_size.get_rows()
-    if term_size.get_rows() != last_term_rows:
-        last_term_rows = term_size.get_rows()
-        return True
-    return False
+def _check_quit_characters(characters):
+    for character in characters:
+        if character in QUIT_CHARACTERS:
+            raise RuntimeError()
@@ -0,0 +1,159 @@
+"""
+Frame output for linescroller: the text of a frame is assembled in one preallocated buffer
+and written to the terminal with a single system call.
+"""
+import os
+import select
+import sys
+from scrolltext.config import IS_WINDOWS
+
+
+INITIAL_SIZE = 16 * 1024
+
+
+def create_frame_writer(cfg, out=None):
+    """
+    Flushes out, before its file descriptor is written to directly. Close the FrameWriter
+    at exit, it restores the blocking mode of the file descriptor.
+    :param cfg: Config object, the option "backpressure" in section main drops stale frames
+    :type: configparser.ConfigParser
+    :param out: Text stream, defaults to sys.stdout
+    :returns: A FrameWriter for the file descriptor of out, or out itself on windows or when
+              it has no file descriptor
+    """
+    out = out if out is not None else sys.stdout
+    if IS_WINDOWS:
+        return out
+    try:
+        fd = out.fileno()  # pylint: disable=invalid-name ## C103
+    except (AttributeError, OSError, ValueError):
+        return out
+    out.flush()
+    return FrameWriter(fd, drop_stale=cfg["main"].getboolean("backpressure", False))
+
+
+class FrameWriter:  # pylint: disable=R0902  # disable (too-many-instance-attributes)
+    """
+    A text stream, which collects the text written between two flushes in a bytearray and
+    writes it with one os.write. The buffer is allocated once and only grows, when a frame
+    does not fit. Partial writes are continued, on a non-blocking file descriptor the writer
+    waits until it is writable again, thus a frame is always written completely.
+
+    With drop_stale, e.g. over a congested connection, the writer never waits: The file
+    descriptor is switched to non-blocking mode until close. Note that stdin may share it,
+    when both are the same terminal. The rest of a partially written frame is kept and
+    completed later. While it is pending, or while the terminal does not accept bytes, ready
+    is False and the caller skips the frame, see drop_frame, thus the next frame written
+    shows the newest scroll position, instead of lagging behind.
+
+    syscalls counts the writes, for checking that a frame costs one system call.
+    buffer_allocations counts the allocations of the frame buffer, i.e. the initial one and
+    every growth, not all allocations of a frame: Encoding the text still creates a bytes
+    object per write and os.write gets a memoryview slice. frames counts the completely
+    written frames, dropped_frames the frames skipped because of backpressure.
+    """
+
+    def __init__(self, fd, size=INITIAL_SIZE, drop_stale=False):
+        """
+        :param fd: File descriptor of the terminal
+        :type fd: int
+        :param size: Initial size of the buffer in bytes
+        :type size: int
+        :param drop_stale: Skip frames, instead of waiting for the terminal
+        :type drop_stale: bool
+        """
+        self.fd = fd  # pylint: disable=invalid-name ## C103
+        self.drop_stale = drop_stale
+        self._blocking = os.get_blocking(fd)
+        if drop_stale:
+            os.set_blocking(fd, False)
+        self._buffer = bytearray(size)
+        self._offset = 0  # start of the bytes not written yet
+        self._length = 0
+        self.frames = 0
+        self.syscalls = 0
+        self.buffer_allocations = 1
+        self.bytes_written = 0
+        self.dropped_frames = 0
+
+    def write(self, text):
+        """
+        Text stream interface, appends the encoded text to the frame.
+        :returns: Number of characters written
+        :rtype: int
+        """
+        data = text.encode("utf-8")
+        end = self._length + len(data)
+        if end > len(self._buffer):
+            self._grow(end)
+        self._buffer[self._length:end] = data
+        self._length = end
+        return len(text)
+
+    def flush(self):
+        """
+        Writes the frame. With drop_stale, bytes the terminal does not accept right now are
+        written later, see ready.
+        """
+        if self._offset == self._length:
+            return
+        self._write(wait=not self.drop_stale)
+
+    def ready(self):
+        """
+        Completes a partially written frame, as far as the terminal accepts it.
+        :returns: True, if the next frame can be written without waiting, always True
+                  without drop_stale
+        :rtype: bool
+        """
+        if not self.drop_stale:
+            return True
+        if self._length:
+            self._write(wait=False)
+        return not self._length and bool(select.select([], [self.fd], [], 0)[1])
+
+    def drop_frame(self):
+        """
+        Counts a frame, which the caller skipped, because the writer was not ready.
+        """
+        self.dropped_frames += 1
+
+    def close(self):
+        """
+        Restores the blocking mode of the file descriptor. A pending rest of a frame is
+        dropped.
+        """
+        self._offset = self._length = 0
+        os.set_blocking(self.fd, self._blocking)
+
+    def _write(self, wait):
+        with memoryview(self._buffer) as view:
+            while self._offset < self._length:
+                self.syscalls += 1
+                try:
+                    written = os.write(self.fd, view[self._offset:self._length])
+                except BlockingIOError:
+                    if not wait:
+                        return
+                    select.select([], [self.fd], [])
+                    continue
+                self._offset += written
+                self.bytes_written += written
+        self._offset = self._length = 0
+        self.frames += 1
+
+    def _grow(self, size):
+        new_size = 2 * len(self._buffer)
+        while new_size < size:
+            new_size *= 2
+        self._buffer.extend(bytes(new_size - len(self._buffer)))
+        self.buffer_allocations += 1
+
+    def print_summary(self):
+        """
+        Prints the number of system calls, buffer allocations and dropped frames to stderr.
+        """
+        frames = self.frames or 1
+        print(f"frame writer: {self.frames} frames, {self.syscalls / frames:.2f} syscalls/frame, "
+              f"{self.buffer_allocations} buffer allocations, {self.bytes_written / frames:.1f} "
+              f"bytes/frame, {self.dropped_frames} dropped frames", file=sys.stderr)
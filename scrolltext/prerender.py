@@ -0,0 +1,81 @@
+"""
+Pre-rendering of the frame cache on a process pool: The colored copies of the cycle of a
+message, see scrolltext.framecache.CycleFrames, are built by worker processes, while the
+playback goes on, instead of by the playback on first use.
+"""
+import os
+import sys
+from .framecache import color_cycle
+
+
+def create_prerenderer(cfg):
+    """
+    :param cfg: Config object, the option "prerender" in section main enables the pool,
+                "prerender_workers" sets the number of processes, default: one per core
+    :type: configparser.ConfigParser
+    :returns: A Prerenderer, or None when disabled
+    """
+    if not cfg["main"].getboolean("prerender", False):
+        return None
+    workers = cfg["main"].getint("prerender_workers", 0)
+    return Prerenderer(workers if workers > 0 else None)
+
+
+class Prerenderer:
+    """
+    Builds the rotations of cycles on a ProcessPoolExecutor, every rotation of a cycle is a
+    task of its own. A finished rotation is handed to its cycle with the next frame. Until
+    then, the frames of that rotation are rendered live, thus the playback starts at once
+    and never waits for a worker, and long cycles are built on all cores.
+    """
+
+    def __init__(self, workers=None):
+        """
+        :param workers: Number of processes, None for one per core
+        :type workers: int
+        """
+        # pylint: disable=import-outside-toplevel (C0415)
+        from concurrent.futures import ProcessPoolExecutor  # loads multiprocessing
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(self.workers)
+        self._pending = []  # (cycle, rotation, future)
+        self.rotations = 0
+
+    def add(self, cycle):
+        """
+        Submits all rotations of the cycle.
+        :type cycle: scrolltext.framecache.CycleFrames
+        """
+        for rotation in range(cycle.size):
+            cycle.pending.add(rotation)
+            self._pending.append((cycle, rotation, self._executor.submit(
+                color_cycle, cycle.text, cycle.prefixes, rotation)))
+
+    def update(self):
+        """
+        Hands the finished rotations to their cycles. Called once per frame, it never waits
+        for a worker.
+        """
+        pending = []
+        for cycle, rotation, future in self._pending:
+            if future.done():
+                cycle.install(rotation, future.result())
+                self.rotations += 1
+            else:
+                pending.append((cycle, rotation, future))
+        self._pending = pending
+
+    def close(self):
+        """
+        Cancels the pending rotations and stops the worker processes.
+        """
+        for _, _, future in self._pending:
+            future.cancel()
+        self._executor.shutdown(wait=False)
+
+    def print_summary(self):
+        """
+        Prints the number of built and pending rotations to stderr.
+        """
+        print(f"prerender: {self.workers} workers, {self.rotations} rotations built, "
+              f"{len(self._pending)} pending", file=sys.stderr)
@@ -0,0 +1,110 @@
+"""
+Fixed timestep frame scheduler, based on a monotonic clock.
+"""
+from time import monotonic
+
+
+DEFAULT_FPS = 30
+MAX_FPS = 240
+
+
+class FrameScheduler:
+    """
+    Provides frame deadlines at a fixed rate. Deadlines advance by exactly one frame period,
+    thus the time spent rendering a frame does not add up as drift. When a frame is late by
+    more than one period, the missed deadlines are skipped instead of rendering a burst of
+    frames.
+    """
+
+    def __init__(self, fps=DEFAULT_FPS, clock=monotonic):
+        """
+        :param fps: Target frames per second
+        :type fps: int
+        :param clock: Monotonic clock, returning seconds as float
+        :type clock: callable
+        """
+        self.period = 1. / fps
+        self.clock = clock
+        self.deadline = clock() + self.period
+        self.frames = 0
+        self.skipped_frames = 0
+
+    def remaining(self):
+        """
+        :returns: Seconds until the next frame deadline, never negative
+        :rtype: float
+        """
+        return max(self.deadline - self.clock(), 0.)
+
+    def advance(self):
+        """
+        Sets the deadline of the next frame. The frame counter includes skipped frames.
+        """
+        self.deadline += self.period
+        self.frames += 1
+        now = self.clock()
+        if self.deadline < now:
+            missed = int((now - self.deadline) / self.period) + 1
+            self.skipped_frames += missed
+            self.frames += missed
+            self.deadline += missed * self.period
+
+    def wait(self, poll):
+        """
+        Waits until the frame deadline and advances to the next frame. Input is polled until
+        the deadline. The given poll function is called with the remaining time as timeout,
+        it returns some input, or None when the timeout has elapsed.
+
+        :param poll: Function with a timeout parameter, e.g. GetchWithTimeout.getch
+        :type poll: callable
+        :returns: All input received until the deadline
+        :rtype: list
+        """
+        inputs = []
+        while True:
+            result = poll(self.remaining())
+            if result is not None:
+                inputs.append(result)
+            if self.remaining() <= 0:
+                break
+        self.advance()
+        return inputs
+
+    async def async_wait(self, poll):
+        """
+        Same as wait, but for a coroutine poll function, e.g. AsyncGetch.getch.
+
+        :returns: All input received until the deadline
+        :rtype: list
+        """
+        inputs = []
+        while True:
+            result = await poll(self.remaining())
+            if result is not None:
+                inputs.append(result)
+            if self.remaining() <= 0:
+                break
+        self.advance()
+        return inputs
+
+
+def create_frame_scheduler(cfg):
+    """
+    :param cfg: Config object, uses the optional option "fps" in section main
+    :type: configparser.ConfigParser
+    :rtype: FrameScheduler
+    """
+    return FrameScheduler(get_fps(cfg))
+
+
+def get_fps(cfg):
+    """
+    :param cfg: Config object, uses the optional option "fps" in section main
+    :type: configparser.ConfigParser
+    :returns: Frames per second, the default when not configured or out of range
+    :rtype: int
+    """
+    fps = cfg["main"].getint("fps", DEFAULT_FPS)
+    if fps <= 0 or fps > MAX_FPS:
+        fps = DEFAULT_FPS
+    return fps
@@ -0,0 +1,190 @@
+"""
+Scroll texts made of segments, e.g. the headlines of a news ticker, which are appended or
+replaced while the text is scrolled.
+"""
+from bisect import bisect_right
+from copy import copy
+from scrolltext.display import display_text
+
+
+LOOKBEHIND = 4096
+
+
+class SegmentedText:  # pylint: disable=R0902  # disable (too-many-instance-attributes)
+    """
+    A scroll text, which is stored as a list of segments together with the absolute end
+    column of each segment. It supports len() and slicing with absolute columns, like a str,
+    but the segments are never concatenated: Appending a segment only computes the widths of
+    the new segment, a slice only touches the segments it overlaps.
+
+    A segment may start right of the end of the text, the columns in between are blank.
+
+    Changing the text never moves the text at or right of the last requested slice, i.e. the
+    visible window: When a segment left of the window changes its length, the preceding text
+    moves instead of the following. Columns left of the first segment are blank.
+
+    With fixed columns, the text always starts at column 0, e.g. when it repeats in endless
+    mode. Then a changed segment always moves the following text, and the caller moves the
+    window, see replace.
+
+    With release enabled, segments ending more than lookbehind columns before the last
+    requested slice are dropped, thus the memory use is bounded, when the text is only
+    scrolled forward.
+    """
+
+    def __init__(self, segments=(), release=False, lookbehind=LOOKBEHIND, fixed=False):
+        """
+        :param segments: Initial segments
+        :type segments: iterable
+        :param release: Drop segments, which were scrolled out
+        :type release: bool
+        :param fixed: Keep the text at column 0
+        :type fixed: bool
+        :param lookbehind: Number of columns kept left of the last requested slice
+        :type lookbehind: int
+        """
+        self.release = release
+        self.lookbehind = lookbehind
+        self.fixed = fixed
+        self._texts = []  # str or DisplayText of every kept segment
+        self._starts = []  # absolute start column of every kept segment
+        self._ends = []  # absolute end column of every kept segment
+        self._base = 0  # absolute column of the first kept segment
+        self._first = 0  # index of the first kept segment
+        self._last_start = 0
+        for segment in segments:
+            self.append(segment)
+
+    def __len__(self):
+        """
+        :returns: Number of columns
+        :rtype: int
+        """
+        return self._ends[-1] if self._ends else self._base
+
+    def __str__(self):
+        ends = [self._base] + self._ends
+        return "".join(" " * (start - end) + str(text)
+                       for text, start, end in zip(self._texts, self._starts, ends))
+
+    def append(self, text, column=None):
+        """
+        Appends a segment behind the text.
+        :param text: The segment, line breaks become blanks
+        :type text: str
+        :param column: Start column of the segment, at least the end of the text, which it
+                       defaults to
+        :type column: int
+        :returns: Index of the segment, see replace
+        :rtype: int
+        """
+        text = _display_segment(text)
+        start = len(self) if column is None else max(column, len(self))
+        self._starts.append(start)
+        self._ends.append(start + len(text))
+        self._texts.append(text)
+        return self._first + len(self._texts) - 1
+
+    def span(self, index):
+        """
+        :param index: Index of the segment, as returned by append
+        :type index: int
+        :returns: The absolute start and end column of the segment
+        :rtype: tuple
+        :raises IndexError: If there is no such segment, or it was dropped already
+        """
+        position = self._position(index)
+        return self._starts[position], self._ends[position]
+
+    def copy(self):
+        """
+        :returns: A copy, which is changed independently. The segments themselves are shared,
+                  they are never changed.
+        :rtype: SegmentedText
+        """
+        # pylint: disable=protected-access (W0212)
+        text = copy(self)
+        text._texts = list(self._texts)
+        text._starts = list(self._starts)
+        text._ends = list(self._ends)
+        return text
+
+    def replace(self, index, text, window=None):
+        """
+        Replaces a segment.
+        :param index: Index of the segment, as returned by append
+        :type index: int
+        :param text: The new segment, line breaks become blanks
+        :type text: str
+        :param window: Column of the visible window, defaults to the start of the last
+                       requested slice
+        :type window: int
+        :returns: Number of columns, the text at the window moved to the right, i.e. the
+                  length change of a segment left of the window with fixed columns, else 0
+        :rtype: int
+        :raises IndexError: If there is no such segment, or it was dropped already
+        """
+        position = self._position(index)
+        text = _display_segment(text)
+        delta = len(text) - len(self._texts[position])
+        self._texts[position] = text
+        left = self._ends[position] <= (self._last_start if window is None else window)
+        if left and not self.fixed:
+            self._base -= delta  # left of the window, the preceding text moves
+            self._starts[position] -= delta
+            for previous in range(position):
+                self._starts[previous] -= delta
+                self._ends[previous] -= delta
+            return 0
+        self._ends[position] += delta
+        for following in range(position + 1, len(self._ends)):
+            self._starts[following] += delta
+            self._ends[following] += delta
+        return delta if left else 0
+
+    def _position(self, index):
+        position = index - self._first
+        if not 0 <= position < len(self._texts):
+            raise IndexError("segment index out of range")
+        return position
+
+    def __getitem__(self, key):
+        """
+        Slices the text by absolute columns.
+
+        :rtype: str
+        """
+        if not isinstance(key, slice):
+            raise TypeError("SegmentedText only supports slicing")
+        start = key.start or 0
+        stop = key.stop if key.stop is not None else len(self)
+        self._last_start = start
+        parts = [" " * (min(stop, self._base) - start)] if start < self._base else []
+        position = bisect_right(self._ends, start)
+        column = max(start, self._base)  # end of the text sliced so far
+        while position < len(self._texts):
+            segment_start = self._starts[position]
+            if segment_start > column:
+                parts.append(" " * (min(segment_start, stop) - column))
+            if segment_start >= stop:
+                break
+            parts.append(self._texts[position][max(start - segment_start, 0):
+                                               min(stop, self._ends[position]) - segment_start])
+            column = min(stop, self._ends[position])
+            position += 1
+        if self.release:
+            self._release(start)
+        return "".join(parts)
+
+    def _release(self, start):
+        count = bisect_right(self._ends, start - self.lookbehind)
+        if count:
+            self._base = self._ends[count - 1]
+            del self._texts[:count]
+            del self._starts[:count]
+            del self._ends[:count]
+            self._first += count
+
+
+def _display_segment(text):
+    return display_text(text.replace("\r", "").replace("\n", " "))
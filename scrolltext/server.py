@@ -0,0 +1,178 @@
+"""
+Frame server for remote viewers: the scrollers are rendered once per tick, like linescroller
+does, and the frames are broadcast to every client connected via TCP or a Unix socket.
+"""
+import asyncio
+from contextlib import suppress
+from scrolltext.linescroller import LineCompositor, _composite_frame, _create_scrollers
+from scrolltext.scheduler import create_frame_scheduler
+from scrolltext.utils import CLEAR, HOME, TermSize
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8023
+DEFAULT_COLS = 80
+DEFAULT_ROWS = 24
+READ_SIZE = 1024
+
+
+def server(cfg):
+    """
+    Main entry point for the server action. The optional section "server" configures the
+    server: host and port of the TCP socket, unix for the path of a Unix socket instead,
+    and cols and rows of the viewers' terminals.
+    :param cfg: Config object
+    :type: configparser.ConfigParser
+    """
+    try:
+        asyncio.run(serve(cfg))
+    except KeyboardInterrupt:
+        pass
+
+
+async def serve(cfg):
+    """
+    Starts the server and broadcasts frames, until cancelled.
+    :param cfg: Config object
+    :type: configparser.ConfigParser
+    """
+    options = cfg["server"] if cfg.has_section("server") else cfg["main"]
+    broadcaster = FrameBroadcaster()
+    if options.get("unix"):
+        listener = await asyncio.start_unix_server(broadcaster.handle_client,
+                                                   path=options["unix"])
+    else:
+        listener = await asyncio.start_server(broadcaster.handle_client,
+                                              options.get("host", DEFAULT_HOST),
+                                              options.getint("port", DEFAULT_PORT))
+    term_size = TermSize(options.getint("cols", DEFAULT_COLS),
+                         options.getint("rows", DEFAULT_ROWS))
+    async with listener:
+        await produce_frames(cfg, broadcaster, term_size)
+
+
+async def produce_frames(cfg, broadcaster, term_size):
+    """
+    Renders the scrollers of all "scrolltext.text %d" sections once per tick and publishes
+    every frame. When all scrollers have finished, they start over.
+    """
+    frame = FrameText()
+    compositor = LineCompositor(cfg, frame, complete_frames=True)
+    scheduler = create_frame_scheduler(cfg)
+    while True:
+        active = _create_scrollers(cfg, term_size)
+        while active:
+            _composite_frame(active, compositor, scheduler, term_size)
+            broadcaster.publish(frame.take())
+            await asyncio.sleep(scheduler.remaining())
+            scheduler.advance()
+
+
+class FrameText:
+    """
+    Text stream, which collects the text of one frame.
+    """
+    def __init__(self):
+        self._parts = []
+
+    def write(self, text):
+        """
+        Text stream interface.
+        :returns: Number of characters written
+        :rtype: int
+        """
+        self._parts.append(text)
+        return len(text)
+
+    def flush(self):
+        """
+        Text stream interface, nothing to do.
+        """
+
+    def take(self):
+        """
+        :returns: The text written since the previous call, encoded
+        :rtype: bytes
+        """
+        data = "".join(self._parts).encode("utf-8")
+        self._parts = []
+        return data
+
+
+class FrameBroadcaster:
+    """
+    Sends published frames to all connected clients. Every frame is encoded once and shared
+    by all clients. Each client holds at most one pending frame: a newer frame replaces the
+    pending one, thus a slow client drops frames instead of slowing down the frame production
+    or the other clients.
+    """
+    def __init__(self):
+        self.clients = set()
+
+    def publish(self, data):
+        """
+        :param data: One complete frame
+        :type data: bytes
+        """
+        for client in self.clients:
+            client.send(data)
+
+    async def handle_client(self, reader, writer):
+        """
+        Connection callback for asyncio.start_server. Input of the clients is ignored, the
+        connection is served until the client closes it.
+        """
+        client = FrameClient(writer)
+        self.clients.add(client)
+        sender = asyncio.create_task(client.run())
+        try:
+            while await reader.read(READ_SIZE):
+                pass
+        except ConnectionError:
+            pass
+        finally:
+            self.clients.discard(client)
+            sender.cancel()
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+
+class FrameClient:
+    """
+    A connected client with a drop-to-latest slot for the next frame. The screen of the client
+    is cleared before its first frame.
+    """
+    def __init__(self, writer):
+        """
+        :param writer: The client's stream
+        :type writer: asyncio.StreamWriter
+        """
+        self.writer = writer
+        self.dropped_frames = 0
+        self._latest = None
+        self._prefix = f"{CLEAR}{HOME}".encode("utf-8")
+        self._ready = asyncio.Event()
+
+    def send(self, data):
+        """
+        Replaces the pending frame, if any.
+        :type data: bytes
+        """
+        if self._latest is not None:
+            self.dropped_frames += 1
+        self._latest = data
+        self._ready.set()
+
+    async def run(self):
+        """
+        Writes the latest frame, whenever the previous one was written.
+        """
+        with suppress(ConnectionError):
+            while True:
+                await self._ready.wait()
+                self._ready.clear()
+                data, self._latest = self._prefix + self._latest, None
+                self._prefix = b""
+                self.writer.write(data)
+                await self.writer.drain()
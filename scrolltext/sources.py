@@ -0,0 +1,239 @@
+"""
+Lazy text sources for CharacterScroller, e.g. stdin, named pipes, files or any iterator of
+str chunks.
+"""
+from array import array
+import codecs
+import mmap
+import os
+import select
+import stat
+import sys
+from scrolltext.config import IS_WINDOWS
+
+
+CHUNK_SIZE = 4096
+LOOKBEHIND = 4096
+INDEX_STEP = 4096  # characters between two entries of the byte offset index of MappedText
+MAX_UTF8_BYTES = 4
+# invalid bytes are decoded to lone surrogates, which are displayed as replacement character
+_DISPLAY_TABLE = {ord("\n"): " ", **{code: "\ufffd" for code in range(0xDC80, 0xDD00)}}
+
+
+class StreamText:
+    """
+    A scroll text, which is read incrementally from an iterator of str chunks. It supports
+    len() and slicing with absolute indices, like a str, but only keeps a bounded window of
+    the text in memory. Text before the start of the last requested slice is released.
+
+    The chunk iterator may yield an empty str, when no data is available right now. The
+    requested slice is then padded with blanks, which become part of the text, thus text
+    arriving later is appended behind the blanks already shown.
+    """
+
+    def __init__(self, chunks, lookbehind=LOOKBEHIND):
+        """
+        :param chunks: Iterator of str chunks
+        :type chunks: iterable
+        :param lookbehind: Number of released characters kept, before the buffer is trimmed
+        :type lookbehind: int
+        """
+        self._chunks = iter(chunks)
+        self.lookbehind = lookbehind
+        self._buffer = ""
+        self._base = 0  # absolute index of the first character in _buffer
+        self.exhausted = False
+
+    def __len__(self):
+        """
+        :returns: Number of characters read, or padded, so far
+        :rtype: int
+        """
+        return self._base + len(self._buffer)
+
+    def __getitem__(self, key):
+        """
+        Slices the text using absolute indices. Released text can not be sliced again.
+
+        :rtype: str
+        """
+        if not isinstance(key, slice):
+            raise TypeError("StreamText only supports slicing")
+        start = key.start or 0
+        stop = key.stop if key.stop is not None else len(self)
+        self._fill(stop)
+        self._release(start)
+        return self._buffer[max(start - self._base, 0):max(stop - self._base, 0)]
+
+    def _fill(self, stop):
+        while len(self) < stop and not self.exhausted:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.exhausted = True
+            elif not chunk:
+                self._buffer += " " * (stop - len(self))
+            else:
+                self._buffer += chunk.replace("\r", "").replace("\n", " ")
+
+    def _release(self, start):
+        if start - self._base > self.lookbehind:
+            self._buffer = self._buffer[start - self._base:]
+            self._base = start
+
+
+class MappedText:
+    """
+    A scroll text, which is read from a memory mapped UTF-8 file. It supports len() and
+    slicing with absolute indices, like StreamText, but keeps no text in memory: A slice only
+    decodes the bytes of the requested characters. The pages of the file are cached by the
+    operating system, thus the memory use does not depend on the size of the file.
+
+    Characters are found with a sparse index, the byte offset of every INDEX_STEP-th
+    character. The index is extended on demand, while the text is scrolled, thus opening a
+    file is instant. len() is the number of characters indexed so far, like the number of
+    characters read of a StreamText.
+
+    Line breaks become blanks, carriage returns are skipped. Invalid bytes are displayed as
+    replacement character, each taking one column.
+    """
+
+    def __init__(self, fileobj):
+        """
+        :param fileobj: A regular file opened in binary mode, it is closed with the text
+        """
+        self._file = fileobj
+        size = os.fstat(fileobj.fileno()).st_size
+        self._data = (mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ) if size
+                      else b"")
+        if size and hasattr(self._data, "madvise"):
+            self._data.madvise(mmap.MADV_SEQUENTIAL)
+        self._offsets = array("q", [0])  # byte offset of every INDEX_STEP-th character
+        self._length = 0
+        self.exhausted = not size
+
+    def __len__(self):
+        """
+        :returns: Number of characters indexed so far
+        :rtype: int
+        """
+        return self._length
+
+    def __getitem__(self, key):
+        """
+        Slices the text using absolute indices.
+
+        :rtype: str
+        """
+        if not isinstance(key, slice):
+            raise TypeError("MappedText only supports slicing")
+        start = max(key.start or 0, 0)
+        stop = key.stop if key.stop is not None else len(self)
+        while len(self) < stop and not self.exhausted:
+            self._extend_index()
+        stop = min(stop, len(self))
+        if stop <= start:
+            return ""
+        step = start // INDEX_STEP
+        chars = self._decode(self._offsets[step], stop - step * INDEX_STEP)[0]
+        return chars[start - step * INDEX_STEP:].translate(_DISPLAY_TABLE)
+
+    def close(self):
+        """
+        Unmaps and closes the file.
+        """
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def _extend_index(self):
+        chars, text = self._decode(self._offsets[-1], INDEX_STEP)
+        if len(chars) < INDEX_STEP:
+            self._length += len(chars)
+            self.exhausted = True
+            return
+        self._offsets.append(self._offsets[-1] + len(text.encode("utf-8", "surrogateescape")))
+        self._length += INDEX_STEP
+
+    def _decode(self, offset, count):
+        """
+        Decodes up to count characters, starting at a character boundary.
+        :returns: The characters, and the decoded text including carriage returns
+        :rtype: tuple
+        """
+        size = count * MAX_UTF8_BYTES
+        while True:
+            data = self._data[offset:offset + size]
+            final = offset + size >= len(self._data)
+            text = codecs.utf_8_decode(data, "surrogateescape", final)[0]
+            chars = text.replace("\r", "")
+            if len(chars) >= count or final:
+                break
+            size *= 2  # more carriage returns than characters requested
+        if len(chars) > count:
+            # count characters and the carriage returns between them
+            end = count
+            while end - text.count("\r", 0, end) < count:
+                end = count + text.count("\r", 0, end)
+            text = text[:end]
+            chars = text.replace("\r", "")
+        return chars, text
+
+
+def read_chunks(fileobj, chunk_size=CHUNK_SIZE):
+    """
+    Generator, which reads UTF-8 encoded chunks from a file, pipe or stdin without blocking.
+    An empty str is yielded, when no data is available right now.
+
+    :param fileobj: File like object, which provides a fileno
+    :param chunk_size: Maximum number of bytes read at once
+    :type chunk_size: int
+    """
+    fd = fileobj.fileno()  # pylint: disable=invalid-name ## C103
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        if not IS_WINDOWS and not select.select([fd], [], [], 0)[0]:
+            yield ""
+            continue
+        data = os.read(fd, chunk_size)
+        if not data:
+            break
+        yield decoder.decode(data)
+    rest = decoder.decode(b"", final=True)
+    if rest:
+        yield rest
+
+
+def open_source(name):
+    """
+    Opens a text source. "-" selects stdin. When stdin is used, the terminal is re-opened as
+    stdin, so keypresses can still be read by the scrollers.
+
+    :param name: Path of a file or named pipe, or "-"
+    :type name: str
+    :returns: A file object opened in binary mode
+    :raises OSError: If the file can not be opened, or there is no terminal for stdin
+    """
+    if name != "-":
+        return open(name, "rb")  # pylint: disable=consider-using-with ## R1732
+    source = os.fdopen(os.dup(sys.stdin.fileno()), "rb")
+    if not IS_WINDOWS and not sys.stdin.isatty():
+        try:
+            tty_fd = os.open("/dev/tty", os.O_RDWR)
+        except OSError:
+            source.close()  # without a terminal, keypresses can not be read
+            raise
+        os.dup2(tty_fd, sys.stdin.fileno())
+        os.close(tty_fd)
+    return source
+
+
+def create_stream_text(name):
+    """
+    :param name: Path of a file or named pipe, or "-" for stdin
+    :type name: str
+    :returns: A MappedText for regular files, a StreamText otherwise
+    """
+    source = open_source(name)
+    if stat.S_ISREG(os.fstat(source.fileno()).st_mode):
+        return MappedText(source)
+    return StreamText(read_chunks(source))
@@ -0,0 +1,168 @@
+"""
+Opt-in per-frame timing instrumentation, enabled with VERBOSE=1 or "verbose = 1" in [main].
+"""
+from collections import deque
+import sys
+from time import perf_counter
+
+
+DEFAULT_WINDOW = 2000
+DEFAULT_STATS_INTERVAL = 10.
+PERCENTILES = (50, 95, 99)
+
+
+def create_frame_stats(cfg, period):
+    """
+    :param cfg: Config object, uses the options verbose, stats_file and stats_interval
+                in section main
+    :type: configparser.ConfigParser
+    :param period: Target frame period in seconds
+    :type period: float
+    :returns: FrameStats when verbose is set, a NullStats otherwise
+    """
+    if not cfg["main"].getboolean("verbose", False):
+        return NullStats()
+    return FrameStats(period, cfg["main"].get("stats_file", ""),
+                      cfg["main"].getfloat("stats_interval", DEFAULT_STATS_INTERVAL))
+
+
+def percentile(samples, percent):
+    """
+    :param samples: Sorted samples
+    :type samples: list
+    :param percent: 0..100
+    :type percent: int
+    :returns: Nearest-rank percentile, 0 for no samples
+    """
+    if not samples:
+        return 0.
+    index = min(int(len(samples) * percent / 100), len(samples) - 1)
+    return samples[index]
+
+
+class FrameStats:  # pylint: disable=R0902  # disable (too-many-instance-attributes)
+    """
+    Records per-stage timings of every frame in rolling windows: frame interval, jitter
+    (deviation of the interval from the target period) and the time spent in each stage,
+    e.g. next, colors, write and wait. It also counts duplicate positions (a frame showing
+    the same position as the previous one) and dropped positions (positions skipped).
+    """
+
+    def __init__(self, period, stats_file="", interval=DEFAULT_STATS_INTERVAL,
+                 window=DEFAULT_WINDOW):
+        """
+        :param period: Target frame period in seconds
+        :type period: float
+        :param stats_file: When given, the summary is written to this file every interval
+        :type stats_file: str
+        :param interval: Seconds between writes of the stats file
+        :type interval: float
+        :param window: Number of frames kept in the rolling windows
+        :type window: int
+        """
+        self.period = period
+        self.stats_file = stats_file
+        self.interval = interval
+        self.window = window
+        self.histograms = {"interval": deque(maxlen=window), "jitter": deque(maxlen=window)}
+        self.frames = 0
+        self.duplicate_positions = 0
+        self.dropped_positions = 0
+        self._positions = {}
+        self._frame_start = None
+        self._mark = perf_counter()
+        self._last_dump = self._mark
+
+    def next_frame(self):
+        """
+        Marks the boundary between two frames, call it before the first frame and after each
+        frame. Records the interval since the previous boundary and writes the stats file,
+        when the stats interval has elapsed.
+        """
+        now = perf_counter()
+        if self._frame_start is not None:
+            interval = now - self._frame_start
+            self.histograms["interval"].append(interval)
+            self.histograms["jitter"].append(abs(interval - self.period))
+            self.frames += 1
+        self._frame_start = now
+        self._mark = now
+        if self.stats_file and now - self._last_dump >= self.interval:
+            self._last_dump = now
+            self.dump(self.stats_file)
+
+    def mark(self, stage):
+        """
+        Records the time since the previous mark, or the frame boundary, as time spent in
+        stage.
+        :param stage: Name of the stage, e.g. "next"
+        :type stage: str
+        """
+        now = perf_counter()
+        if stage not in self.histograms:
+            self.histograms[stage] = deque(maxlen=self.window)
+        self.histograms[stage].append(now - self._mark)
+        self._mark = now
+
+    def position(self, key, pos):
+        """
+        Records the position of a scroller after a frame.
+        :param key: Identifies the scroller
+        :param pos: Current position
+        :type pos: int
+        """
+        last = self._positions.get(key)
+        self._positions[key] = pos
+        if last is None:
+            return
+        delta = abs(pos - last)
+        if delta == 0:
+            self.duplicate_positions += 1
+        elif delta > 1:
+            self.dropped_positions += delta - 1
+
+    def summary(self):
+        """
+        :returns: Percentiles of every histogram in milliseconds, and the position counters
+        :rtype: str
+        """
+        lines = [f"frames: {self.frames}, duplicate positions: {self.duplicate_positions}, "
+                 f"dropped positions: {self.dropped_positions}"]
+        for name, samples in self.histograms.items():
+            ordered = sorted(samples)
+            values = ", ".join(f"p{percent} {percentile(ordered, percent) * 1000:.3f}"
+                               for percent in PERCENTILES)
+            lines.append(f"{name:<10} {values} ms")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, stats_file):
+        """
+        Writes the summary to a file, replacing the previous summary.
+        """
+        with open(stats_file, "w", encoding="utf-8") as stats:
+            stats.write(self.summary())
+
+    def print_summary(self):
+        """
+        Prints the summary to stderr, and writes the stats file if configured.
+        """
+        print(self.summary(), end="", file=sys.stderr)
+        if self.stats_file:
+            self.dump(self.stats_file)
+
+
+class NullStats:
+    """
+    Does nothing, used when instrumentation is disabled.
+    """
+    def next_frame(self):
+        """ Does nothing """
+
+    def mark(self, stage):
+        """ Does nothing """
+
+    def position(self, key, pos):
+        """ Does nothing """
+
+    def print_summary(self):
+        """ Does nothing """
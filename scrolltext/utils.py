@@ -1,11 +1,19 @@
 """
 Utilities for line-based text scrollers.
 """
+import shutil
+import signal
 import sys
 from os import getenv
-from time import time
+from time import monotonic
+from scrolltext.banner import BannerFont, banner_rows
+from scrolltext.config import ConfigWatcher, get_cache_path, get_config_path
 from scrolltext.config import get_speedsec_float, init_config
 from scrolltext.config import IS_WINDOWS  # pylint: disable=no-name-in-module (W0611)
+from scrolltext.display import DisplayText, display_text
+from scrolltext.scheduler import FrameScheduler, get_fps
+from scrolltext.segments import SegmentedText
+from scrolltext.sources import create_stream_text
 
 
 EARLY_VERBOSE = getenv("VERBOSE")
@@ -14,6 +22,7 @@ HOME = "\033[H"
 BOLD = "\033[1m"
 NORMAL = "\033[0m"
 UP_ONE_ROW = "\033[1A"
+ENDLESS_GAP = "    "
 
 
 def parse_int(var):
@@ -43,6 +52,37 @@ def init_utils(write_config):
     return cfg
 
 
+def create_config_watcher(cfg):
+    """
+    :param cfg: Config object, the option "reload" in section main switches off reloading
+    :type: configparser.ConfigParser
+    :returns: A ConfigWatcher of the config file, None if reloading is switched off
+    """
+    if not cfg["main"].getboolean("reload", True):
+        return None
+    return ConfigWatcher(get_config_path(), cache_path=get_cache_path())
+
+
+def reload_config(watcher, scrollers):
+    """
+    Applies a changed config file to the running scrollers. Environment variables still
+    override the config file, they are reported at startup only.
+    :param watcher: See create_config_watcher
+    :type watcher: ConfigWatcher
+    :returns: True, if the config was reloaded
+    :rtype: bool
+    """
+    if watcher is None:
+        return False
+    cfg = watcher.poll()
+    if cfg is None:
+        return False
+    _override_from_env(cfg, verbose=False)
+    for scroller in scrollers:
+        scroller.apply_config(cfg)
+    return True
+
+
 def get_linenum(scroll_line_str, min_row, max_row):
     """
     :param scroll_line_str: Terminal line number for one scrolling text
@@ -65,21 +105,26 @@ def get_linenum(scroll_line_str, min_row, max_row):
     return line
 
 
-def _override_from_env(cfg):
-    _override_verbose(cfg)
-    _override_scroll_box(cfg)
+def _override_from_env(cfg, verbose=True):
+    """
+    :param verbose: Report the used environment variables, if VERBOSE is set
+    :type verbose: bool
+    """
+    verbose = verbose and EARLY_VERBOSE
+    _override_verbose(cfg, verbose)
+    _override_scroll_box(cfg, verbose)
     _override_scroll_direction(cfg)
     _override_scroll_text(cfg)
-    _override_scroll_line(cfg)
-    _override_scroll_speed(cfg)
+    _override_scroll_line(cfg, verbose)
+    _override_scroll_speed(cfg, verbose)
 
 
-def _override_verbose(cfg):
-    _check_and_override_boolean_var(cfg, "VERBOSE", ["main", "verbose"])
+def _override_verbose(cfg, verbose):
+    _check_and_override_boolean_var(cfg, "VERBOSE", ["main", "verbose"], verbose=verbose)
 
 
-def _override_scroll_box(cfg):
-    _check_and_override_boolean_var(cfg, "SCROLL_BOX", ["cursestext", "box"])
+def _override_scroll_box(cfg, verbose):
+    _check_and_override_boolean_var(cfg, "SCROLL_BOX", ["cursestext", "box"], verbose=verbose)
 
 
 def _override_scroll_direction(cfg):
@@ -94,25 +139,25 @@ def _override_scroll_text(cfg):
         cfg["scrolltext.text 1"]["text"] = scroll_text
 
 
-def _override_scroll_line(cfg):
+def _override_scroll_line(cfg, verbose):
     scroll_line_str = getenv("SCROLL_LINE")
     if scroll_line_str:
-        if EARLY_VERBOSE:
+        if verbose:
             print("Using env-var 'SCROLL_LINE_STR'", file=sys.stderr)
         cfg["scrolltext.text 1"]["line"] = scroll_line_str
 
 
-def _override_scroll_speed(cfg):
+def _override_scroll_speed(cfg, verbose):
     scroll_speed = getenv("SCROLL_SPEED")
     if scroll_speed:
         scroll_speed_index = parse_int(getenv("SCROLL_SPEED"))
-        if EARLY_VERBOSE:
+        if verbose:
             # pylint: disable=C0209  (consider-using-f-string)
             print("Using env-var 'SCROLL_SPEED' with '{}'".format(scroll_speed), file=sys.stderr)
         cfg["scrolltext.text 1"]["speed"] = str(scroll_speed_index)
 
 
-def _check_and_override_boolean_var(cfg, var_name, *args):
+def _check_and_override_boolean_var(cfg, var_name, *args, verbose=EARLY_VERBOSE):
     env_value = getenv(var_name)
     if env_value is None:
         return
@@ -121,17 +166,61 @@ def _check_and_override_boolean_var(cfg, var_name, *args):
 
     section, option = args[0][0], args[0][1]
     if env_value == "1":
-        if EARLY_VERBOSE:
+        if verbose:
             # pylint: disable=C0209  (consider-using-f-string)
             print("Using env-var '{}' = {}".format(var_name, env_value), file=sys.stderr)
         cfg.set(section, option, "1")
     else:
-        if EARLY_VERBOSE:
+        if verbose:
             # pylint: disable=C0209  (consider-using-f-string)
             print("Assuming env-var '{}'={} is False".format(var_name, env_value), file=sys.stderr)
         cfg.set(section, option, "0")
 
 
+def create_scroller(cfg, term_size, **argv):
+    """
+    :param argv: See CharacterScroller
+    :returns: A BannerScroller, if the option "banner" of the scroller's section is set, a
+              CharacterScroller otherwise
+    """
+    section_index = str(argv["section_index"]) if "section_index" in argv else "1"
+    if cfg["scrolltext.text " + section_index].getboolean("banner", False):
+        return BannerScroller(cfg, term_size, **argv)
+    return CharacterScroller(cfg, term_size, **argv)
+
+
+def text_rows(scroller, text):
+    """
+    :param text: The visible text given by the scroller's next
+    :returns: Pairs of terminal line and the text of that line, one per row of the scroller
+    :rtype: list
+    """
+    if scroller.height == 1:
+        return [(scroller.line, text)]
+    return list(enumerate(text, scroller.line))
+
+
+def next_texts(scrollers):
+    """
+    Advances all scrollers by one frame. Finished scrollers are removed from the given list,
+    their last text is blank, which clears their rows.
+    :param scrollers: Active scrollers
+    :type scrollers: list
+    :returns: Pairs of scroller and its visible text
+    :rtype: list
+    """
+    texts = []
+    for scroller in list(scrollers):
+        text = scroller.next()
+        if text is None:
+            scrollers.remove(scroller)
+            text = " " * scroller.visible_text_length
+            if scroller.height > 1:
+                text = (text,) * scroller.height
+        texts.append((scroller, text))
+    return texts
+
+
 class TermSize:
     """
     Stores terminal columns and rows
@@ -177,10 +266,66 @@ class TermSize:
         return self.term_rows
 
 
+class WatchedTermSize(TermSize):
+    """
+    TermSize of the controlling terminal. While watching, the size is only queried again after
+    the terminal sent SIGWINCH, thus checking for a resize does no system call in steady
+    state. Without SIGWINCH, e.g. on Windows or outside of the main thread, the size is
+    queried on every update.
+    """
+    def __init__(self):
+        super().__init__(0, 0)
+        self._changed = True
+        self._watching = False
+        self._previous_handler = None
+        self.update()
+
+    def start(self):
+        """
+        Installs the SIGWINCH handler.
+        """
+        try:
+            self._previous_handler = signal.signal(signal.SIGWINCH, self._on_sigwinch)
+            self._watching = True
+        except (AttributeError, ValueError):  # no SIGWINCH, or not in the main thread
+            self._watching = False
+
+    def stop(self):
+        """
+        Restores the previous SIGWINCH handler.
+        """
+        if self._watching:
+            previous = self._previous_handler
+            signal.signal(signal.SIGWINCH, previous if previous is not None else signal.SIG_DFL)
+            self._watching = False
+
+    def update(self):
+        """
+        Queries the terminal size, if it might have changed.
+
+        :returns: True, when columns or rows changed since the previous update
+        :rtype: bool
+        """
+        if self._watching and not self._changed:
+            return False
+        self._changed = False
+        columns, rows = shutil.get_terminal_size()
+        columns -= 1 if IS_WINDOWS else 0
+        changed = (columns, rows) != (self.term_columns, self.term_rows)
+        self.set_size(columns, rows)
+        return changed
+
+    def _on_sigwinch(self, signum, frame):
+        self._changed = True
+        if callable(self._previous_handler):
+            self._previous_handler(signum, frame)
+
+
 class CharacterScroller:  # pylint: disable=R0902  # disable (too-many-instance-attributes)
     """
     Utility class  for all character based text-scrollers.
     """
+    height = 1  # terminal rows of the visible text
 
     def __init__(self, cfg, term_size, **argv):
         """Objects init method.
@@ -190,6 +335,9 @@ class CharacterScroller:  # pylint: disable=R0902  # disable (too-many-instance-
         :type: TermSize
         :param argv["section_index"]: Number of scrolltext.text section in use [1..3]
         :param argv["min_scroll_line"]: The minimum terminal row allowed
+        :param argv["source"]: Optional lazy text source, e.g. a StreamText, used instead
+                               of the configured text. Stream sources are always scrolled
+                               left-to-right and never endless.
         :param argv["test"]: Only used in unit tests
         """
         self.term_size = term_size
@@ -198,40 +346,329 @@ class CharacterScroller:  # pylint: disable=R0902  # disable (too-many-instance-
 
         section_index = str(argv["section_index"]) if "section_index" in argv else "1"
         str_section = "scrolltext.text " + section_index
-        self.scroll_text = cfg[str_section]["text"]
+        self.section = str_section
+        # positions and lengths are terminal columns, see DisplayText
+        self.scroll_text = display_text(cfg[str_section]["text"])
         self.scroll_line_str = cfg[str_section]["line"]
         scroll_direction = cfg[str_section].getboolean("direction")
+        source = argv["source"] if "source" in argv else None
+        if source is None and cfg[str_section].get("source"):
+            source = create_stream_text(cfg[str_section]["source"])
+        if source is not None:
+            self.scroll_text = source
+            self.endless = False
+            scroll_direction = False
 
         self.visible_text_length = -1
-        self._resized(**argv)
-
-        self._update_complete_text()
+        self.num_blanks = 0
+        self.right_to_left = scroll_direction
         self.pos = 0
+        self._pos_real = 0.
         self._last_pos = 0
-        self.terminal_pos = len(self.complete_text)
-        self.right_to_left = scroll_direction
+        self.shifted = 0  # sum of the seamless position shifts, see _shift
+        self.text_start = 0  # virtual column of the last visible text, see _set_start_params
+        self._cycles = []  # column, offset and text of changed texts ahead, see _change_text
+        self._resized(**argv)
+
         if "test" in argv:
             self.scrollspeedsec = 0
         else:
             self.scrollspeedsec = get_speedsec_float(cfg[str_section].getint("speed"))
         self._set_start_params()
-        self.last_time = time()
-        self._text = self.complete_text
+        self.last_time = monotonic()
+        self._text = ""
+        self._fps = get_fps(cfg)
+        self._frame_scheduler = None
 
     def __iter__(self):
         return iter(self.next, None)
 
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        """
+        Gives the next visible text, after awaiting the next frame deadline. The first text
+        is given immediately.
+
+        :returns: A str object of visible text length
+        :rtype: str
+        """
+        if self._frame_scheduler is None:
+            self._frame_scheduler = FrameScheduler(self._fps)
+        else:
+            import asyncio  # pylint: disable=import-outside-toplevel (C0415)
+            await asyncio.sleep(self._frame_scheduler.remaining())
+            self._frame_scheduler.advance()
+        text = self.next()
+        if text is None:
+            raise StopAsyncIteration
+        return text
+
+    def apply_config(self, cfg):
+        """
+        Applies text, speed and direction of the scroller's section of a reloaded config, in
+        place. The scroll position is kept, thus the visible text continues where it is, as
+        far as the new text allows. The text and direction of stream sources are kept, like
+        the text of a scroller, whose segments were changed, see append_text.
+        :param cfg: Validated config object
+        :type: configparser.ConfigParser
+        """
+        if self.section not in cfg:
+            return
+        section = cfg[self.section]
+        self._apply_speed(section)
+        if self.is_stream():
+            return
+        text = display_text(section["text"])
+        if str(text) != str(self.scroll_text):
+            self.scroll_text = text
+            self._keep_position()
+        self._apply_direction(section)
+
+    def _apply_speed(self, section):
+        if self.scrollspeedsec != 0:  # zero in tests
+            self.scrollspeedsec = get_speedsec_float(section.getint("speed"))
+
+    def _apply_direction(self, section):
+        right_to_left = section.getboolean("direction")
+        if right_to_left != self.right_to_left:
+            # the window is [pos, pos + width) left-to-right and [pos - width, pos) otherwise
+            self.right_to_left = right_to_left
+            self._shift(self.visible_text_length if right_to_left
+                        else -self.visible_text_length)
+            self._keep_position()
+
+    def _keep_position(self):
+        """
+        Moves the position into the range of the current text, e.g. after it got shorter.
+        In endless mode whole cycles are skipped, which does not change the visible text.
+        """
+        cycle_length = len(self.scroll_text) + len(ENDLESS_GAP)
+        if self.endless and not self.right_to_left:
+            excess = self.pos - self.num_blanks
+            if excess >= cycle_length:
+                self._shift(-(excess // cycle_length) * cycle_length)
+        elif self.endless:
+            excess = self.pos - self._virtual_length()
+            if excess > 0:
+                self._shift(-((excess - 1) // cycle_length + 1) * cycle_length)
+        if not self.right_to_left:
+            self._shift(max(-self.pos, 0))
+        else:
+            self._shift(min(self._virtual_length() - self.pos, 0))
+
     def _resized(self, **argv):
+        self._term_rows = self.term_size.get_rows()
         self.line = get_linenum(self.scroll_line_str,
                                 self.min_scroll_line, self.term_size.get_rows())
         if self.term_size.get_cols() != self.visible_text_length:
             self.visible_text_length = self.term_size.get_cols()
-            self.num_blanks = argv["blanks"] if "blanks" in argv else self.visible_text_length
-            self._update_complete_text()
+            num_blanks = argv["blanks"] if "blanks" in argv else self.visible_text_length
+            self._shift(num_blanks - self.num_blanks)  # keeps the text at its position
+            self.num_blanks = num_blanks
+
+    def is_stream(self):
+        """
+        :returns: True, if the text is read from a lazy source, e.g. a StreamText, or is
+                  changed while scrolling, see append_text. A reloaded config does not
+                  change the text of a stream, see apply_config.
+        :rtype: bool
+        """
+        return not isinstance(self.scroll_text, (str, DisplayText))
 
-    def _update_complete_text(self):
-        blanks = self.num_blanks * " "
-        self.complete_text = blanks + self.scroll_text + (blanks if not self.endless else "    ")
+    def append_text(self, text):
+        """
+        Appends a segment to the scroll text, while the scroller runs. The visible text is not
+        changed, the segment is scrolled in after the current text, but not before the edge
+        of the window. In endless mode the cycles on screen keep their text, see _change_text.
+        :param text: The new segment
+        :type text: str
+        :returns: Index of the segment, see replace_text. The initial text is segment 0.
+        :rtype: int
+        """
+        segmented = self._segmented_text()
+        if self.endless:
+            length = len(self._changed_text())
+            return self._change_text(length, length, lambda changed: changed.append(text))
+        column = self.text_start - self.num_blanks  # left edge of the window
+        length = len(segmented)
+        if self.right_to_left and column >= length:
+            # the text end is not reached yet, it moves together with the window
+            index = segmented.append(text)
+            self._shift(len(segmented) - length)
+            return index
+        return segmented.append(text, column + self.visible_text_length)
+
+    def replace_text(self, index, text):
+        """
+        Replaces a segment of the scroll text, while the scroller runs. The visible text is not
+        changed, the text at and right of it keeps its position. In endless mode the cycles on
+        screen keep their text, see _change_text.
+        :param index: Index of the segment, as returned by append_text
+        :type index: int
+        :param text: The new segment
+        :type text: str
+        """
+        segmented = self._segmented_text()
+        if not self.endless:
+            # right-to-left the text ahead is left of the window, the window follows it
+            self._shift(segmented.replace(index, text, self.text_start - self.num_blanks))
+            return
+        start, end = self._changed_text().span(index)
+        self._change_text(start, end, lambda changed: changed.replace(index, text))
+
+    def _changed_text(self):
+        """
+        :returns: The text of the last cycles, i.e. the text, which is changed next
+        :rtype: SegmentedText
+        """
+        return self._cycles[-1][2] if self._cycles else self.scroll_text
+
+    def _change_text(self, start, end, change):
+        """
+        Changes the repeated text of endless mode, without changing the visible text: The
+        cycles, which are visible already, keep their text. The changed text starts at the
+        edge of the window, in the column of the cycle it would have there, and all cycles
+        ahead of it are made of the changed text, see _window.
+        :param start: Start column of the changed columns in the text
+        :type start: int
+        :param end: End column of the changed columns in the text
+        :type end: int
+        :param change: Changes the given text in place and returns its result
+        :type change: callable
+        :returns: The result of change
+        """
+        column, offset, text = self._cycles[-1] if self._cycles else (0, 0, self.scroll_text)
+        left = self.text_start - self.num_blanks  # the window, relative to the text
+        right = left + self.visible_text_length
+        if not self._cycles and self.right_to_left and left >= len(text):
+            # the text end is not reached yet, it moves together with the window
+            length = len(text)
+            result = change(text)
+            self._shift(len(text) - length)
+            return result
+        if self.right_to_left:
+            visible = not self._cycles or column > left
+        else:
+            visible = column < right
+        if visible:
+            edge = left if self.right_to_left else right
+            offset = (edge - column + offset) % (len(text) + len(ENDLESS_GAP))
+            column = edge
+            text = text.copy()
+        if start < offset < end:  # the edge must not split the changed columns
+            column += start - offset if self.right_to_left else end - offset
+            offset = start if self.right_to_left else end
+        length = len(text)
+        result = change(text)
+        # the changed columns are ahead of the edge, the text behind it keeps its offset
+        if offset >= end if self.right_to_left else offset > start:
+            offset += len(text) - length
+        if visible:
+            self._cycles.append((column, offset, text))
+        elif self._cycles:
+            self._cycles[-1] = (column, offset, text)
+        return result
+
+    def _segmented_text(self):
+        if not isinstance(self.scroll_text, SegmentedText):
+            if self.is_stream():
+                raise TypeError("The text of a stream source can not be changed")
+            # scrolled out segments are only needed again, when the text repeats or
+            # scrolls right-to-left. The repeated text is sliced relative to its start, the
+            # text ahead of a right-to-left window is left of it, see replace_text.
+            self.scroll_text = SegmentedText([str(self.scroll_text)],
+                                             release=not self.endless and not self.right_to_left,
+                                             fixed=self.endless or self.right_to_left)
+        return self.scroll_text
+
+    @property
+    def message(self):
+        """
+        :returns: The scroll text, which identifies the frames of the scroller together with
+                  its width and direction, None if the text is not a plain str, i.e. has
+                  characters wider or narrower than one column or changes while scrolling
+        :rtype: str
+        """
+        return self.scroll_text if isinstance(self.scroll_text, str) else None
+
+    def cycle_range(self):
+        """
+        :returns: The virtual range [start, end), which covers the visible texts of one pass,
+                  or of one cycle in endless mode, see _window
+        :rtype: tuple
+        """
+        if not self.endless:
+            return 0, self._virtual_length()
+        cycle_length = len(self.scroll_text) + len(ENDLESS_GAP)
+        if not self.right_to_left:
+            # the position is shifted back, before it reaches num_blanks + cycle_length
+            return 0, self.num_blanks + cycle_length - 1 + self.visible_text_length
+        # the position is shifted forth, before it reaches num_blanks - len(ENDLESS_GAP)
+        return (self.num_blanks - len(ENDLESS_GAP) + 1 - self.visible_text_length,
+                self._virtual_length())
+
+    def text_range(self, start, end):
+        """
+        :returns: The virtual range [start:end] of the blank padded scroll text, see _window,
+                  e.g. for rendering the frames of a whole cycle
+        :rtype: str
+        """
+        return self._window(start, end)
+
+    def _virtual_length(self):
+        """
+        Length of the scroll text including the leading and trailing blanks. The blanks are
+        virtual, i.e. they are never stored together with the scroll text.
+        """
+        return 2 * self.num_blanks + len(self.scroll_text)
+
+    def _visible(self, start, end):
+        """
+        :returns: The visible text of the virtual range [start:end], see _window
+        """
+        return self._window(start, end)
+
+    def _window(self, start, end, scroll_text=None):
+        """
+        Returns the virtual slice [start:end] of the blank padded scroll text. The scroll text
+        starts at index num_blanks. In endless mode the scroll text repeats, separated by
+        ENDLESS_GAP, to the right (left-to-right) or to the left (right-to-left) respectively.
+
+        :param scroll_text: Sliced instead of the scroll text, it must have the same length
+        :rtype: str
+        """
+        scroll_text = scroll_text if scroll_text is not None else self.scroll_text
+        text_start = self.num_blanks
+        if not self.endless:
+            start = max(start, 0)
+            # slice first, lazy sources may grow when sliced
+            text = scroll_text[max(start - text_start, 0):max(end - text_start, 0)]
+            text_end = text_start + len(scroll_text)
+            end = min(end, text_end + self.num_blanks)
+            return (_blanks(start, min(end, text_start)) + text
+                    + _blanks(max(start, text_end), end))
+        cycles = [(0, 0, scroll_text)] + self._cycles
+        if not self.right_to_left:
+            start = max(start, 0)
+            parts = [_blanks(start, min(end, text_start))]
+            for index, (column, offset, text) in enumerate(cycles):
+                lower = max(start, text_start + column)
+                upper = end if index + 1 == len(cycles) else text_start + cycles[index + 1][0]
+                parts.append(_cycle_slice((text, ENDLESS_GAP), lower - text_start - column + offset,
+                                          min(end, upper) - lower))
+            return "".join(parts)
+        text_end = text_start + len(scroll_text)
+        end = min(end, text_end + self.num_blanks)
+        parts = [_blanks(max(start, text_end), end)]
+        for index, (column, offset, text) in enumerate(cycles):
+            lower = start if index + 1 == len(cycles) else text_start + cycles[index + 1][0]
+            upper = min(end, text_end if index == 0 else text_start + column)
+            lower = max(start, lower)
+            parts.append(_cycle_slice((text, ENDLESS_GAP), lower - text_start - column + offset,
+                                      upper - lower))
+        return "".join(reversed(parts))
 
     def next(self):
         """
@@ -240,7 +677,9 @@ class CharacterScroller:  # pylint: disable=R0902  # disable (too-many-instance-
         :returns: A str object of visible text length
         :rtype: str
         """
-        if self.term_size.is_resized():
+        # several scrollers may share one TermSize, so each one checks the size itself
+        if (self.term_size.get_cols() != self.visible_text_length
+                or self.term_size.get_rows() != self._term_rows):
             self._resized()
         if not self.right_to_left:
             return self._next_left_to_right()
@@ -254,16 +693,19 @@ class CharacterScroller:  # pylint: disable=R0902  # disable (too-many-instance-
         :returns: A str object of visible text length
         :rtype: str
         """
-        if self.pos >= self.terminal_pos:
-            if not self.endless:
-                return None
-            self._set_start_params()
-        end = self.pos + self.visible_text_length
-        win_text = self.complete_text[self.pos:end]
+        if not self.endless and self.pos >= self._virtual_length():
+            return None
+        cycle_length = len(self.scroll_text) + len(ENDLESS_GAP)
+        if self.endless and self._cycles:
+            self._enter_changed_text()
+        elif self.endless and self.pos >= self.num_blanks + cycle_length:
+            self._shift(-cycle_length)  # seamless, the window shows the same text
+        self.text_start = max(self.pos, 0)
+        win_text = self._visible(self.pos, self.pos + self.visible_text_length)
         if self.scrollspeedsec == 0:  # Special case for tests
             self.pos += 1
             return win_text
-        time_now = time()
+        time_now = monotonic()
         delta = time_now - self.last_time
         self.last_time = time_now
         offset = delta / self.scrollspeedsec
@@ -282,16 +724,21 @@ class CharacterScroller:  # pylint: disable=R0902  # disable (too-many-instance-
         :returns: A str object of visible text length
         :rtype: str
         """
-        if self.pos <= self.terminal_pos:
-            if not self.endless:
-                return None
-            self._set_start_params()
-        start = self.pos - self.visible_text_length
-        win_text = self.complete_text[start:self.pos]
+        if not self.endless and self.pos < 0:
+            return None
+        cycle_length = len(self.scroll_text) + len(ENDLESS_GAP)
+        if self.endless and self._cycles:
+            self._enter_changed_text()
+        elif self.endless and self.pos <= self.num_blanks - len(ENDLESS_GAP):
+            self._shift(cycle_length)  # seamless, the window shows the same text
+        self.text_start = self.pos - self.visible_text_length
+        if not self.endless:
+            self.text_start = max(self.text_start, 0)
+        win_text = self._visible(self.pos - self.visible_text_length, self.pos)
         if self.scrollspeedsec == 0:  # Special case for tests
             self.pos -= 1
             return win_text
-        time_now = time()
+        time_now = monotonic()
         delta = time_now - self.last_time
         self.last_time = time_now
         offset = delta / self.scrollspeedsec
@@ -302,14 +749,133 @@ class CharacterScroller:  # pylint: disable=R0902  # disable (too-many-instance-
         self._text = win_text
         return self._text
 
+    def _enter_changed_text(self):
+        """
+        Makes the changed text of endless mode the scroll text, as soon as the window only
+        shows cycles of it, see _change_text. The position is shifted seamlessly.
+        """
+        while self._cycles:
+            column, offset, text = self._cycles[0]
+            if self.right_to_left:
+                # the window ends at the position
+                if self.pos > self.num_blanks + column:
+                    return
+                shift = offset - column
+                if self.pos + shift > self.num_blanks + len(text):  # beyond the text end
+                    shift -= len(text) + len(ENDLESS_GAP)
+            else:
+                if self.pos < self.num_blanks + column:
+                    return
+                shift = offset - column
+            self.scroll_text = text
+            self._cycles = [(column + shift, offset, text)
+                            for column, offset, text in self._cycles[1:]]
+            self._shift(shift)
+
+    def _shift(self, offset):
+        self.shifted += offset
+        self.pos += offset
+        self.text_start += offset
+        self._pos_real += offset
+        self._last_pos += offset
+
     def _set_start_params(self):
         if not self.right_to_left:
             self.pos = 0
-            self.terminal_pos = len(self.complete_text)
             self._pos_real = 0.
             self._last_pos = 0
         else:
-            self.pos = len(self.complete_text)
-            self.terminal_pos = -1
+            self.pos = self._virtual_length()
             self._pos_real = float(self.pos)
             self._last_pos = self.pos
+        self.text_start = self.pos - (self.visible_text_length if self.right_to_left else 0)
+
+
+class BannerScroller(CharacterScroller):
+    """
+    Scrolls the configured text in block letters, see scrolltext.banner, column by column.
+    The position is kept in columns of the top row, all rows are sliced at the same columns.
+    next gives a tuple with the visible text of every row.
+    """
+    def __init__(self, cfg, term_size, **argv):
+        """
+        :param argv: See CharacterScroller
+        :raises TypeError: If a source is given, it is not supported
+        """
+        section_index = str(argv["section_index"]) if "section_index" in argv else "1"
+        source = argv["source"] if "source" in argv else None
+        if source is not None or cfg["scrolltext.text " + section_index].get("source"):
+            raise TypeError("A banner can not be scrolled from a source")
+        font = BannerFont()
+        self.height = font.height
+        super().__init__(cfg, term_size, **argv)
+        self.rows = banner_rows(cfg[self.section]["text"], font)
+        self.scroll_text = self.rows[0]
+        self._set_start_params()
+
+    def apply_config(self, cfg):
+        """
+        Applies text, speed and direction of a reloaded config, like
+        CharacterScroller.apply_config. The rows of a changed text are drawn anew.
+        :param cfg: Validated config object
+        :type: configparser.ConfigParser
+        """
+        if self.section not in cfg:
+            return
+        section = cfg[self.section]
+        self._apply_speed(section)
+        if section["text"] != self.rows[0].text:
+            self.rows = banner_rows(section["text"], self.rows[0].font)
+            self.scroll_text = self.rows[0]
+            self._keep_position()
+        self._apply_direction(section)
+
+    @property
+    def message(self):
+        return None  # the rows are rendered live
+
+    def _visible(self, start, end):
+        return tuple(self._window(start, end, row) for row in self.rows)
+
+    def _resized(self, **argv):
+        super()._resized(**argv)
+        # all rows have to fit into the terminal
+        self.line = max(min(self.line, self.term_size.get_rows() - self.height),
+                        self.min_scroll_line)
+
+
+def _blanks(start, end):
+    """
+    :returns: Blanks for the virtual range [start:end], an empty str for empty ranges
+    :rtype: str
+    """
+    return " " * (end - start) if end > start else ""
+
+
+def _cycle_slice(pieces, offset, length):
+    """
+    Slices a virtual text, which consists of the given pieces concatenated and repeated
+    endlessly. Only the pieces are stored, they are never concatenated.
+
+    :param pieces: The pieces of one cycle
+    :type pieces: tuple
+    :param offset: Start index, may be negative or larger than one cycle
+    :type offset: int
+    :param length: Length of the requested slice
+    :type length: int
+    :rtype: str
+    """
+    offset %= sum(len(piece) for piece in pieces)
+    parts = []
+    while length > 0:
+        for piece in pieces:
+            if offset >= len(piece):
+                offset -= len(piece)
+                continue
+            size = min(len(piece) - offset, length)
+            parts.append(piece[offset:offset + size])
+            length -= size
+            offset = 0
+            if length <= 0:
+                break
+    return "".join(parts)
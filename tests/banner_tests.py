@@ -0,0 +1,87 @@
+"""Unittests for banner module."""
+import configparser
+import unittest
+from scrolltext.banner import FONT_HEIGHT, BannerFont, banner_rows
+from scrolltext.utils import BannerScroller, TermSize, create_scroller
+
+
+class BannerFontTests(unittest.TestCase):
+    """Test cases for BannerFont class"""
+    def test_glyph_rows(self):
+        """A glyph is 5 columns wide, followed by the spacing."""
+        font = BannerFont(pixel="#")
+        self.assertEqual(font.glyph("I"), (" ###  ", "  #   ", "  #   ", "  #   ", "  #   ",
+                                           "  #   ", " ###  "))
+        self.assertEqual(BannerFont(pixel="#", spacing=0).glyph("-")[3], "#####")
+
+    def test_glyphs_are_rasterised_once(self):
+        """The same rows are given again, unknown characters look like a question mark."""
+        font = BannerFont()
+        self.assertIs(font.glyph("A"), font.glyph("A"))
+        self.assertEqual(font.glyph("ä"), font.glyph("?"))
+
+
+class BannerRowTests(unittest.TestCase):
+    """Test cases for BannerRow class"""
+    def test_slices_match_the_whole_row(self):
+        """Slices are cut at any column, also inside of a glyph."""
+        font = BannerFont(pixel="#")
+        for row in banner_rows("Hi!", font):
+            whole = "".join(font.glyph(character)[row.row] for character in "Hi!")
+            self.assertEqual(len(row), len(whole))
+            for start in range(len(whole)):
+                self.assertEqual(row[start:start + 7], whole[start:start + 7])
+
+
+class BannerScrollerTests(unittest.TestCase):
+    """Test cases for BannerScroller class"""
+    @staticmethod
+    def _create_cfg(direction):
+        cfg = configparser.ConfigParser()
+        cfg.read_dict({
+            "main": {"action": "linescroller"},
+            "scrolltext.text 1": {"direction": direction, "text": "Hi", "line": "-1",
+                                  "speed": "0", "banner": "1"}
+        })
+        return cfg
+
+    def test_scrolls_column_by_column(self):
+        """All rows scroll together, by one column per frame."""
+        scroller = create_scroller(self._create_cfg("0"), TermSize(4, 10), test=True)
+        self.assertIsInstance(scroller, BannerScroller)
+        frames = list(scroller)
+        self.assertEqual(len(frames), 2 * 4 + 2 * 6)
+        self.assertTrue(all(len(frame) == FONT_HEIGHT for frame in frames))
+        self.assertEqual(frames[0], ("    ",) * FONT_HEIGHT)
+        self.assertEqual([row[-1] for row in frames[1]],
+                         [row[0] for row in BannerFont().glyph("H")])
+        self.assertEqual(frames[2][3][-2:], frames[1][3][-1:] + BannerFont().glyph("H")[3][1])
+
+    def test_rows_fit_into_the_terminal(self):
+        """The banner is moved up, when its rows would leave the terminal."""
+        scroller = create_scroller(self._create_cfg("1"), TermSize(4, 10), test=True)
+        self.assertEqual(scroller.line, 10 - FONT_HEIGHT)
+
+    def test_apply_config_draws_the_new_text(self):
+        """A reloaded text and direction are applied to all rows."""
+        scroller = create_scroller(self._create_cfg("0"), TermSize(4, 10), test=True)
+        for _ in range(8):
+            scroller.next()
+        cfg = self._create_cfg("1")
+        cfg["scrolltext.text 1"]["text"] = "Ho"
+        scroller.apply_config(cfg)
+        self.assertTrue(scroller.right_to_left)
+        rows = [str(row) for row in banner_rows("Ho", BannerFont())]
+        self.assertEqual([str(row) for row in scroller.rows], rows)
+        self.assertEqual(scroller.next(), tuple(row[4:8] for row in rows))
+
+    def test_source_is_rejected(self):
+        """A banner is only drawn from the configured text."""
+        cfg = self._create_cfg("0")
+        cfg["scrolltext.text 1"]["source"] = "-"
+        with self.assertRaises(TypeError):
+            create_scroller(cfg, TermSize(4, 10), test=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
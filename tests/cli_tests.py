@@ -0,0 +1,63 @@
+"""Unittests for cli module."""
+import subprocess
+import sys
+import unittest
+
+
+class LazyImportTests(unittest.TestCase):
+    """Test cases for the lazy import of the backends"""
+    def test_cli_imports_no_backend(self):
+        """Importing cli, e.g. for --help and --version, imports neither backend."""
+        code = ("import sys, scrolltext.cli\n"
+                "print(sorted(name for name in ['asyncio', 'curses', 'scrolltext.linescroller',"
+                " 'scrolltext.cursestext', 'scrolltext.utils'] if name in sys.modules))")
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True,
+                                text=True).stdout
+        self.assertEqual(output.strip(), "[]")
+
+    def test_linescroller_imports_no_process_pool(self):
+        """The process pool of the pre-rendering is only imported, when it is enabled."""
+        code = ("import sys, scrolltext.linescroller\n"
+                "print(sorted(name for name in ['concurrent.futures', 'multiprocessing']"
+                " if name in sys.modules))")
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True,
+                                text=True).stdout
+        self.assertEqual(output.strip(), "[]")
+
+    def test_package_attributes_are_loaded_on_use(self):
+        """The entry points of the package are still available."""
+        code = ("import scrolltext\n"
+                "print(scrolltext.cursesscroller.__name__, scrolltext.linescroller.__name__)")
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True,
+                                text=True).stdout
+        self.assertEqual(output.strip(), "work linescroller")
+
+
+class ParseArgsTests(unittest.TestCase):
+    """Test cases for the command line options"""
+    @staticmethod
+    def _run(*args):
+        return subprocess.run([sys.executable, "-m", "scrolltext.cli", *args],
+                              capture_output=True, check=False, text=True)
+
+    def test_invalid_integer_prints_usage(self):
+        """A non-integer or missing option value exits with the usage message."""
+        for args in [["bench", "--frames", "abc"], ["bench", "--frames"],
+                     ["server", "--port", ""]]:
+            result = self._run(*args)
+            self.assertEqual(result.returncode, 2)
+            self.assertIn("needs an integer", result.stderr)
+            self.assertIn("scrolltext bench [--frames N]", result.stderr)
+            self.assertNotIn("Traceback", result.stderr)
+
+    def test_missing_value_prints_usage(self):
+        """An option without its value exits with the usage message."""
+        for arg in ["-s", "-f"]:
+            result = self._run(arg)
+            self.assertEqual(result.returncode, 2)
+            self.assertIn(f"{arg} needs a value", result.stderr)
+            self.assertNotIn("Traceback", result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Unittests for config module."""
+import configparser
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from scrolltext import config
+from scrolltext.config import ConfigWatcher, _read_config, _validate, get_section_indices
+from scrolltext.config import initial_config
+
+
+class ValidateTests(unittest.TestCase):
+    """Test cases for config validation"""
+    @staticmethod
+    def _create_cfg(*extra_sections):
+        cfg = configparser.ConfigParser(default_section="main")
+        cfg.read_dict(initial_config)
+        for index, text in enumerate(extra_sections, 2):
+            cfg["scrolltext.text " + str(index)] = {"direction": "0", "text": text,
+                                                    "line": str(index), "speed": "0"}
+        return cfg
+
+    def test_single_section(self):
+        """The initial config has one scrolltext section."""
+        cfg = self._create_cfg()
+        _validate(cfg)
+        self.assertEqual(list(get_section_indices(cfg)), [1])
+
+    def test_several_sections(self):
+        """Further scrolltext sections are validated and their text lines are joined."""
+        cfg = self._create_cfg("Second\nline", "Third")
+        _validate(cfg)
+        self.assertEqual(list(get_section_indices(cfg)), [1, 2, 3])
+        self.assertEqual(cfg["scrolltext.text 2"]["text"], "Secondline")
+        self.assertNotIn("max_index", cfg["scrolltext.text 2"])
+
+    def test_incomplete_section_raises(self):
+        """A further scrolltext section needs all entries."""
+        cfg = self._create_cfg("Second")
+        cfg.remove_option("scrolltext.text 2", "line")
+        with self.assertRaises(NameError):
+            _validate(cfg)
+
+
+class ConfigCacheTests(unittest.TestCase):
+    """Test cases for the config cache"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.config_path = Path(self.directory.name) / "scrolltextrc"
+        self.cache_path = Path(self.directory.name) / "cache" / "config.json"
+        cfg = configparser.ConfigParser(default_section="main")
+        cfg.read_dict(initial_config)
+        cfg["scrolltext.text 2"] = {"direction": "1", "text": "Two\nlines", "line": "2",
+                                    "speed": "3"}
+        with open(self.config_path, "w", encoding="utf-8") as config_file:
+            cfg.write(config_file)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_unchanged_config_is_loaded_from_cache(self):
+        """The second load uses the cache and gives the same validated config."""
+        parsed, _ = _read_config(self.config_path, self.cache_path)
+        self.assertEqual(config.config_source, "file")
+        cached, _ = _read_config(self.config_path, self.cache_path)
+        self.assertEqual(config.config_source, "cache")
+        self.assertEqual({name: dict(section) for name, section in parsed.items()},
+                         {name: dict(section) for name, section in cached.items()})
+        self.assertEqual(cached["scrolltext.text 2"]["text"], "Twolines")
+
+    def test_changed_config_is_parsed(self):
+        """A modified config file invalidates the cache."""
+        _read_config(self.config_path, self.cache_path)
+        with open(self.config_path, "a", encoding="utf-8") as config_file:
+            config_file.write("\n[scrolltext.text 3]\ndirection = 0\ntext = Three\n"
+                              "line = 3\nspeed = 0\n")
+        stat = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        cfg, _ = _read_config(self.config_path, self.cache_path)
+        self.assertEqual(config.config_source, "file")
+        self.assertEqual(list(get_section_indices(cfg)), [1, 2, 3])
+
+    def _append_section(self):
+        with open(self.config_path, "a", encoding="utf-8") as config_file:
+            config_file.write("\n[scrolltext.text 3]\ndirection = 0\ntext = Three\n"
+                              "line = 3\nspeed = 0\n")
+
+    def test_watcher_reloads_changed_config(self):
+        """The config is only read again, when the file changed."""
+        watcher = ConfigWatcher(self.config_path, interval=0)
+        self.assertIsNone(watcher.poll())
+        self._append_section()
+        cfg = watcher.poll()
+        self.assertEqual(list(get_section_indices(cfg)), [1, 2, 3])
+        self.assertIsNone(watcher.poll())
+
+    def test_watcher_checks_once_per_interval(self):
+        """Changes are not noticed before the interval elapsed."""
+        watcher = ConfigWatcher(self.config_path, interval=60)
+        self._append_section()
+        self.assertIsNone(watcher.poll())
+
+    def test_watcher_ignores_invalid_config(self):
+        """An invalid config, e.g. while it is edited, is not applied."""
+        watcher = ConfigWatcher(self.config_path, interval=0)
+        with open(self.config_path, "a", encoding="utf-8") as config_file:
+            config_file.write("\n[scrolltext.text 3]\ndirection = 0\n")
+        self.assertIsNone(watcher.poll())
+
+
+if __name__ == '__main__':
+    unittest.main()
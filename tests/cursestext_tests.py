@@ -0,0 +1,116 @@
+"""Unittests for the curses drawing functions."""
+import unittest
+from scrolltext.cursestext import COLOR_STEPS_PER_SECOND, GradientEngine, _color_phase
+from scrolltext.cursestext import color_runs, draw_frame
+from scrolltext.headless import HeadlessWindow
+from scrolltext.scheduler import FrameScheduler
+from scrolltext.utils import TermSize
+
+
+class FakeScroller:  # pylint: disable=too-few-public-methods (R0903)
+    """Only provides the line and height of a scroller."""
+    def __init__(self, line, height=1):
+        self.line = line
+        self.height = height
+
+
+class RecordingWindow(HeadlessWindow):
+    """Records the addstr calls."""
+    def __init__(self, cols, rows):
+        super().__init__(cols, rows)
+        self.calls = []
+
+    def addstr(self, row, col, text, attr=0):
+        self.calls.append((row, col, text, attr))
+        super().addstr(row, col, text, attr)
+
+
+class GradientEngineTests(unittest.TestCase):
+    """Test cases for GradientEngine class"""
+    def test_triangle_wave(self):
+        """The color pairs go up and down, each phase is rotated by one pair."""
+        gradient = GradientEngine(3, color_pair=int)
+        self.assertEqual(gradient.table, [2, 3, 4, 3])
+        self.assertEqual(gradient.attrs(6, 0), [2, 3, 4, 3, 2, 3])
+        self.assertEqual(gradient.attrs(6, 1), [3, 4, 3, 2, 3, 4])
+        self.assertEqual(gradient.attrs(2, 5), [3, 4])
+
+    def test_phase_follows_the_clock(self):
+        """The color phase depends on the time, not on the frame rate."""
+        slow = FrameScheduler(10, clock=lambda: 0.)
+        fast = FrameScheduler(30, clock=lambda: 0.)
+        slow.frames = 10
+        fast.frames = 30
+        self.assertEqual(_color_phase(slow), COLOR_STEPS_PER_SECOND)
+        self.assertEqual(_color_phase(fast), COLOR_STEPS_PER_SECOND)
+
+
+class ColorRunsTests(unittest.TestCase):
+    """Test cases for color_runs"""
+    def test_runs(self):
+        """Consecutive characters of the same attribute are grouped."""
+        runs = color_runs("abcd", [2, 2, 3, 2])
+        self.assertEqual(runs, [("ab", 2), ("c", 3), ("d", 2)])
+
+    def test_blanks_join_runs(self):
+        """Blanks are drawn in the color of the neighbouring run."""
+        self.assertEqual(color_runs("a  b", [2, 3, 4, 5]), [("a  ", 2), ("b", 5)])
+        self.assertEqual(color_runs("  ab", [2, 3, 4, 5]), [("  a", 4), ("b", 5)])
+        self.assertEqual(color_runs("   ", [2, 3, 4]), [("   ", 2)])
+
+
+class DrawFrameTests(unittest.TestCase):
+    """Test cases for draw_frame"""
+    def test_output_scales_with_changed_cells(self):
+        """Drawing the same text again emits nothing, a changed text only its changed cells."""
+        window = HeadlessWindow(12, 4)
+        window.refresh()
+        scroller = FakeScroller(1)
+        term_size = TermSize(10, 2)
+        draw_frame(window, [(scroller, "abcdefghij")], term_size, box=True,
+                   gradients={}, min_scroll_line=1)
+        window.refresh()
+        written = window.bytes_written
+        draw_frame(window, [(scroller, "abcdefghij")], term_size, box=True,
+                   gradients={}, min_scroll_line=1)
+        window.refresh()
+        self.assertEqual(window.bytes_written, written)
+        draw_frame(window, [(scroller, "abcdefghiX")], term_size, box=True,
+                   gradients={}, min_scroll_line=1)
+        window.refresh()
+        self.assertEqual(window.bytes_written, written + 1)
+        self.assertEqual(window.line(1), " abcdefghiX ")
+
+    def test_color_runs_advance_by_columns(self):
+        """A colored run after a wide character starts behind both of its columns, combining
+        marks are drawn with their base character."""
+        window = RecordingWindow(8, 3)
+        gradient = GradientEngine(3, color_pair=int)
+        scroller = FakeScroller(1)
+        draw_frame(window, [(scroller, "字e\u0301x")], TermSize(6, 1), box=True,
+                   gradients={scroller: gradient}, min_scroll_line=1)
+        self.assertEqual(window.calls, [(1, 1, "字", 2), (1, 3, "e\u0301", 4), (1, 4, "x", 3)])
+
+    def test_rows_of_a_banner(self):
+        """Every row of a banner is drawn, one line below the other, in the same colors."""
+        window = HeadlessWindow(6, 6)
+        draw_frame(window, [(FakeScroller(1, height=3), ("ab", "cd", "ef"))], TermSize(4, 4),
+                   box=True, gradients={}, min_scroll_line=1)
+        self.assertEqual([window.line(row) for row in range(1, 4)],
+                         [" ab   ", " cd   ", " ef   "])
+        window = RecordingWindow(6, 6)
+        scroller = FakeScroller(1, height=3)
+        draw_frame(window, [(scroller, ("abc", "def", "ghi"))], TermSize(4, 4), box=True,
+                   gradients={scroller: GradientEngine(3, color_pair=int)}, min_scroll_line=1,
+                   phase=1)
+        colors = {}
+        for row, col, text, attr in window.calls:
+            colors.setdefault(row, []).extend((col + index, attr) for index in range(len(text)))
+        self.assertEqual(sorted(colors), [1, 2, 3])
+        self.assertEqual(colors[1], [(1, 3), (2, 4), (3, 3)])
+        self.assertEqual(colors[2], colors[1])
+        self.assertEqual(colors[3], colors[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
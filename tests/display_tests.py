@@ -0,0 +1,69 @@
+"""Unittests for display widths."""
+import configparser
+import unittest
+from scrolltext.display import DisplayText, char_width, column_cells, cut_last_column
+from scrolltext.display import display_text, text_width
+from scrolltext.utils import CharacterScroller, TermSize
+
+
+class DisplayTextTests(unittest.TestCase):
+    """Test cases for DisplayText class"""
+    def test_char_width(self):
+        """Wide characters take two columns, combining marks none."""
+        self.assertEqual(char_width("a"), 1)
+        self.assertEqual(char_width("漢"), 2)
+        self.assertEqual(char_width("́"), 0)
+
+    def test_plain_text_is_not_wrapped(self):
+        """Texts of single column characters are sliced as str."""
+        self.assertEqual(display_text("Hello, wörld"), "Hello, wörld")
+        self.assertIsInstance(display_text("漢字"), DisplayText)
+
+    def test_slices_are_column_exact(self):
+        """Wide characters cut by a slice boundary are replaced with blanks."""
+        text = DisplayText("a漢字b")
+        self.assertEqual(len(text), 6)
+        self.assertEqual(text[0:3], "a漢")
+        self.assertEqual(text[0:2], "a ")
+        self.assertEqual(text[2:5], " 字")
+        self.assertEqual(text[2:3], " ")
+        self.assertEqual(text[3:6], "字b")
+
+    def test_combining_marks_stay_with_their_base(self):
+        """Combining marks take no column and are never separated from their base."""
+        text = DisplayText("éf")
+        self.assertEqual(len(text), 2)
+        self.assertEqual(text[0:1], "é")
+        self.assertEqual(text[1:2], "f")
+
+    def test_scroller_window_width(self):
+        """No visible text of a scroller exceeds the columns of the terminal."""
+        cfg = configparser.ConfigParser()
+        cfg.read_dict({
+            "main": {"endless": "0"},
+            "scrolltext.text 1": {"direction": "0", "text": "漢字 and kanji", "line": "0",
+                                  "speed": "0"}
+        })
+        texts = list(CharacterScroller(cfg, TermSize(5, 0), test=True))
+        self.assertIn("漢字 ", texts)
+        self.assertEqual(max(len(DisplayText(text)) for text in texts), 5)
+
+
+class ColumnTests(unittest.TestCase):
+    """Test cases for the column helpers"""
+    def test_column_cells(self):
+        """Combining marks stay with their base, a wide character takes two columns."""
+        self.assertEqual(column_cells("ab"), ["a", "b"])
+        self.assertEqual(column_cells("e\u0301字\u0301x"), ["e\u0301", "字\u0301", "", "x"])
+        self.assertEqual(text_width("e\u0301字x"), 4)
+
+    def test_cut_last_column(self):
+        """The last column is cut, never a combining mark alone or half a wide character."""
+        self.assertEqual(cut_last_column("abc"), "ab")
+        self.assertEqual(cut_last_column("ae\u0301"), "a")
+        self.assertEqual(cut_last_column("a字"), "a ")
+        self.assertEqual(cut_last_column(""), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""Unittests for the fan-out writer."""
+import os
+import unittest
+from scrolltext.fanout import FanoutWriter
+
+
+def _nonblocking_pipe():
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(write_fd, False)
+    return read_fd, write_fd
+
+
+class FanoutWriterTests(unittest.TestCase):
+    """Test cases for FanoutWriter class"""
+    def setUp(self):
+        self.pipes = [_nonblocking_pipe() for _ in range(2)]
+
+    def tearDown(self):
+        for read_fd, _ in self.pipes:
+            os.close(read_fd)
+
+    def test_same_bytes_to_every_device(self):
+        """Every device receives the same encoded frame."""
+        writer = FanoutWriter([write_fd for _, write_fd in self.pipes])
+        writer.write("\033[1;1H")
+        writer.write("Grüße")
+        writer.flush()
+        for read_fd, _ in self.pipes:
+            self.assertEqual(os.read(read_fd, 100), "\033[1;1HGrüße".encode("utf-8"))
+        writer.close()
+
+    def test_slow_device_does_not_stall_the_others(self):
+        """Frames of a full device are kept, then dropped, while other devices get all."""
+        (slow_read, slow_write), (fast_read, fast_write) = self.pipes
+        writer = FanoutWriter([slow_write, fast_write], max_pending=100000)
+        frame = "x" * 50000
+        for _ in range(10):
+            writer.write(frame)
+            writer.flush()
+            self.assertEqual(len(os.read(fast_read, 100000)), 50000)
+        self.assertGreater(writer.dropped_frames, 0)
+        os.set_blocking(slow_read, False)
+        received = b""
+        while True:
+            try:
+                received += os.read(slow_read, 100000)
+            except BlockingIOError:
+                break
+            writer.flush()
+        self.assertEqual(len(received) % 50000, 0)  # only complete frames
+        self.assertLess(len(received), 10 * 50000)
+        writer.close()
+
+    def test_failing_device_is_removed(self):
+        """A device, which was closed, is removed."""
+        (read_fd, write_fd), _ = self.pipes
+        writer = FanoutWriter([write_fd])
+        os.close(read_fd)
+        self.pipes[0] = os.pipe()
+        writer.write("text")
+        writer.flush()
+        self.assertEqual(writer.fds, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
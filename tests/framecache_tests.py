@@ -0,0 +1,82 @@
+"""Unittests for the frame cache."""
+import configparser
+import io
+import unittest
+from scrolltext.framecache import CycleFrames, FrameCache
+from scrolltext.linescroller import ColorEngine, LineCompositor
+from scrolltext.utils import CharacterScroller, TermSize
+
+
+class FrameCacheTests(unittest.TestCase):
+    """Test cases for FrameCache class"""
+    def test_frames_are_built_once(self):
+        """A cached message is not built again."""
+        cache = FrameCache(1000)
+        frames = cache.frames("message", lambda: 100, object)
+        self.assertIs(cache.frames("message", lambda: 100, object), frames)
+
+    def test_least_recently_used_message_is_evicted(self):
+        """Reserving room for a new message evicts the least recently used one."""
+        cache = FrameCache(1000)
+        first = cache.frames("first", lambda: 400, object)
+        cache.frames("second", lambda: 400, object)
+        self.assertIs(cache.frames("first", lambda: 400, object), first)
+        cache.frames("third", lambda: 400, object)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.reserved, 800)
+        self.assertIs(cache.frames("first", lambda: 400, object), first)
+
+    def test_large_cycle_is_rendered_live(self):
+        """A message, whose cycle exceeds the cap, is not cached."""
+        cache = FrameCache(1000)
+        self.assertIsNone(cache.frames("message", lambda: 1001, object))
+        self.assertEqual(cache.get(None, 0, 4, 0, lambda: "frame"), "frame")
+        self.assertEqual(len(cache), 0)
+
+    def test_compositor_replays_cached_frames(self):
+        """Cached and live rendering give the same output, every frame is cached."""
+        for direction, endless in [("0", "1"), ("1", "1"), ("0", "0"), ("1", "0")]:
+            cfg = configparser.ConfigParser(default_section="main")
+            cfg.read_dict({
+                "main": {"color": "1", "bold": "0", "colortable": "1", "endless": endless},
+                "scrolltext.text 1": {"direction": direction, "text": "Hello", "line": "0",
+                                      "speed": "0"}
+            })
+            outputs = []
+            cache = FrameCache(1024 * 1024)
+            for frame_cache in [None, cache]:
+                out = io.StringIO()
+                compositor = LineCompositor(cfg, out, cache=frame_cache)
+                scroller = CharacterScroller(cfg, TermSize(4, 1), test=True)
+                for cnt, text in zip(range(1000), scroller):
+                    compositor.render([(1, text)], cnt, [compositor.frames(scroller)])
+                outputs.append(out.getvalue())
+            self.assertEqual(outputs[0], outputs[1])
+            self.assertEqual(cache.misses, 0)
+            start, end = scroller.cycle_range()
+            self.assertEqual(cache.reserved,
+                             CycleFrames.size_of(end - start, compositor.colors.prefixes))
+
+
+class CycleFramesTests(unittest.TestCase):
+    """Test cases for CycleFrames class"""
+    def test_frames_are_slices_of_the_colored_cycle(self):
+        """Every frame equals the colored visible text."""
+        colors = ColorEngine(["1m", "22m", "333m"])
+        frames = CycleFrames("abcdefghij", -2, colors.prefixes)
+        for start in range(-2, 8):
+            for length in range(0, 8 - start + 1):
+                for phase in range(4):
+                    text = "abcdefghij"[start + 2:start + 2 + length]
+                    self.assertEqual(frames.frame(start, length, phase),
+                                     colors.apply(text, phase))
+
+    def test_frames_outside_of_the_cycle(self):
+        """Visible texts, which are not part of the cycle, are not cached."""
+        frames = CycleFrames("abc", 0, ["\033[1m"])
+        self.assertIsNone(frames.frame(-1, 2, 0))
+        self.assertIsNone(frames.frame(2, 2, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Unittests for getchtimeout module."""
+import asyncio
+import os
+import unittest
+from scrolltext.getchtimeout import AsyncGetch
+
+
+class AsyncGetchTests(unittest.TestCase):
+    """Test cases for AsyncGetch class, on a pseudo terminal"""
+    def setUp(self):
+        self.master, self.slave = os.openpty()
+
+    def tearDown(self):
+        os.close(self.master)
+        os.close(self.slave)
+
+    def _read(self, *chunks, count):
+        async def run():
+            getch = AsyncGetch(self.slave)
+            try:
+                for chunk in chunks:
+                    os.write(self.master, chunk)
+                    await asyncio.sleep(.05)  # every chunk is read on its own
+                return [await getch.getch(1.) for _ in range(count)]
+            finally:
+                getch.cleanup()
+        return asyncio.run(run())
+
+    def test_characters_are_queued(self):
+        """Every character of a read is returned by its own getch."""
+        self.assertEqual(self._read(b"qa", count=2), ["q", "a"])
+
+    def test_character_split_across_reads(self):
+        """A multi-byte character, which arrives in two reads, is decoded as one."""
+        data = "ä€".encode("utf-8")
+        self.assertEqual(self._read(data[:1], data[1:3], data[3:], count=2), ["ä", "€"])
+
+    def test_timeout(self):
+        """Without input getch returns None after the timeout."""
+        async def run():
+            getch = AsyncGetch(self.slave)
+            try:
+                return await getch.getch(.01)
+            finally:
+                getch.cleanup()
+        self.assertIsNone(asyncio.run(run()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Unittests for the headless backends and the benchmark."""
+import configparser
+import unittest
+from scrolltext.bench import create_bench_config, run_benchmarks, run_startup_benchmarks
+from scrolltext.headless import HeadlessWindow, ScreenBuffer
+
+
+class ScreenBufferTests(unittest.TestCase):
+    """Test cases for ScreenBuffer class"""
+    def test_cursor_positioning_and_colors(self):
+        """Text is placed at the cursor position, SGR sequences take no space."""
+        screen = ScreenBuffer(10, 3)
+        screen.write("\033[2J\033[H\033[2;3H\033[1m\033[31mab\033[32mc")
+        self.assertEqual(screen.line(1), "  abc     ")
+        self.assertEqual(screen.line(0), " " * 10)
+
+    def test_relative_movement_and_carriage_return(self):
+        """Moving down and returning to the first column, like linescroller does."""
+        screen = ScreenBuffer(5, 3)
+        screen.write("\033[2Bhello\r")
+        screen.write("J")
+        self.assertEqual(screen.line(2), "Jello")
+
+    def test_counts_bytes(self):
+        """All written bytes are counted, UTF-8 encoded."""
+        screen = ScreenBuffer(5, 1)
+        screen.write("ä\033[1;1H")
+        self.assertEqual(screen.bytes_written, 8)
+        self.assertEqual(screen.writes, 1)
+
+
+class HeadlessWindowTests(unittest.TestCase):
+    """Test cases for HeadlessWindow class"""
+    def test_refresh_emits_changed_cells_only(self):
+        """After the first refresh, only changed cells are counted."""
+        window = HeadlessWindow(4, 2)
+        window.addstr(0, 0, "abcd")
+        window.refresh()
+        self.assertEqual(window.bytes_written, 8)
+        window.addstr(0, 0, "abXd")
+        window.refresh()
+        self.assertEqual(window.bytes_written, 9)
+        self.assertEqual(window.line(0), "abXd")
+
+    def test_redrawwin_emits_all_cells(self):
+        """A redraw counts every cell of the window."""
+        window = HeadlessWindow(4, 2)
+        window.refresh()
+        window.redrawwin()
+        window.refresh()
+        self.assertEqual(window.bytes_written, 16)
+
+
+class BenchTests(unittest.TestCase):
+    """Test cases for the bench action"""
+    def test_run_benchmarks(self):
+        """Every path is measured, bytes per frame are deterministic."""
+        cfg = configparser.ConfigParser(default_section="main")
+        cfg.read_dict({"main": {"bold": "0"}})
+        bench_cfg = create_bench_config(cfg, 100, False)
+        results = dict(run_benchmarks(bench_cfg, 20, 10))
+        self.assertEqual(list(results), ["scroller", "linescroller", "linescroller-diff",
+                                         "linescroller-cache", "linescroller-fd",
+                                         "cursestext"])
+        self.assertEqual(results["scroller"]["bytes_per_frame"], 0)
+        self.assertEqual(results["linescroller"]["bytes_per_frame"], len("\033[2;1H") + 10)
+        self.assertEqual(results["linescroller-fd"]["bytes_per_frame"],
+                         results["linescroller"]["bytes_per_frame"])
+        self.assertGreater(results["cursestext"]["fps"], 0)
+
+    def test_run_startup_benchmarks(self):
+        """The import time of every action is measured."""
+        results = dict(run_startup_benchmarks(1))
+        self.assertEqual(list(results), ["cli", "linescroller", "cursestext", "server", "bench"])
+        self.assertTrue(all(elapsed > 0 for elapsed in results.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+"""Unittests for linescroller."""
+import asyncio
+import configparser
+import contextlib
+import io
+import os
+import unittest
+from scrolltext.getchtimeout import AsyncGetch
+from scrolltext.headless import ScreenBuffer
+from scrolltext.linescroller import COLOR_TABLES, ColorEngine, DiffRenderer
+from scrolltext.linescroller import _async_compositor_loop, _build_smooth_colortable
+from scrolltext.linescroller import _fit_to_line
+from scrolltext.utils import NORMAL, TermSize
+
+
+class DiffRendererTests(unittest.TestCase):
+    """Test cases for DiffRenderer class"""
+    def test_first_frame_writes_all_cells(self):
+        """The first frame is written completely, in one run."""
+        out = io.StringIO()
+        renderer = DiffRenderer(out=out)
+        written = renderer.render(3, list("Hello"))
+        self.assertEqual(out.getvalue(), "\033[3;1HHello")
+        self.assertEqual(written, len("\033[3;1HHello"))
+
+    def test_unchanged_frame_writes_nothing(self):
+        """Rendering the same cells twice, writes nothing the second time."""
+        out = io.StringIO()
+        renderer = DiffRenderer(out=out)
+        renderer.render(1, list("Hello"))
+        self.assertEqual(renderer.render(1, list("Hello")), 0)
+        self.assertEqual(out.getvalue(), "\033[1;1HHello")
+
+    def test_only_changed_cells_are_written(self):
+        """Only the differing columns are written, each run behind a cursor movement."""
+        out = io.StringIO()
+        renderer = DiffRenderer(out=out)
+        renderer.render(2, list("Hello"))
+        out.truncate(0)
+        out.seek(0)
+        renderer.render(2, list("Jelly"))
+        self.assertEqual(out.getvalue(), "\033[2;1HJ\033[2;5Hy")
+
+    def test_shorter_frame_blanks_remaining_cells(self):
+        """Cells no longer covered by a frame are overwritten with blanks."""
+        out = io.StringIO()
+        renderer = DiffRenderer(out=out)
+        renderer.render(1, list("abc"))
+        out.truncate(0)
+        out.seek(0)
+        renderer.render(1, list("a"))
+        self.assertEqual(out.getvalue(), "\033[1;2H\033[0m  ")
+
+    def test_color_phase_is_part_of_the_cell(self):
+        """A cell with a different color escape counts as changed."""
+        out = io.StringIO()
+        renderer = DiffRenderer(out=out)
+        renderer.render(1, ["\033[31mx", "\033[32my"])
+        out.truncate(0)
+        out.seek(0)
+        renderer.render(1, ["\033[31mx", "\033[33my"])
+        self.assertEqual(out.getvalue(), "\033[1;2H\033[33my")
+
+
+class ColorEngineTests(unittest.TestCase):
+    """Test cases for ColorEngine class"""
+    colortable = ["31m", "32m", "33m"]
+
+    def test_apply_prefixes_every_character(self):
+        """Every character gets the color escape of its column, starting at the color phase."""
+        engine = ColorEngine(self.colortable)
+        self.assertEqual(engine.apply("abcd", 1),
+                         "\033[32ma\033[33mb\033[31mc\033[32md")
+
+    def test_apply_reuses_template_for_same_phase(self):
+        """Consecutive frames with the same phase don't leak the previous text."""
+        engine = ColorEngine(self.colortable)
+        engine.apply("abcd", 3)
+        self.assertEqual(engine.apply("wxyz", 3),
+                         "\033[31mw\033[32mx\033[33my\033[31mz")
+
+    def test_apply_shorter_text(self):
+        """Shrinking text at the end of a finite scroll text."""
+        engine = ColorEngine(self.colortable)
+        engine.apply("abcd", 0)
+        self.assertEqual(engine.apply("ab", 0), "\033[31ma\033[32mb")
+        self.assertEqual(engine.apply("", 0), "")
+
+    def test_cells_match_apply(self):
+        """Joined cells are equal to the applied text."""
+        engine = ColorEngine(self.colortable)
+        self.assertEqual("".join(engine.cells("Hello, world", 5)),
+                         engine.apply("Hello, world", 5))
+
+    def test_colors_by_column(self):
+        """Combining marks get no escape, a wide character takes the color of its first
+        column."""
+        engine = ColorEngine(self.colortable)
+        self.assertEqual(engine.apply("e\u0301字x", 0),
+                         "\033[31me\u0301\033[32m字\033[31mx")
+        self.assertEqual(engine.cells("字x", 1), ["\033[32m字", "", "\033[31mx"])
+        self.assertEqual("".join(engine.cells("e\u0301字x", 0)), engine.apply("e\u0301字x", 0))
+
+    def test_fit_to_line_cuts_a_column(self):
+        """In the last row the last column is cut, with its combining marks."""
+        term_size = TermSize(3, 2)
+        self.assertEqual(_fit_to_line("abe\u0301", 1, term_size), "ab")
+        self.assertEqual(_fit_to_line("abe\u0301", 0, term_size), "abe\u0301")
+
+    def test_build_smooth_colortable_keeps_tables(self):
+        """Building the smooth color table twice gives the same table."""
+        cfg = configparser.ConfigParser()
+        cfg.read_dict({"main": {"colortable": "1"}})
+        first = _build_smooth_colortable(cfg)
+        self.assertEqual(first, _build_smooth_colortable(cfg))
+        self.assertEqual(len(first), 2 * len(COLOR_TABLES[1]) - 1)
+
+
+class StaticTermSize(TermSize):
+    """A terminal, which is never resized."""
+    def update(self):
+        """See WatchedTermSize"""
+        return False
+
+
+class AsyncLinescrollerTests(unittest.TestCase):
+    """Test cases for the asyncio engine of linescroller"""
+    @staticmethod
+    def _create_cfg():
+        cfg = configparser.ConfigParser(default_section="main")
+        cfg.read_dict({
+            "main": {"color": "0", "bold": "0", "endless": "0", "fps": "240", "reload": "0"},
+            "scrolltext.text 1": {"direction": "0", "text": "Hi", "line": "1", "speed": "10"},
+            "scrolltext.text 2": {"direction": "1", "text": "Yo", "line": "2", "speed": "10"}
+        })
+        return cfg
+
+    def _run(self, getch_input=None):
+        """
+        :returns: The screen after the loop ended, and the exception raised by the loop
+        """
+        out = io.StringIO()
+        master, slave = os.openpty()
+
+        async def run():
+            getch = None
+            if getch_input is not None:
+                getch = AsyncGetch(slave)
+                os.write(master, getch_input)
+            try:
+                await _async_compositor_loop(getch, self._create_cfg(), StaticTermSize(4, 3))
+            finally:
+                if getch is not None:
+                    getch.cleanup()
+        error = None
+        try:
+            with contextlib.redirect_stdout(out):
+                asyncio.run(run())
+        except RuntimeError as exception:
+            error = exception
+        finally:
+            os.close(master)
+            os.close(slave)
+        screen = ScreenBuffer(4, 3)
+        screen.write(out.getvalue())
+        return screen, out.getvalue(), error
+
+    def test_all_sections_scroll_until_finished(self):
+        """Both texts are scrolled through, then the loop ends with cleared lines."""
+        screen, output, error = self._run()
+        self.assertIsNone(error)
+        for text in ["Hi", "Yo"]:
+            self.assertIn(text, output)
+        self.assertEqual([screen.line(row) for row in range(3)], ["    "] * 3)
+
+    def test_quit_character(self):
+        """A quit character read via the event loop ends the loop. The colors are reset by
+        the entry point, after the output was closed."""
+        _, output, error = self._run(b"q")
+        self.assertIsInstance(error, RuntimeError)
+        self.assertNotIn(NORMAL, output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Unittests for output module."""
+import configparser
+import os
+import threading
+import unittest
+from scrolltext.linescroller import LineCompositor
+from scrolltext.output import FrameWriter, create_frame_writer
+
+
+class FrameWriterTests(unittest.TestCase):
+    """Test cases for FrameWriter class"""
+    def setUp(self):
+        self.read_fd, self.write_fd = os.pipe()
+
+    def tearDown(self):
+        os.close(self.read_fd)
+        os.close(self.write_fd)
+
+    def test_one_write_per_frame(self):
+        """All texts of a frame are written with one system call, the buffer is reused."""
+        writer = FrameWriter(self.write_fd, size=64)
+        for frame in range(10):
+            writer.write("\033[2;1H")
+            writer.write(f"frame {frame} ä")
+            writer.flush()
+            self.assertEqual(os.read(self.read_fd, 100).decode("utf-8"),
+                             f"\033[2;1Hframe {frame} ä")
+        writer.flush()  # nothing to write
+        self.assertEqual(writer.frames, 10)
+        self.assertEqual(writer.syscalls, 10)
+        self.assertEqual(writer.buffer_allocations, 1)
+
+    def test_buffer_grows_for_large_frames(self):
+        """A frame larger than the buffer is kept completely."""
+        writer = FrameWriter(self.write_fd, size=4)
+        writer.write("0123456789")
+        writer.flush()
+        self.assertEqual(os.read(self.read_fd, 100), b"0123456789")
+        self.assertEqual(writer.buffer_allocations, 2)
+
+    def test_partial_writes_on_non_blocking_fd(self):
+        """A frame larger than the pipe is completed, once the reader made room."""
+        os.set_blocking(self.write_fd, False)
+        frame = "x" * (1024 * 1024)
+        received = []
+
+        def read_all():
+            size = 0
+            while size < len(frame):
+                data = os.read(self.read_fd, 65536)
+                received.append(data)
+                size += len(data)
+        reader = threading.Thread(target=read_all)
+        reader.start()
+        writer = FrameWriter(self.write_fd)
+        writer.write(frame)
+        writer.flush()
+        reader.join()
+        self.assertEqual(b"".join(received), frame.encode("utf-8"))
+        self.assertGreater(writer.syscalls, 1)
+        self.assertEqual(writer.bytes_written, len(frame))
+
+    def test_drop_stale_frames(self):
+        """While the pipe is full, the writer is not ready, then the pending rest is completed."""
+        writer = FrameWriter(self.write_fd, drop_stale=True)
+        self.assertTrue(writer.ready())
+        frame = "y" * (1024 * 1024)
+        writer.write(frame)
+        writer.flush()  # does not wait for the reader
+        self.assertEqual(writer.frames, 0)  # partially written
+        self.assertFalse(writer.ready())
+        self.assertFalse(writer.ready())
+        self.assertEqual(writer.dropped_frames, 0)  # counted by the caller, see drop_frame
+        received = 0
+        while not writer.ready():
+            received += len(os.read(self.read_fd, 1024 * 1024))
+        while received < len(frame):
+            received += len(os.read(self.read_fd, 1024 * 1024))
+        self.assertEqual(received, len(frame))
+        self.assertEqual(writer.bytes_written, len(frame))
+        self.assertEqual(writer.frames, 1)
+        writer.close()
+
+    def test_backpressure_switches_to_non_blocking_mode(self):
+        """With backpressure a blocking fd does not block, close restores the mode."""
+        cfg = configparser.ConfigParser(default_section="main")
+        cfg.read_dict({"main": {"color": "0", "bold": "0", "backpressure": "1"}})
+        with os.fdopen(self.write_fd, "w", closefd=False) as out:
+            writer = create_frame_writer(cfg, out)
+        self.assertFalse(os.get_blocking(self.write_fd))
+        compositor = LineCompositor(cfg, writer)
+        writer.write("z" * (1024 * 1024))
+        writer.flush()  # a blocking write would wait for the reader forever
+        self.assertFalse(compositor.ready())
+        self.assertFalse(compositor.ready())
+        self.assertEqual(writer.dropped_frames, 2)
+        writer.close()
+        self.assertTrue(os.get_blocking(self.write_fd))
+
+
+if __name__ == '__main__':
+    unittest.main()
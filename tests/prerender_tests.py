@@ -0,0 +1,80 @@
+"""Unittests for prerender module."""
+import configparser
+import io
+import time
+import unittest
+from scrolltext.framecache import CycleFrames, FrameCache
+from scrolltext.linescroller import LineCompositor, _start_prerender, _stop_prerender
+from scrolltext.utils import CharacterScroller, TermSize
+
+
+def _create_cfg(direction="0", endless="1"):
+    cfg = configparser.ConfigParser(default_section="main")
+    cfg.read_dict({
+        "main": {"color": "1", "bold": "0", "colortable": "1", "endless": endless,
+                 "prerender": "1", "prerender_workers": "1"},
+        "scrolltext.text 1": {"direction": direction, "text": "Hello, world", "line": "0",
+                              "speed": "0"}
+    })
+    return cfg
+
+
+def _wait_for_rotations(prerender, timeout=10.):
+    deadline = time.monotonic() + timeout
+    while prerender._pending and time.monotonic() < deadline:  # pylint: disable=W0212
+        time.sleep(.01)
+        prerender.update()
+
+
+class PrerenderTests(unittest.TestCase):
+    """Test cases for building the frame cache on a process pool"""
+    def _render(self, cfg, frames, prerender):
+        """
+        :returns: The output of a compositor, which renders the scroller frame by frame, and
+                  the compositor
+        """
+        if not prerender:
+            cfg["main"]["prerender"] = "0"
+        out = io.StringIO()
+        compositor = LineCompositor(cfg, out, cache=FrameCache(1024 * 1024))
+        scroller = CharacterScroller(cfg, TermSize(5, 2), test=True)
+        _start_prerender(cfg, compositor)
+        try:
+            compositor.frames(scroller)
+            if compositor.prerender:
+                _wait_for_rotations(compositor.prerender)
+            for cnt, text in zip(range(frames), scroller):
+                compositor.render([(1, text)], cnt // 3, [compositor.frames(scroller)])
+        finally:
+            _stop_prerender(compositor)
+        return out.getvalue(), compositor
+
+    def test_prerendered_frames_equal_live_frames(self):
+        """The playback gives the same output with and without pre-rendered cycles."""
+        for direction, endless in [("0", "1"), ("1", "1"), ("0", "0")]:
+            live, _ = self._render(_create_cfg(direction, endless), 300, prerender=False)
+            prerendered, compositor = self._render(_create_cfg(direction, endless), 300,
+                                                   prerender=True)
+            self.assertEqual(prerendered, live)
+            self.assertEqual(compositor.prerender.rotations, compositor.colors.size)
+            self.assertEqual(compositor.cache.misses, 0)
+
+    def test_no_prerender_without_frame_cache(self):
+        """The pool only builds the cycles of the frame cache."""
+        cfg = _create_cfg()
+        compositor = LineCompositor(cfg, io.StringIO())
+        _start_prerender(cfg, compositor)
+        self.assertIsNone(compositor.prerender)
+
+    def test_pending_rotation_is_rendered_live(self):
+        """A frame, whose rotation is not built yet, is not part of the cycle."""
+        frames = CycleFrames("abc", 0, ["\033[1m", "\033[2m"])
+        frames.pending.add(1)
+        self.assertIsNone(frames.frame(0, 2, 1))
+        self.assertEqual(frames.frame(1, 2, 1), "\033[2mb\033[1mc")
+        frames.install(1, "\033[2ma\033[1mb\033[2mc")
+        self.assertEqual(frames.frame(0, 2, 1), "\033[2ma\033[1mb")
+
+
+if __name__ == '__main__':
+    unittest.main()
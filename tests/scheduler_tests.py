@@ -0,0 +1,64 @@
+"""Unittests for the frame scheduler."""
+import unittest
+from scrolltext.scheduler import FrameScheduler
+
+
+class FakeClock:
+    """A clock, which only advances when told so."""
+    def __init__(self):
+        self.now = 100.
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        """Advance the clock"""
+        self.now += seconds
+
+
+class FrameSchedulerTests(unittest.TestCase):
+    """Test cases for FrameScheduler class"""
+    def test_deadlines_do_not_drift(self):
+        """Rendering time within a frame does not shift the following deadlines."""
+        clock = FakeClock()
+        scheduler = FrameScheduler(10, clock)
+        clock.sleep(.03)  # time spent rendering
+        self.assertAlmostEqual(scheduler.remaining(), .07)
+        clock.sleep(.07)
+        scheduler.advance()
+        self.assertAlmostEqual(scheduler.deadline, 100.2)
+        self.assertEqual(scheduler.skipped_frames, 0)
+
+    def test_late_frames_are_skipped(self):
+        """When being late by several periods, the missed deadlines are skipped."""
+        clock = FakeClock()
+        scheduler = FrameScheduler(10, clock)
+        clock.sleep(.35)
+        self.assertEqual(scheduler.remaining(), 0.)
+        scheduler.advance()
+        self.assertEqual(scheduler.skipped_frames, 2)
+        self.assertEqual(scheduler.frames, 3)
+        self.assertAlmostEqual(scheduler.remaining(), .05)
+
+    def test_wait_polls_until_deadline(self):
+        """Input is collected until the deadline, then the next frame starts."""
+        clock = FakeClock()
+        scheduler = FrameScheduler(10, clock)
+        polled = []
+
+        def poll(timeout):
+            polled.append(round(timeout, 3))
+            if len(polled) == 1:
+                clock.sleep(.04)
+                return "x"
+            clock.sleep(timeout)
+            return None
+
+        self.assertEqual(scheduler.wait(poll), ["x"])
+        self.assertEqual(polled, [.1, .06])
+        self.assertEqual(scheduler.frames, 1)
+        self.assertAlmostEqual(scheduler.remaining(), .1)
+
+
+if __name__ == '__main__':
+    unittest.main()
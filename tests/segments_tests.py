@@ -0,0 +1,79 @@
+"""Unittests for segments module."""
+import unittest
+from scrolltext.segments import SegmentedText
+
+
+class SegmentedTextTests(unittest.TestCase):
+    """Test cases for SegmentedText class"""
+    def test_slices_span_segments(self):
+        """Slices are taken across segment boundaries, like from the joined text."""
+        text = SegmentedText(["Hello", ", ", "world"])
+        self.assertEqual(len(text), 12)
+        self.assertEqual(str(text), "Hello, world")
+        for start in range(13):
+            self.assertEqual(text[start:start + 4], "Hello, world"[start:start + 4])
+
+    def test_append_returns_index(self):
+        """Appended segments are numbered in order, line breaks become blanks."""
+        text = SegmentedText(["one"])
+        self.assertEqual(text.append("two\nlines"), 1)
+        self.assertEqual(str(text), "onetwo lines")
+
+    def test_append_at_a_column(self):
+        """A segment may start right of the text end, the columns in between are blank."""
+        text = SegmentedText(["ab"])
+        self.assertEqual(text.append("cd", 5), 1)
+        self.assertEqual(text.append("ef", 0), 2)
+        self.assertEqual(text[1:6], "b   c")
+        self.assertEqual(str(text), "ab   cdef")
+        self.assertEqual(text.span(1), (5, 7))
+
+    def test_copy_is_changed_independently(self):
+        """A copy shares the segments, but not the columns."""
+        text = SegmentedText(["ab", "cd"])
+        copy = text.copy()
+        copy.replace(0, "xyz")
+        copy.append("ef")
+        self.assertEqual(str(text), "abcd")
+        self.assertEqual(str(copy), "xyzcdef")
+
+    def test_replace_ahead_of_the_window(self):
+        """A segment right of the window moves the following text."""
+        text = SegmentedText(["ab", "cd", "ef"])
+        self.assertEqual(text[0:2], "ab")
+        text.replace(1, "CDCD")
+        self.assertEqual(text[0:8], "abCDCDef")
+
+    def test_replace_left_of_the_window(self):
+        """A segment left of the window moves the preceding text, the window keeps its text."""
+        text = SegmentedText(["ab", "cd", "ef"])
+        self.assertEqual(text[4:6], "ef")
+        text.replace(0, "")
+        self.assertEqual(text[4:6], "ef")
+        self.assertEqual(text[0:6], "  cdef")
+        self.assertEqual(len(text), 6)
+
+    def test_replace_with_fixed_columns(self):
+        """With fixed columns the following text moves, the caller moves the window."""
+        text = SegmentedText(["ab", "cd", "ef"], fixed=True)
+        self.assertEqual(text.replace(0, "", window=4), -2)
+        self.assertEqual(text[0:4], "cdef")
+        self.assertEqual(text.replace(2, "EFG", window=0), 0)
+        self.assertEqual(str(text), "cdEFG")
+
+    def test_release_drops_scrolled_out_segments(self):
+        """Only segments behind the lookbehind are dropped, the columns stay absolute."""
+        text = SegmentedText(release=True, lookbehind=2)
+        for segment in ["aaa", "bbb", "ccc", "ddd"]:
+            text.append(segment)
+        self.assertEqual(text[9:12], "ddd")
+        self.assertEqual(len(text), 12)
+        self.assertEqual(str(text), "cccddd")
+        with self.assertRaises(IndexError):
+            text.replace(0, "x")
+        self.assertEqual(text.append("eee"), 4)
+        self.assertEqual(text[10:15], "ddeee")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Unittests for the frame server."""
+import asyncio
+import configparser
+import os
+import tempfile
+import unittest
+from scrolltext.server import FrameBroadcaster, FrameClient, produce_frames
+from scrolltext.utils import CLEAR, HOME, TermSize
+
+
+class BlockedWriter:
+    """A client stream, which does not accept data until released."""
+    def __init__(self):
+        self.data = []
+        self.released = asyncio.Event()
+
+    def write(self, data):
+        """Stream interface"""
+        self.data.append(data)
+
+    async def drain(self):
+        """Stream interface"""
+        await self.released.wait()
+
+
+class FrameServerTests(unittest.TestCase):
+    """Test cases for the frame server"""
+    def test_slow_client_drops_to_latest(self):
+        """While a client is blocked, only the latest frame is kept for it."""
+        async def run():
+            writer = BlockedWriter()
+            client = FrameClient(writer)
+            task = asyncio.create_task(client.run())
+            client.send(b"1")
+            await asyncio.sleep(0)
+            for frame in [b"2", b"3", b"4"]:
+                client.send(frame)
+            writer.released.set()
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            task.cancel()
+            return writer.data, client.dropped_frames
+        data, dropped = asyncio.run(run())
+        self.assertEqual(data, [f"{CLEAR}{HOME}1".encode("utf-8"), b"4"])
+        self.assertEqual(dropped, 2)
+
+    def test_clients_receive_frames(self):
+        """Frames are broadcast to every client connected via a Unix socket."""
+        cfg = configparser.ConfigParser(default_section="main")
+        cfg.read_dict({
+            "main": {"color": "0", "bold": "0", "endless": "1", "fps": "100"},
+            "scrolltext.text 1": {"direction": "0", "text": "Hello", "line": "0",
+                                  "speed": "0"}
+        })
+
+        async def run(path):
+            broadcaster = FrameBroadcaster()
+            listener = await asyncio.start_unix_server(broadcaster.handle_client, path=path)
+            producer = asyncio.create_task(produce_frames(cfg, broadcaster, TermSize(10, 3)))
+            connections = [await asyncio.open_unix_connection(path) for _ in range(3)]
+            received = [await reader.readexactly(30) for reader, _ in connections]
+            producer.cancel()
+            for _, writer in connections:
+                writer.close()
+                await writer.wait_closed()
+            while broadcaster.clients:  # the server notices the closed connections
+                await asyncio.sleep(.01)
+            listener.close()
+            await listener.wait_closed()
+            return received
+        with tempfile.TemporaryDirectory() as directory:
+            received = asyncio.run(run(os.path.join(directory, "socket")))
+        for data in received:
+            self.assertTrue(data.startswith(f"{CLEAR}{HOME}\033[1;1H".encode("utf-8")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""Unittests for lazy text sources."""
+import configparser
+import os
+import tempfile
+import unittest
+from unittest import mock
+from scrolltext import sources
+from scrolltext.sources import MappedText, StreamText, create_stream_text, read_chunks
+from scrolltext.utils import CharacterScroller, TermSize
+
+
+class StreamTextTests(unittest.TestCase):
+    """Test cases for StreamText class"""
+    def test_slices_across_chunks(self):
+        """Slices span several chunks, which are read on demand."""
+        text = StreamText(iter(["Hel", "lo, ", "world"]))
+        self.assertEqual(len(text), 0)
+        self.assertEqual(text[2:6], "llo,")
+        self.assertEqual(len(text), 7)
+        self.assertFalse(text.exhausted)
+        self.assertEqual(text[6:20], " world")
+        self.assertTrue(text.exhausted)
+
+    def test_newlines_become_blanks(self):
+        """Lines of a stream are separated by a blank."""
+        text = StreamText(iter(["one\n", "two\r\n"]))
+        self.assertEqual(text[0:7], "one two")
+
+    def test_no_data_pads_with_blanks(self):
+        """When no data is available, the slice is padded with blanks, which are kept."""
+        text = StreamText(iter(["ab", "", "cd"]))
+        self.assertEqual(text[0:4], "ab  ")
+        self.assertEqual(text[4:6], "cd")
+
+    def test_released_text_is_trimmed(self):
+        """Only a bounded part of the text before the last slice is kept."""
+        text = StreamText(iter(["x" * 100] * 10), lookbehind=10)
+        for start in range(0, 990):
+            text[start:start + 10]  # pylint: disable=pointless-statement
+        self.assertLessEqual(len(text._buffer), 10 + 10 + 100)  # pylint: disable=W0212
+
+    def test_read_chunks_decodes_utf8(self):
+        """Chunks are decoded incrementally, even when a character is split."""
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, "äöü".encode("utf-8"))
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as fileobj:
+            self.assertEqual("".join(read_chunks(fileobj, chunk_size=1)), "äöü")
+
+    def test_stdin_without_terminal(self):
+        """Without a terminal for the keypresses, stdin is not opened as source."""
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, write_fd)
+        with os.fdopen(read_fd, "r") as stdin:
+            fds = len(os.listdir("/proc/self/fd"))
+            with mock.patch.object(sources.sys, "stdin", stdin), \
+                    mock.patch.object(sources.os, "open", side_effect=OSError(6, "No tty")):
+                with self.assertRaises(OSError):
+                    sources.open_source("-")
+            self.assertEqual(len(os.listdir("/proc/self/fd")), fds)
+
+    def test_character_scroller_with_source(self):
+        """CharacterScroller scrolls a stream source, until it is exhausted."""
+        cfg = configparser.ConfigParser()
+        cfg.read_dict({
+            "main": {"endless": "1"},
+            "scrolltext.text 1": {"direction": "1", "text": "unused", "line": "0",
+                                  "speed": "0"}
+        })
+        source = StreamText(iter(["Hel", "lo"]))
+        scroller = CharacterScroller(cfg, TermSize(2, 0), test=True, blanks=1, source=source)
+        self.assertEqual(list(scroller), [" H", "He", "el", "ll", "lo", "o ", " "])
+
+
+class MappedTextTests(unittest.TestCase):
+    """Test cases for MappedText class"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.path = os.path.join(self.directory.name, "archive.log")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _create(self, data):
+        with open(self.path, "wb") as fileobj:
+            fileobj.write(data)
+        text = create_stream_text(self.path)
+        self.addCleanup(text.close)
+        return text
+
+    def test_regular_files_are_mapped(self):
+        """A regular file is memory mapped and indexed on demand."""
+        text = self._create(b"Hello, world")
+        self.assertIsInstance(text, MappedText)
+        self.assertEqual(len(text), 0)
+        self.assertEqual(text[7:20], "world")
+        self.assertEqual(len(text), 12)
+        self.assertTrue(text.exhausted)
+
+    def test_slices_across_index_steps(self):
+        """Slices at any position equal the decoded text, also with multi-byte characters."""
+        line = "ab\u00e4\u65e5\U0001F600 c\r\n"
+        expected = (line * 2000).replace("\r", "").replace("\n", " ")
+        text = self._create((line * 2000).encode("utf-8"))
+        for start in range(0, len(expected) + 10, 97):
+            self.assertEqual(text[start:start + 40], expected[start:start + 40])
+        self.assertEqual(len(text), len(expected))
+        self.assertGreater(len(text._offsets), 2)  # pylint: disable=W0212
+
+    def test_invalid_bytes_are_replaced(self):
+        """Every invalid byte becomes one replacement character."""
+        text = self._create(b"a\xff\xfeb\xe2\x82")
+        self.assertEqual(text[0:10], "a\ufffd\ufffdb\ufffd\ufffd")
+
+    def test_empty_file(self):
+        """An empty file can not be mapped, it is an empty text."""
+        text = self._create(b"")
+        self.assertEqual(text[0:10], "")
+        self.assertTrue(text.exhausted)
+
+    def test_index_is_sparse(self):
+        """The index holds one byte offset per INDEX_STEP characters."""
+        text = self._create(b"x" * (10 * sources.INDEX_STEP + 5))
+        self.assertEqual(text[10 * sources.INDEX_STEP:10 * sources.INDEX_STEP + 10], "xxxxx")
+        self.assertEqual(len(text._offsets), 11)  # pylint: disable=W0212
+
+
+if __name__ == '__main__':
+    unittest.main()
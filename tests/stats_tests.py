@@ -0,0 +1,72 @@
+"""Unittests for the frame timing instrumentation."""
+import configparser
+import io
+import os
+import tempfile
+import unittest
+from scrolltext.linescroller import LineCompositor
+from scrolltext.stats import FrameStats, NullStats, create_frame_stats, percentile
+
+
+def _create_config(verbose):
+    cfg = configparser.ConfigParser(default_section="main")
+    cfg.read_dict({"main": {"verbose": verbose, "color": "0", "bold": "0"}})
+    return cfg
+
+
+class FrameStatsTests(unittest.TestCase):
+    """Test cases for FrameStats class"""
+    def test_disabled_without_verbose(self):
+        """Instrumentation is opt-in."""
+        self.assertIsInstance(create_frame_stats(_create_config("0"), .1), NullStats)
+        self.assertIsInstance(create_frame_stats(_create_config("1"), .1), FrameStats)
+
+    def test_percentile(self):
+        """Nearest-rank percentiles."""
+        samples = list(range(100))
+        self.assertEqual(percentile(samples, 50), 50)
+        self.assertEqual(percentile(samples, 99), 99)
+        self.assertEqual(percentile([], 50), 0.)
+
+    def test_stages_and_intervals(self):
+        """Every stage and every frame interval is recorded."""
+        stats = FrameStats(.1)
+        stats.next_frame()
+        for _ in range(3):
+            stats.mark("next")
+            stats.mark("write")
+            stats.next_frame()
+        self.assertEqual(stats.frames, 3)
+        self.assertEqual(len(stats.histograms["interval"]), 3)
+        self.assertEqual(len(stats.histograms["next"]), 3)
+        self.assertIn("write", stats.summary())
+
+    def test_positions(self):
+        """Repeated positions are duplicates, skipped positions are dropped."""
+        stats = FrameStats(.1)
+        for pos in [0, 1, 1, 4, 5]:
+            stats.position("scroller", pos)
+        self.assertEqual(stats.duplicate_positions, 1)
+        self.assertEqual(stats.dropped_positions, 2)
+
+    def test_stats_file(self):
+        """The summary is written to the stats file."""
+        with tempfile.TemporaryDirectory() as directory:
+            stats_file = os.path.join(directory, "stats")
+            stats = FrameStats(.1, stats_file, interval=0.)
+            stats.next_frame()
+            stats.next_frame()
+            with open(stats_file, encoding="utf-8") as summary:
+                self.assertIn("frames: 1", summary.read())
+
+    def test_compositor_stages(self):
+        """LineCompositor times the colors and write stages."""
+        stats = FrameStats(.1)
+        compositor = LineCompositor(_create_config("1"), io.StringIO(), stats=stats)
+        compositor.render([(1, "text")], 0)
+        self.assertEqual(len(stats.histograms["colors"]), 1)
+        self.assertEqual(len(stats.histograms["write"]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
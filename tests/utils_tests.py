@@ -1,7 +1,15 @@
 """Unittests for utils class."""
+import asyncio
 import configparser
+from contextlib import redirect_stderr
+import io
+import os
+import signal
 import unittest
-from scrolltext.utils import CharacterScroller, TermSize, parse_int
+from unittest import mock
+from scrolltext.utils import CharacterScroller, TermSize, WatchedTermSize, next_texts
+from scrolltext.utils import reload_config
+from scrolltext.utils import parse_int
 
 
 class CharacterScrollTests(unittest.TestCase):
@@ -133,7 +141,8 @@ class CharacterScrollTests(unittest.TestCase):
         self.argv["blanks"] = 0
         scroll_text = "مرحباً فيلت"
         self.cfg["scrolltext.text 1"]["text"] = scroll_text
-        expected = list(scroll_text)
+        # the combining fathatan takes no column, it stays with its base character
+        expected = ["م", "ر", "ح", "ب", "اً", " ", "ف", "ي", "ل", "ت"]
         expected.reverse()
         cnt = 0
         for text in CharacterScroller(self.cfg, term_size, **self.argv):
@@ -142,7 +151,194 @@ class CharacterScrollTests(unittest.TestCase):
             except IndexError:
                 pass
             cnt += 1
-        self.assertTrue(((cnt + len(scroll_text)) // 2) == len(scroll_text))
+        self.assertTrue(((cnt + len(expected)) // 2) == len(expected))
+
+    def test_append_text_while_scrolling(self):
+        """Appended segments are scrolled in after the text, the window stays continuous."""
+        self.cfg["scrolltext.text 1"]["text"] = "Hello"
+        self.cfg["scrolltext.text 1"]["direction"] = "0"
+        scroller = CharacterScroller(self.cfg, TermSize(4, 0), test=True, min_scroll_line=0,
+                                     blanks=0)
+        self.assertEqual([scroller.next() for _ in range(2)], ["Hell", "ello"])
+        self.assertEqual(scroller.append_text(", world"), 1)
+        self.assertEqual([scroller.next() for _ in range(3)], ["llo,", "lo, ", "o, w"])
+        scroller.replace_text(1, ", there")
+        self.assertEqual(scroller.next(), ", th")
+
+    def test_append_text_in_the_trailing_blanks(self):
+        """A segment appended after the text scrolled out enters at the edge of the window."""
+        self.cfg["scrolltext.text 1"]["text"] = "Hi"
+        self.cfg["scrolltext.text 1"]["direction"] = "0"
+        scroller = CharacterScroller(self.cfg, TermSize(4, 0), test=True, min_scroll_line=0)
+        self.assertEqual([scroller.next() for _ in range(9)][-1], "  ")
+        scroller.append_text("ABCDEFGH")
+        self.assertEqual([scroller.next() for _ in range(4)], ["   A", "  AB", " ABC", "ABCD"])
+
+    def test_async_iteration(self):
+        """"Test async for gives the same texts as the synchronous iteration."""
+        scroll_text = "Hello, world"
+        self.cfg["scrolltext.text 1"]["text"] = scroll_text
+        self.cfg["scrolltext.text 1"]["direction"] = "0"
+        self.cfg["main"]["fps"] = "240"
+        self.argv["blanks"] = 1
+
+        async def collect(scroller):
+            return [text async for text in scroller]
+
+        texts = asyncio.run(collect(CharacterScroller(self.cfg, TermSize(2, 0), **self.argv)))
+        self.assertEqual(texts, list(CharacterScroller(self.cfg, TermSize(2, 0), **self.argv)))
+        self.assertEqual(len(texts), len(scroll_text) + 2)
+
+    def test_finished_scroller_is_cleared(self):
+        """The last text of a finished scroller is blank, then it is removed."""
+        self.cfg["scrolltext.text 1"]["text"] = "Hi"
+        self.cfg["scrolltext.text 1"]["direction"] = "0"
+        scroller = CharacterScroller(self.cfg, TermSize(2, 0), test=True, min_scroll_line=0,
+                                     blanks=0)
+        active = [scroller]
+        self.assertEqual(next_texts(active), [(scroller, "Hi")])
+        self.assertEqual(next_texts(active), [(scroller, "i")])
+        self.assertEqual(next_texts(active), [(scroller, "  ")])
+        self.assertEqual(active, [])
+
+
+class EndlessCharacterScrollTests(unittest.TestCase):
+    """Test cases for CharacterScroller class in endless mode"""
+    argv = {"test": True, "min_scroll_line": 0}
+
+    @staticmethod
+    def _create_cfg(direction):
+        cfg = configparser.ConfigParser()
+        cfg.read_dict({
+            "main": {"action": "linescroller", "endless": "1"},
+            "scrolltext.text 1": {"direction": direction, "text": "Hello", "line": "0",
+                                  "speed": "0"}
+        })
+        return cfg
+
+    def test_left_to_right_wraps_seamlessly(self):
+        """The text repeats after a gap, without showing a blank window again."""
+        scroller = CharacterScroller(self._create_cfg("0"), TermSize(7, 0), **self.argv)
+        texts = [scroller.next() for _ in range(22)]
+        self.assertEqual(texts[:3], ["       ", "      H", "     He"])
+        self.assertEqual(texts[7:12], ["Hello  ", "ello   ", "llo    ", "lo    H",
+                                       "o    He"])
+        self.assertEqual(texts[12:21], texts[3:12])
+        self.assertLess(scroller.pos, 2 * 7 + 5)
+
+    def test_right_to_left_wraps_seamlessly(self):
+        """Right-to-Left text repeats after a gap, without showing a blank window again."""
+        scroller = CharacterScroller(self._create_cfg("1"), TermSize(7, 0), **self.argv)
+        texts = [scroller.next() for _ in range(22)]
+        self.assertEqual(texts[:3], ["       ", "o      ", "lo     "])
+        self.assertEqual(texts[9:12], ["    Hel", "o    He", "lo    H"])
+        self.assertEqual(texts[12:21], texts[3:12])
+        self.assertGreater(scroller.pos, 0)
+
+    def test_resize_keeps_position(self):
+        """A resize only changes the virtual padding, the text keeps its position."""
+        term_size = TermSize(7, 0)
+        scroller = CharacterScroller(self._create_cfg("0"), term_size, **self.argv)
+        for _ in range(7):
+            scroller.next()
+        term_size.set_size(3, 0)
+        self.assertEqual(scroller.next(), "Hel")
+
+    def test_apply_config_keeps_position(self):
+        """A reloaded text continues at the current position."""
+        scroller = CharacterScroller(self._create_cfg("0"), TermSize(7, 0), **self.argv)
+        for _ in range(8):
+            scroller.next()
+        cfg = self._create_cfg("0")
+        cfg["scrolltext.text 1"]["text"] = "Hello, world"
+        scroller.apply_config(cfg)
+        self.assertEqual([scroller.next() for _ in range(2)], ["ello, w", "llo, wo"])
+
+    def test_apply_config_reverses_direction_in_place(self):
+        """After a change of direction the visible text is the same and scrolls back."""
+        scroller = CharacterScroller(self._create_cfg("0"), TermSize(7, 0), **self.argv)
+        for _ in range(8):
+            scroller.next()
+        scroller.apply_config(self._create_cfg("1"))
+        self.assertEqual([scroller.next() for _ in range(2)], ["ello   ", "Hello  "])
+
+    def test_apply_config_with_shorter_text(self):
+        """A shorter text does not leave the position beyond the end of the text."""
+        cfg = self._create_cfg("1")
+        cfg["scrolltext.text 1"]["text"] = "Hello, world"
+        scroller = CharacterScroller(cfg, TermSize(7, 0), **self.argv)
+        scroller.next()
+        scroller.apply_config(self._create_cfg("1"))
+        self.assertLessEqual(scroller.pos, 2 * 7 + 5)
+        self.assertEqual([scroller.next() for _ in range(2)], ["llo    ", "ello   "])
+
+    def test_replace_text_left_of_the_window(self):
+        """The window keeps its text, every following cycle shows the whole new segment."""
+        for direction, expected in [("0", ["B   ", "    ", "   a", "  aa", " aaa", "aaaa"]),
+                                    ("1", ["aBB ", "aaBB", "aaaB", "aaaa", "aaaa", "aaaa"])]:
+            cfg = self._create_cfg(direction)
+            cfg["scrolltext.text 1"]["text"] = "AAAA"
+            scroller = CharacterScroller(cfg, TermSize(4, 0), **self.argv)
+            scroller.append_text("BB")
+            texts = [scroller.next() for _ in range(9 if direction == "0" else 3)]
+            self.assertEqual(texts[-1], "BB  ")
+            scroller.replace_text(0, "aaaaaaaa")
+            texts = [scroller.next() for _ in range(2 * 14)]
+            self.assertEqual(texts[:6], expected)
+            self.assertEqual(texts[14:], texts[:14])
+            self.assertEqual(texts[:14].count("aaaa"), 5)
+
+    def test_append_text_while_the_window_spans_the_gap(self):
+        """The visible cycles keep their text, the segment is scrolled in at the edge."""
+        cfg = self._create_cfg("0")
+        cfg["scrolltext.text 1"]["text"] = "aeca"
+        scroller = CharacterScroller(cfg, TermSize(11, 0), **self.argv)
+        self.assertEqual([scroller.next() for _ in range(23)][-1], "a    aeca  ")
+        scroller.append_text("ZY")
+        texts = [scroller.next() for _ in range(20)]
+        self.assertEqual(texts[:2], ["    aeca   ", "   aeca    "])
+        self.assertEqual(texts[6:8], ["ca    aecaZ", "a    aecaZY"])
+        self.assertEqual(texts[18:], texts[8:10])
+
+    def test_append_text_right_to_left(self):
+        """Right-to-left the segment enters at the left edge, with the next cycle."""
+        scroller = CharacterScroller(self._create_cfg("1"), TermSize(7, 0), **self.argv)
+        self.assertEqual([scroller.next() for _ in range(4)][-1], "llo    ")
+        scroller.append_text("AB")
+        texts = [scroller.next() for _ in range(10)]
+        self.assertEqual(texts[:3], ["ello   ", "Hello  ", " Hello "])
+        self.assertEqual(texts[6:], ["B    He", "AB    H", "oAB    ", "loAB   "])
+
+    def test_apply_config_skips_whole_cycles_right_to_left(self):
+        """A position, which is whole cycles beyond the end of the text, moves to its end."""
+        cfg = self._create_cfg("1")
+        cfg["scrolltext.text 1"]["text"] = "Hello, world, hello"
+        scroller = CharacterScroller(cfg, TermSize(7, 0), **self.argv)
+        for _ in range(5):
+            scroller.next()
+        scroller.apply_config(self._create_cfg("1"))  # one cycle of "Hello" beyond the end
+        self.assertEqual(scroller.pos, 2 * 7 + 5)
+        self.assertEqual([scroller.next() for _ in range(2)], ["       ", "o      "])
+
+
+class ReloadConfigTests(unittest.TestCase):
+    """Test cases for reload_config"""
+    def test_env_overrides_are_applied_quietly(self):
+        """Environment variables override a reloaded config without reporting it again."""
+        cfg = configparser.ConfigParser()
+        cfg.read_dict({
+            "main": {"action": "linescroller", "endless": "0"},
+            "scrolltext.text 1": {"direction": "0", "text": "Hello", "line": "0", "speed": "0"}
+        })
+        scroller = CharacterScroller(cfg, TermSize(7, 0), test=True)
+        watcher = mock.Mock()
+        watcher.poll.return_value = cfg
+        stderr = io.StringIO()
+        with mock.patch.dict(os.environ, {"SCROLL_TEXT": "World", "SCROLL_SPEED": "3"}), \
+                mock.patch("scrolltext.utils.EARLY_VERBOSE", "1"), redirect_stderr(stderr):
+            self.assertTrue(reload_config(watcher, [scroller]))
+        self.assertEqual(stderr.getvalue(), "")
+        self.assertEqual(str(scroller.scroll_text), "World")
 
 
 class TermSizeTests(unittest.TestCase):
@@ -168,6 +364,38 @@ class TermSizeTests(unittest.TestCase):
         self.assertFalse(term_size.is_resized())  # is_resize works as a toggle option
 
 
+@unittest.skipUnless(hasattr(signal, "SIGWINCH"), "needs SIGWINCH")
+class WatchedTermSizeTests(unittest.TestCase):
+    """Tests cases for WatchedTermSize"""
+    def setUp(self):
+        self.environ = {name: os.environ.get(name) for name in ("COLUMNS", "LINES")}
+        os.environ.update({"COLUMNS": "40", "LINES": "10"})
+
+    def tearDown(self):
+        for name, value in self.environ.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    def test_size_is_only_queried_after_sigwinch(self):
+        """ Column changes are detected, but only after the terminal signalled them.
+        """
+        term_size = WatchedTermSize()
+        term_size.start()
+        try:
+            self.assertEqual((term_size.get_cols(), term_size.get_rows()), (40, 10))
+            os.environ["COLUMNS"] = "50"
+            self.assertFalse(term_size.update())
+            os.kill(os.getpid(), signal.SIGWINCH)
+            self.assertTrue(term_size.update())
+            self.assertEqual(term_size.get_cols(), 50)
+            self.assertFalse(term_size.update())
+        finally:
+            term_size.stop()
+        self.assertEqual(signal.getsignal(signal.SIGWINCH), signal.SIG_DFL)
+
+
 class ParseIntTests(unittest.TestCase):  # x  xx maybe remove
     """Test cases for parse int utility"""
     def test_parse_none_returns_0(self):